@@ -23,6 +23,7 @@ import time
 import logging
 from typing import Dict, List, Optional, Callable, TypeVar
 from .data_types import GitHubIssue, GitHubIssueListItem, GitHubComment
+from .utils import loads_json
 
 T = TypeVar('T')
 
@@ -252,12 +253,16 @@ def fetch_issue(
     env = get_github_env()
 
     def _fetch():
-        result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+        # Raw bytes go straight to the JSON parser (orjson when installed);
+        # issues with long comment threads make this the bulk of a fetch
+        result = subprocess.run(cmd, capture_output=True, env=env)
         if result.returncode == 0:
-            issue_data = json.loads(result.stdout)
-            return GitHubIssue(**issue_data)
+            issue_data = loads_json(result.stdout)
+            return GitHubIssue.model_validate(issue_data)
         else:
-            raise RuntimeError(f"Failed to fetch issue: {result.stderr}")
+            raise RuntimeError(
+                f"Failed to fetch issue: {result.stderr.decode(errors='replace')}"
+            )
 
     try:
         return github_operation_with_retry(
@@ -10,7 +10,8 @@ import json
 import os
 import sys
 import logging
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
 from .data_types import ASWAppStateData, ASWIOStateData
 
 
@@ -206,6 +207,35 @@ class ASWIOState:
         # Start with minimal state
         self.data: Dict[str, Any] = {"asw_id": self.asw_id}
         self.logger = logging.getLogger(__name__)
+        # Transaction bookkeeping: saves are deferred while suspended
+        self._suspend_write = False
+        self._dirty = False
+        self._pending_step: Optional[str] = None
+
+    @contextmanager
+    def transaction(self) -> Iterator["ASWIOState"]:
+        """Batch state changes so they are persisted with a single write.
+
+        Calls to save() inside the block are deferred; if any were made,
+        the state file is written once when the block exits cleanly.
+        Nested transactions join the outermost one.
+        """
+        if self._suspend_write:
+            yield self
+            return
+
+        self._suspend_write = True
+        try:
+            yield self
+        except BaseException:
+            self._suspend_write = False
+            self._dirty = False
+            self._pending_step = None
+            raise
+
+        self._suspend_write = False
+        if self._dirty:
+            self._flush()
 
     def update(self, **kwargs):
         """Update state with new key-value pairs."""
@@ -252,7 +282,25 @@ class ASWIOState:
         return os.path.join(project_root, "agents", self.asw_id, self.STATE_FILENAME)
 
     def save(self, workflow_step: Optional[str] = None) -> None:
-        """Save state to file in agents/{asw_id}/asw_io_state.json."""
+        """Save state to file in agents/{asw_id}/asw_io_state.json.
+
+        Inside transaction() the write is deferred until the block exits.
+        """
+        if self._suspend_write:
+            self._dirty = True
+            if workflow_step:
+                self._pending_step = workflow_step
+            return
+
+        self._pending_step = workflow_step
+        self._flush()
+
+    def _flush(self) -> None:
+        """Write the current state to disk."""
+        workflow_step = self._pending_step
+        self._dirty = False
+        self._pending_step = None
+
         state_path = self.get_state_path()
         os.makedirs(os.path.dirname(state_path), exist_ok=True)
 
@@ -12,9 +12,30 @@ import uuid
 from datetime import datetime
 from typing import Any, TypeVar, Type, Union, Dict, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 T = TypeVar('T')
 
 
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed.
+
+    Falls back to the stdlib for input orjson rejects but json accepts
+    (NaN, integers wider than 64 bits). Raises json.JSONDecodeError, which
+    orjson.JSONDecodeError subclasses.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def make_asw_app_id() -> str:
     """Generate a short 8-character UUID for app workflow tracking.
 
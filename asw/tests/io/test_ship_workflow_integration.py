@@ -168,31 +168,32 @@ def test_full_ship_state_simulation():
     """Simulate a complete ship workflow state update."""
     state = ASWIOState("fullship")
 
-    # Initial state from plan workflow
-    state.update(
-        issue_number="200",
-        branch_name="feature-issue-200-adw-fullship",
-        spec_file="specs/plan.md",
-        issue_class="/feature",
-        worktree_path="/tmp/trees/fullship",
-        environment=8000,
-        terraform_dir=3000
-    )
-
-    # Track workflow phases
-    state.append_ipe_id("ipe_plan_iso")
-    state.append_ipe_id("ipe_build_iso")
-    state.append_ipe_id("ipe_test_iso")
-    state.append_ipe_id("ipe_review_iso")
-    state.append_ipe_id("ipe_document_iso")
-
-    # Ship workflow completes
-    state.update(
-        deployed_at="2024-11-20T15:30:00Z",
-        merge_commit="abc123def456789",
-        pr_number="201"
-    )
-    state.append_ipe_id("ipe_ship_iso")
+    with state.transaction():
+        # Initial state from plan workflow
+        state.update(
+            issue_number="200",
+            branch_name="feature-issue-200-adw-fullship",
+            spec_file="specs/plan.md",
+            issue_class="/feature",
+            worktree_path="/tmp/trees/fullship",
+            environment=8000,
+            terraform_dir=3000
+        )
+
+        # Track workflow phases
+        state.append_ipe_id("ipe_plan_iso")
+        state.append_ipe_id("ipe_build_iso")
+        state.append_ipe_id("ipe_test_iso")
+        state.append_ipe_id("ipe_review_iso")
+        state.append_ipe_id("ipe_document_iso")
+
+        # Ship workflow completes
+        state.update(
+            deployed_at="2024-11-20T15:30:00Z",
+            merge_commit="abc123def456789",
+            pr_number="201"
+        )
+        state.append_ipe_id("ipe_ship_iso")
 
     # Verify complete state
     assert state.get("deployed_at") == "2024-11-20T15:30:00Z"
@@ -202,5 +203,50 @@ def test_full_ship_state_simulation():
     assert len(state.data["all_ipes"]) == 6
 
 
+def test_transaction_batches_saves(mock_agents_dir, monkeypatch):
+    """Test that saves inside a transaction are written once on exit."""
+    temp_dir, agents_dir = mock_agents_dir
+    state_path = agents_dir / "txn1234" / ASWIOState.STATE_FILENAME
+    state = ASWIOState("txn1234")
+    monkeypatch.setattr(state, "get_state_path", lambda: str(state_path))
+
+    writes = []
+    original_flush = state._flush
+
+    def counting_flush():
+        writes.append(1)
+        original_flush()
+
+    monkeypatch.setattr(state, "_flush", counting_flush)
+
+    with state.transaction():
+        state.update(issue_number="300", branch_name="feature-issue-300")
+        state.save("asw_io_plan_iso")
+        state.append_asw_id("asw_io_plan_iso")
+        state.save("asw_io_build_iso")
+        assert not state_path.exists()
+
+    assert len(writes) == 1
+    saved = json.loads(state_path.read_text())
+    assert saved["issue_number"] == "300"
+    assert saved["all_asw_ids"] == ["asw_io_plan_iso"]
+
+
+def test_transaction_discards_pending_save_on_error(mock_agents_dir, monkeypatch):
+    """Test that a failed transaction does not persist partial state."""
+    temp_dir, agents_dir = mock_agents_dir
+    state_path = agents_dir / "txn5678" / ASWIOState.STATE_FILENAME
+    state = ASWIOState("txn5678")
+    monkeypatch.setattr(state, "get_state_path", lambda: str(state_path))
+
+    with pytest.raises(RuntimeError):
+        with state.transaction():
+            state.update(issue_number="301")
+            state.save()
+            raise RuntimeError("boom")
+
+    assert not state_path.exists()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -66,14 +66,13 @@ def test_workflow_support():
         ("ipe_sdlc_iso", None, True),
     ]
     
-    for workflow, ipe_id, should_work in test_cases:
-        if workflow in DEPENDENT_WORKFLOWS and not ipe_id:
-            status = "❌ BLOCKED (requires IPE ID)"
-        else:
-            status = "✅ Can trigger"
-        
-        id_info = f" (with ID: {ipe_id})" if ipe_id else ""
-        print(f"  {workflow:20}{id_info:20} {status}")
+    dependent = frozenset(DEPENDENT_WORKFLOWS)
+    rows = [
+        f"  {workflow:20}{(f' (with ID: {ipe_id})' if ipe_id else ''):20} "
+        f"{'❌ BLOCKED (requires IPE ID)' if workflow in dependent and not ipe_id else '✅ Can trigger'}"
+        for workflow, ipe_id, _should_work in test_cases
+    ]
+    print("\n".join(rows))
 
 
 if __name__ == "__main__":
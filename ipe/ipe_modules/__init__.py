@@ -30,6 +30,7 @@ from .ipe_workflow_ops import (
     create_commit,
     format_issue_message,
     extract_ipe_info,
+    extract_ipe_info_batch,
     AGENT_PLANNER,
     AGENT_BUILDER,
     AGENT_VALIDATOR,
@@ -51,6 +52,10 @@ from .terraform_ops import (
     run_terraform_validate,
     run_terraform_plan,
     run_terraform_fmt,
+    run_all_terraform_tests,
+    run_terraform_pipeline,
+    validate_many,
+    fmt_check_many,
     apply_terraform_changes,
     destroy_terraform,
 )
@@ -79,6 +84,7 @@ __all__ = [
     'create_commit',
     'format_issue_message',
     'extract_ipe_info',
+    'extract_ipe_info_batch',
     'AGENT_PLANNER',
     'AGENT_BUILDER',
     'AGENT_VALIDATOR',
@@ -95,6 +101,10 @@ __all__ = [
     'run_terraform_validate',
     'run_terraform_plan',
     'run_terraform_fmt',
+    'run_all_terraform_tests',
+    'run_terraform_pipeline',
+    'validate_many',
+    'fmt_check_many',
     'apply_terraform_changes',
     'destroy_terraform',
 ]
@@ -25,6 +25,18 @@ load_dotenv()
 # Get Claude Code CLI path from environment
 CLAUDE_PATH = os.getenv("CLAUDE_CODE_PATH", "claude")
 
+# Set once `claude --version` has succeeded; failures are re-checked
+_CLAUDE_INSTALLED = False
+
+# Project root (parent of the ipe directory); __file__ never changes
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+# ipe_id -> (state file mtime_ns, model_set), so the many template calls of
+# one workflow don't each reload and validate the whole state file
+_MODEL_SET_CACHE: Dict[str, Tuple[int, ModelSet]] = {}
+
 # Model selection mapping for slash commands
 # Maps each command to its model configuration for base and heavy model sets
 SLASH_COMMAND_MODEL_MAP: Final[Dict[SlashCommand, Dict[ModelSet, str]]] = {
@@ -46,6 +58,32 @@ SLASH_COMMAND_MODEL_MAP: Final[Dict[SlashCommand, Dict[ModelSet, str]]] = {
 }
 
 
+def _get_model_set(ipe_id: str) -> ModelSet:
+    """Return the model_set stored in an IPE's state, defaulting to "base".
+
+    The value is reused until the state file changes on disk.
+    """
+    # Import here to avoid circular imports
+    from .ipe_state import IPEState
+
+    state_path = os.path.join(_PROJECT_ROOT, "agents", ipe_id, IPEState.STATE_FILENAME)
+    try:
+        mtime = os.stat(state_path).st_mtime_ns
+    except OSError:
+        return "base"
+
+    cached = _MODEL_SET_CACHE.get(ipe_id)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    model_set: ModelSet = "base"  # Default model set
+    state = IPEState.load(ipe_id)
+    if state:
+        model_set = state.get("model_set", "base")
+    _MODEL_SET_CACHE[ipe_id] = (mtime, model_set)
+    return model_set
+
+
 def get_model_for_slash_command(
     request: AgentTemplateRequest, default: str = "sonnet"
 ) -> str:
@@ -61,14 +99,8 @@ def get_model_for_slash_command(
     Returns:
         Model name to use (e.g., "sonnet" or "opus")
     """
-    # Import here to avoid circular imports
-    from .ipe_state import IPEState
-
     # Load state to get model_set
-    model_set: ModelSet = "base"  # Default model set
-    state = IPEState.load(request.ipe_id)
-    if state:
-        model_set = state.get("model_set", "base")
+    model_set = _get_model_set(request.ipe_id)
 
     # Get the model configuration for the command
     command_config = SLASH_COMMAND_MODEL_MAP.get(request.slash_command)
@@ -142,7 +174,14 @@ def truncate_output(
 
 
 def check_claude_installed() -> Optional[str]:
-    """Check if Claude Code CLI is installed. Return error message if not."""
+    """Check if Claude Code CLI is installed. Return error message if not.
+
+    A successful check is remembered for the life of the process, so only
+    the first agent call pays for spawning the CLI.
+    """
+    global _CLAUDE_INSTALLED
+    if _CLAUDE_INSTALLED:
+        return None
     try:
         result = subprocess.run(
             [CLAUDE_PATH, "--version"], capture_output=True, text=True
@@ -153,6 +192,7 @@ def check_claude_installed() -> Optional[str]:
             )
     except FileNotFoundError:
         return f"Error: Claude Code CLI is not installed. Expected at: {CLAUDE_PATH}"
+    _CLAUDE_INSTALLED = True
     return None
 
 
@@ -539,12 +579,8 @@ def execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
     prompt = f"{request.slash_command} {' '.join(request.args)}"
 
     # Create output directory with ipe_id at project root
-    # __file__ is in adws/adw_modules/, so we need to go up 3 levels to get to project root
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
     output_dir = os.path.join(
-        project_root, "agents", request.ipe_id, request.agent_name
+        _PROJECT_ROOT, "agents", request.ipe_id, request.agent_name
     )
     os.makedirs(output_dir, exist_ok=True)
 
@@ -1,15 +1,27 @@
 """AMI versioning utilities for IPE deployments."""
 
-import subprocess
-import logging
+import heapq
 import json
+import logging
 import os
 import re
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, Iterator, List, Dict, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
+from .ipe_aws_ops import ClientError, get_ec2_client, requires_boto3
+from .ipe_utils import git_output
+
+# Maximum resource IDs accepted by a single CreateTags request
+_CREATE_TAGS_MAX_RESOURCES = 1000
+
+# Images requested per DescribeImages page
+_DESCRIBE_IMAGES_PAGE_SIZE = 1000
+
+# Timestamp shared by every version/tag generated during this build
+_BUILD_TIMESTAMP: Optional[str] = None
+
 
 class VersionStrategy(str, Enum):
     """AMI versioning strategies."""
@@ -20,6 +32,41 @@ class VersionStrategy(str, Enum):
     CUSTOM = "custom"
 
 
+# Name of the per-IPE append-only log holding AMI version history
+AMI_VERSION_HISTORY_LOG = "ami_version_history"
+
+# Output of `git describe --tags --long`: {tag}-{commits since tag}-g{hash}
+_DESCRIBE_LONG_RE = re.compile(r'^(?P<tag>.+)-(?P<n>\d+)-g(?P<hash>[0-9a-f]+)$')
+# Characters not allowed in AMI names
+_SAFE_VERSION_RE = re.compile(r'[^a-zA-Z0-9\-\.]')
+# Packer build log line (group 1) or manifest entry (group 2):
+#   AMI: ami-xxxxxxxxxxxxxxxxx
+#   "artifact_id": "region:ami-xxxxxxxxxxxxxxxxx"
+_AMI_FROM_PACKER_RE = re.compile(
+    r'AMI:\s+(ami-[a-f0-9]+)|"artifact_id":\s*"[^:]+:(ami-[a-f0-9]+)"'
+)
+# Packer prints the AMI ID near the end, so the tail is searched first
+_PACKER_TAIL_CHARS = 65536
+
+
+def get_build_timestamp() -> str:
+    """Get the timestamp for the current build (YYYYmmdd-HHMMSS).
+
+    Fixed on first call so every AMI name and tag produced by one build
+    shares it, keeping names consistent across environments.
+    """
+    global _BUILD_TIMESTAMP
+    if _BUILD_TIMESTAMP is None:
+        _BUILD_TIMESTAMP = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return _BUILD_TIMESTAMP
+
+
+def reset_build_timestamp() -> None:
+    """Forget the cached build timestamp (for tests or a new build)."""
+    global _BUILD_TIMESTAMP
+    _BUILD_TIMESTAMP = None
+
+
 def get_semantic_version(logger: logging.Logger) -> str:
     """Get semantic version from git tags.
 
@@ -37,38 +84,23 @@ def get_semantic_version(logger: logging.Logger) -> str:
         Semantic version string
     """
     try:
-        # Get latest tag
-        result = subprocess.run(
-            ["git", "describe", "--tags", "--abbrev=0"],
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode == 0:
-            latest_tag = result.stdout.strip()
+        # One call answers "latest tag", "on the tag?" and "short hash":
+        # v1.2.3-0-gabc123 on the tag, v1.2.3-5-gabc123 after it, or just
+        # the hash when no tags exist.
+        described = git_output(os.getcwd(), "describe", "--tags", "--long", "--always")
+        match = _DESCRIBE_LONG_RE.match(described) if described else None
 
-            # Check if we're on the tag
-            result = subprocess.run(
-                ["git", "describe", "--tags", "--exact-match"],
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode == 0:
+        if match:
+            latest_tag = match.group("tag")
+            if match.group("n") == "0":
                 # On exact tag
                 return latest_tag
-            else:
-                # Commits since tag, add dev suffix
-                short_hash = subprocess.run(
-                    ["git", "rev-parse", "--short", "HEAD"],
-                    capture_output=True,
-                    text=True
-                ).stdout.strip()
-                return f"{latest_tag}-dev-{short_hash}"
-        else:
-            # No tags, use default
-            logger.warning("No git tags found, using v0.1.0")
-            return "v0.1.0"
+            # Commits since tag, add dev suffix
+            return f"{latest_tag}-dev-{match.group('hash')}"
+
+        # No tags, use default
+        logger.warning("No git tags found, using v0.1.0")
+        return "v0.1.0"
 
     except Exception as e:
         logger.error(f"Error getting semantic version: {e}")
@@ -86,14 +118,10 @@ def get_git_describe_version(logger: logging.Logger) -> str:
         Git describe version string
     """
     try:
-        result = subprocess.run(
-            ["git", "describe", "--tags", "--always", "--dirty"],
-            capture_output=True,
-            text=True
-        )
+        version = git_output(os.getcwd(), "describe", "--tags", "--always", "--dirty")
 
-        if result.returncode == 0:
-            return result.stdout.strip()
+        if version is not None:
+            return version
 
         # Fallback to commit hash
         return get_commit_hash_version(logger)
@@ -114,14 +142,10 @@ def get_commit_hash_version(logger: logging.Logger) -> str:
         Short commit hash
     """
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            capture_output=True,
-            text=True
-        )
+        short_hash = git_output(os.getcwd(), "rev-parse", "--short", "HEAD")
 
-        if result.returncode == 0:
-            return result.stdout.strip()
+        if short_hash is not None:
+            return short_hash
 
         return "unknown"
 
@@ -140,7 +164,7 @@ def get_timestamp_version(logger: logging.Logger) -> str:
     Returns:
         Timestamp version string
     """
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    timestamp = get_build_timestamp()
 
     # Optionally append git hash
     try:
@@ -208,7 +232,7 @@ def generate_ami_name(
         Full AMI name
     """
     # Sanitize version (remove invalid characters for AMI names)
-    safe_version = re.sub(r'[^a-zA-Z0-9\-\.]', '-', version)
+    safe_version = _SAFE_VERSION_RE.sub('-', version)
 
     ami_name = f"{base_name}-{environment}-{safe_version}"
 
@@ -223,14 +247,10 @@ def get_git_branch(logger: logging.Logger) -> str:
         Git branch name or 'unknown'
     """
     try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True,
-            text=True
-        )
+        branch = git_output(os.getcwd(), "branch", "--show-current")
 
-        if result.returncode == 0:
-            return result.stdout.strip()
+        if branch is not None:
+            return branch
 
         return "unknown"
 
@@ -281,42 +301,60 @@ def tag_ami(
     Returns:
         True if successful
     """
-    try:
-        tags = [
-            f"Key=Name,Value={ami_name}",
-            f"Key=Version,Value={version}",
-            f"Key=Environment,Value={environment}",
-            f"Key=GitCommit,Value={git_commit}",
-            f"Key=GitBranch,Value={git_branch}",
-            f"Key=BuildTimestamp,Value={build_timestamp}",
-            f"Key=Builder,Value={builder}",
-            f"Key=ManagedBy,Value=ipe_deploy",
-        ]
+    tag_pairs = [
+        ("Name", ami_name),
+        ("Version", version),
+        ("Environment", environment),
+        ("GitCommit", git_commit),
+        ("GitBranch", git_branch),
+        ("BuildTimestamp", build_timestamp),
+        ("Builder", builder),
+        ("ManagedBy", "ipe_deploy"),
+    ]
+
+    if ipe_id:
+        tag_pairs.append(("IPE_ID", ipe_id))
+
+    return tag_amis_bulk([ami_id], tag_pairs, region, logger)
+
+
+@requires_boto3(False)
+def tag_amis_bulk(
+    ami_ids: List[str],
+    tag_pairs: List[Tuple[str, str]],
+    region: str,
+    logger: logging.Logger
+) -> bool:
+    """Apply the same tags to several AMIs with one CreateTags request.
 
-        if ipe_id:
-            tags.append(f"Key=IPE_ID,Value={ipe_id}")
-
-        # Tag AMI
-        cmd = [
-            "aws", "ec2", "create-tags",
-            "--region", region,
-            "--resources", ami_id,
-            "--tags"
-        ] + tags
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True
-        )
+    Useful when one commit produces AMIs for several environments.
 
-        if result.returncode == 0:
-            logger.info(f"✅ AMI {ami_id} tagged successfully")
-            return True
+    Args:
+        ami_ids: AMI IDs to tag
+        tag_pairs: (key, value) tag pairs
+        region: AWS region
+        logger: Logger instance
 
-        logger.error(f"Failed to tag AMI: {result.stderr}")
-        return False
+    Returns:
+        True if successful
+    """
+    try:
+        tags = [{"Key": key, "Value": value} for key, value in tag_pairs]
+        ec2 = get_ec2_client(region)
+
+        # CreateTags accepts up to 1000 resources per request
+        for start in range(0, len(ami_ids), _CREATE_TAGS_MAX_RESOURCES):
+            ec2.create_tags(
+                Resources=ami_ids[start:start + _CREATE_TAGS_MAX_RESOURCES],
+                Tags=tags
+            )
 
+        logger.info(f"✅ AMI {', '.join(ami_ids)} tagged successfully")
+        return True
+
+    except ClientError as e:
+        logger.error(f"Failed to tag AMI: {e}")
+        return False
     except Exception as e:
         logger.error(f"Error tagging AMI: {e}")
         return False
@@ -336,7 +374,8 @@ def track_ami_version(
 ):
     """Track AMI version in IPE state.
 
-    Stores version history in state for auditing and rollback.
+    Appends to the state's version history log for auditing and rollback
+    and records the latest version in state.
 
     Args:
         state: IPE state instance
@@ -350,10 +389,6 @@ def track_ami_version(
         region: AWS region
         logger: Logger instance
     """
-    # Get existing version history
-    version_history = state.get("ami_version_history", [])
-
-    # Add new version entry
     version_entry = {
         "version": version,
         "ami_id": ami_id,
@@ -366,10 +401,10 @@ def track_ami_version(
         "created_at": datetime.now().isoformat()
     }
 
-    version_history.append(version_entry)
+    # Append to the history log; only the latest version lives in state
+    state.append(AMI_VERSION_HISTORY_LOG, version_entry)
 
     # Update state
-    state.set("ami_version_history", version_history)
     state.set("latest_ami_version", version)
     state.set("latest_ami_id", ami_id)
     state.set("latest_ami_name", ami_name)
@@ -377,76 +412,102 @@ def track_ami_version(
     logger.info(f"✅ Tracked AMI version: {version}")
 
 
-def list_ami_versions(
+def _ami_version_entry(img: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an AMI version dictionary from a describe_images image."""
+    tags = {tag["Key"]: tag["Value"] for tag in img.get("Tags", [])}
+    return {
+        "ami_id": img["ImageId"],
+        "ami_name": img.get("Name"),
+        "version": tags.get("Version") or "unknown",
+        "created_at": img["CreationDate"],
+        "git_commit": tags.get("GitCommit") or "unknown"
+    }
+
+
+@requires_boto3([])
+def _list_ami_versions_impl(
     environment: Optional[str],
     region: str,
-    logger: logging.Logger
+    logger: logging.Logger,
+    max_results: Optional[int] = None
 ) -> List[Dict[str, Any]]:
-    """List available AMI versions.
-
-    Args:
-        environment: Filter by environment (optional)
-        region: AWS region
-        logger: Logger instance
+    """List AMI versions newest first, optionally keeping only the newest N.
 
-    Returns:
-        List of AMI version dictionaries
+    EC2 does not return images in creation order, so pages are streamed and
+    the newest N selected locally; only those become version dictionaries.
     """
     try:
-        # Build filter command
         filters = [
-            "Name=tag:ManagedBy,Values=ipe_deploy",
-            "Name=state,Values=available"
+            {"Name": "tag:ManagedBy", "Values": ["ipe_deploy"]},
+            {"Name": "state", "Values": ["available"]},
         ]
 
         if environment:
-            filters.append(f"Name=tag:Environment,Values={environment}")
+            filters.append({"Name": "tag:Environment", "Values": [environment]})
+
+        # Query AMIs page by page; only the images being kept stay in memory
+        paginator = get_ec2_client(region).get_paginator("describe_images")
+        images = (
+            image
+            for page in paginator.paginate(
+                Owners=["self"],
+                Filters=filters,
+                PaginationConfig={"PageSize": _DESCRIBE_IMAGES_PAGE_SIZE}
+            )
+            for image in page["Images"]
+        )
 
-        # Query AMIs
-        cmd = [
-            "aws", "ec2", "describe-images",
-            "--region", region,
-            "--owners", "self"
-        ]
+        # Sort by creation date (newest first)
+        if max_results is None:
+            images = sorted(images, key=lambda i: i["CreationDate"], reverse=True)
+        else:
+            images = heapq.nlargest(max_results, images, key=lambda i: i["CreationDate"])
 
-        for f in filters:
-            cmd.extend(["--filters", f])
+        return [_ami_version_entry(img) for img in images]
 
-        cmd.extend([
-            "--query", "Images[*].[ImageId,Name,Tags[?Key=='Version'].Value|[0],CreationDate,Tags[?Key=='GitCommit'].Value|[0]]",
-            "--output", "json"
-        ])
+    except ClientError as e:
+        logger.error(f"Failed to list AMIs: {e}")
+        return []
+    except Exception as e:
+        logger.error(f"Error listing AMI versions: {e}")
+        return []
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True
-        )
 
-        if result.returncode == 0:
-            images = json.loads(result.stdout)
+def load_ami_version_history(state: Any) -> Iterator[Dict[str, Any]]:
+    """Stream AMI version history entries recorded by track_ami_version.
+
+    Args:
+        state: IPE state instance
+
+    Yields:
+        Version entries, oldest first
+    """
+    log_path = state.get_log_path(AMI_VERSION_HISTORY_LOG)
+    if not os.path.exists(log_path):
+        return
 
-            versions = []
-            for img in images:
-                versions.append({
-                    "ami_id": img[0],
-                    "ami_name": img[1],
-                    "version": img[2] if img[2] else "unknown",
-                    "created_at": img[3],
-                    "git_commit": img[4] if len(img) > 4 and img[4] else "unknown"
-                })
+    with open(log_path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
 
-            # Sort by creation date (newest first)
-            versions.sort(key=lambda x: x["created_at"], reverse=True)
 
-            return versions
+def list_ami_versions(
+    environment: Optional[str],
+    region: str,
+    logger: logging.Logger
+) -> List[Dict[str, Any]]:
+    """List available AMI versions.
 
-        logger.error(f"Failed to list AMIs: {result.stderr}")
-        return []
+    Args:
+        environment: Filter by environment (optional)
+        region: AWS region
+        logger: Logger instance
 
-    except Exception as e:
-        logger.error(f"Error listing AMI versions: {e}")
-        return []
+    Returns:
+        List of AMI version dictionaries
+    """
+    return _list_ami_versions_impl(environment, region, logger)
 
 
 def get_latest_ami_version(
@@ -464,10 +525,10 @@ def get_latest_ami_version(
     Returns:
         Latest AMI version dictionary or None
     """
-    versions = list_ami_versions(environment, region, logger)
+    versions = _list_ami_versions_impl(environment, region, logger, max_results=1)
 
     if versions:
-        return versions[0]  # Already sorted by newest
+        return versions[0]
 
     return None
 
@@ -483,22 +544,15 @@ def extract_ami_id_from_packer_output(output: str, logger: logging.Logger) -> Op
         AMI ID if found, None otherwise
     """
     try:
-        # Look for pattern: AMI: ami-xxxxxxxxxxxxxxxxx
-        pattern = r'AMI:\s+(ami-[a-f0-9]+)'
-        match = re.search(pattern, output)
-
-        if match:
-            ami_id = match.group(1)
-            logger.info(f"Extracted AMI ID: {ami_id}")
-            return ami_id
-
-        # Alternative pattern in manifest
-        pattern = r'"artifact_id":\s*"[^:]+:(ami-[a-f0-9]+)"'
-        match = re.search(pattern, output)
+        # Look for either pattern in one pass, tail first
+        match = _AMI_FROM_PACKER_RE.search(output[-_PACKER_TAIL_CHARS:])
+        if not match and len(output) > _PACKER_TAIL_CHARS:
+            match = _AMI_FROM_PACKER_RE.search(output)
 
         if match:
-            ami_id = match.group(1)
-            logger.info(f"Extracted AMI ID from manifest: {ami_id}")
+            ami_id = match.group(1) or match.group(2)
+            source = "" if match.group(1) else " from manifest"
+            logger.info(f"Extracted AMI ID{source}: {ami_id}")
             return ami_id
 
         logger.warning("Could not extract AMI ID from Packer output")
@@ -3,8 +3,17 @@
 import subprocess
 import logging
 import os
+import copy
+import functools
+import inspect
 import re
-from typing import Optional, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, Callable, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     import boto3
@@ -13,7 +22,59 @@ try:
 except ImportError:
     BOTO3_AVAILABLE = False
 
+    class ClientError(Exception):
+        """Stand-in so `except ClientError` clauses resolve without botocore."""
+
+# One EC2 client per region; creating a client resolves credentials and
+# endpoints, so it is done once and reused (clients are thread-safe)
+_EC2_CLIENTS: Dict[str, Any] = {}
+
+
+def get_ec2_client(region: str) -> Any:
+    """Get the cached EC2 client for a region, creating it on first use."""
+    client = _EC2_CLIENTS.get(region)
+    if client is None:
+        client = _EC2_CLIENTS.setdefault(region, boto3.client('ec2', region_name=region))
+    return client
+
+
+def requires_boto3(unavailable_result: Any) -> Callable:
+    """Return unavailable_result (and log why) when boto3 is not installed.
+
+    The wrapped function must take a `logger` argument.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not BOTO3_AVAILABLE:
+                logger = signature.bind_partial(*args, **kwargs).arguments.get("logger")
+                if logger:
+                    logger.error("boto3 is not installed. Install with: pip install boto3")
+                return copy.deepcopy(unavailable_result)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# (ami_id, region) -> (name, state, creation date) for AMIs already seen
+# as available; an available AMI stays that way until someone deregisters it
+_VERIFIED_AMIS: Dict[Tuple[str, str], Tuple[str, str, str]] = {}
+
+# Shared HTTP session so repeated readiness probes reuse keep-alive connections
+_HTTP = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=0))
+_HTTP.mount("http://", _HTTP_ADAPTER)
+_HTTP.mount("https://", _HTTP_ADAPTER)
 
+# AMI IDs are "ami-" followed by 17 hex characters
+_AMI_ID_RE = re.compile(r'^ami-[0-9a-f]{17}$')
+
+
+@requires_boto3(False)
 def verify_ami_exists(ami_id: str, region: str, logger: logging.Logger) -> bool:
     """Verify that an AMI exists in AWS.
 
@@ -25,37 +86,55 @@ def verify_ami_exists(ami_id: str, region: str, logger: logging.Logger) -> bool:
     Returns:
         True if AMI exists, False otherwise
     """
-    # Check if boto3 is available
-    if not BOTO3_AVAILABLE:
-        logger.error("boto3 is not installed. Install with: pip install boto3")
-        return False
-
     # Validate AMI ID format
-    ami_pattern = r'^ami-[0-9a-f]{17}$'
-    if not re.match(ami_pattern, ami_id):
+    if not _AMI_ID_RE.match(ami_id):
         logger.error(f"Invalid AMI ID format: {ami_id}")
         logger.error("Expected format: ami-xxxxxxxxxxxxxxxxx (17 hex characters)")
         return False
 
     try:
-        ec2 = boto3.client('ec2', region_name=region)
-        response = ec2.describe_images(ImageIds=[ami_id])
+        details = _describe_ami(ami_id, region)
+    except ClientError as e:
+        logger.error(f"Failed to verify AMI: {e}")
+        return False
 
-        if not response['Images']:
-            logger.error(f"AMI not found: {ami_id}")
-            return False
+    if details is None:
+        logger.error(f"AMI not found: {ami_id}")
+        return False
 
-        ami = response['Images'][0]
-        logger.info(f"✓ AMI verified: {ami_id}")
-        logger.info(f"  Name: {ami.get('Name', 'N/A')}")
-        logger.info(f"  State: {ami.get('State', 'N/A')}")
-        logger.info(f"  Created: {ami.get('CreationDate', 'N/A')}")
+    name, state, created = details
+    logger.info(f"✓ AMI verified: {ami_id}")
+    logger.info(f"  Name: {name}")
+    logger.info(f"  State: {state}")
+    logger.info(f"  Created: {created}")
 
-        return True
+    return True
 
-    except ClientError as e:
-        logger.error(f"Failed to verify AMI: {e}")
-        return False
+
+def _describe_ami(ami_id: str, region: str) -> Optional[Tuple[str, str, str]]:
+    """Look up (name, state, creation date) for an AMI, or None if not found.
+
+    Available AMIs are cached for the rest of the run; pending or failed
+    ones are not, so a later check sees their new state.
+    """
+    key = (ami_id, region)
+    cached = _VERIFIED_AMIS.get(key)
+    if cached is not None:
+        return cached
+
+    response = get_ec2_client(region).describe_images(ImageIds=[ami_id])
+    if not response['Images']:
+        return None
+
+    ami = response['Images'][0]
+    details = (
+        ami.get('Name', 'N/A'),
+        ami.get('State', 'N/A'),
+        ami.get('CreationDate', 'N/A'),
+    )
+    if details[1] == 'available':
+        _VERIFIED_AMIS[key] = details
+    return details
 
 
 def verify_aws_credentials(logger: logging.Logger) -> bool:
@@ -130,16 +209,16 @@ def test_website_accessibility(url: str, logger: logging.Logger) -> bool:
     Returns:
         True if accessible (HTTP 200)
     """
-    result = subprocess.run(
-        ["curl", "-I", "-s", "-o", "/dev/null", "-w", "%{http_code}", url],
-        capture_output=True,
-        text=True
-    )
+    try:
+        response = _HTTP.head(url, timeout=5, allow_redirects=True)
+    except requests.RequestException as e:
+        logger.debug(f"Website not reachable: {url} ({e})")
+        return False
 
-    status_code = result.stdout.strip()
-    return status_code == "200"
+    return response.status_code == 200
 
 
+@requires_boto3((False, []))
 def check_ami_in_use(ami_id: str, region: str, logger: logging.Logger) -> tuple[bool, list[str]]:
     """Check if AMI is currently in use by any EC2 instances.
 
@@ -151,12 +230,8 @@ def check_ami_in_use(ami_id: str, region: str, logger: logging.Logger) -> tuple[
     Returns:
         Tuple of (is_in_use, list_of_instance_ids)
     """
-    if not BOTO3_AVAILABLE:
-        logger.error("boto3 is not installed. Install with: pip install boto3")
-        return False, []
-
     try:
-        ec2 = boto3.client('ec2', region_name=region)
+        ec2 = get_ec2_client(region)
         response = ec2.describe_instances(
             Filters=[
                 {'Name': 'image-id', 'Values': [ami_id]},
@@ -180,6 +255,24 @@ def check_ami_in_use(ami_id: str, region: str, logger: logging.Logger) -> tuple[
         return False, []
 
 
+def _delete_snapshot_with_retry(ec2: Any, snapshot_id: str, attempts: int = 5) -> None:
+    """Delete a snapshot, backing off while it is still held by a deregistering AMI.
+
+    Raises:
+        ClientError: If deletion fails for another reason or retries run out
+    """
+    for attempt in range(attempts):
+        try:
+            ec2.delete_snapshot(SnapshotId=snapshot_id)
+            return
+        except ClientError as e:
+            in_use = e.response.get('Error', {}).get('Code') == 'InvalidSnapshot.InUse'
+            if not in_use or attempt == attempts - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+
+@requires_boto3(False)
 def delete_ami_and_snapshots(ami_id: str, region: str, logger: logging.Logger, dry_run: bool = False) -> bool:
     """Delete AMI and its associated EBS snapshots.
 
@@ -192,12 +285,8 @@ def delete_ami_and_snapshots(ami_id: str, region: str, logger: logging.Logger, d
     Returns:
         True if successful, False otherwise
     """
-    if not BOTO3_AVAILABLE:
-        logger.error("boto3 is not installed. Install with: pip install boto3")
-        return False
-
     try:
-        ec2 = boto3.client('ec2', region_name=region)
+        ec2 = get_ec2_client(region)
 
         # Get AMI details to find associated snapshots
         response = ec2.describe_images(ImageIds=[ami_id])
@@ -221,17 +310,24 @@ def delete_ami_and_snapshots(ami_id: str, region: str, logger: logging.Logger, d
         # Deregister the AMI
         logger.info(f"Deregistering AMI {ami_id}...")
         ec2.deregister_image(ImageId=ami_id)
+        _VERIFIED_AMIS.pop((ami_id, region), None)
         logger.info("✅ AMI deregistered successfully")
 
-        # Delete associated snapshots
+        # Delete associated snapshots (independent API calls, run in parallel)
         if snapshot_ids:
             logger.info(f"Deleting {len(snapshot_ids)} associated snapshot(s)...")
-            for snapshot_id in snapshot_ids:
-                try:
-                    ec2.delete_snapshot(SnapshotId=snapshot_id)
-                    logger.info(f"✅ Snapshot {snapshot_id} deleted")
-                except ClientError as e:
-                    logger.warning(f"Failed to delete snapshot {snapshot_id}: {e}")
+            with ThreadPoolExecutor(max_workers=min(8, len(snapshot_ids))) as pool:
+                futures = {
+                    pool.submit(_delete_snapshot_with_retry, ec2, snapshot_id): snapshot_id
+                    for snapshot_id in snapshot_ids
+                }
+                for future in as_completed(futures):
+                    snapshot_id = futures[future]
+                    try:
+                        future.result()
+                        logger.info(f"✅ Snapshot {snapshot_id} deleted")
+                    except ClientError as e:
+                        logger.warning(f"Failed to delete snapshot {snapshot_id}: {e}")
         else:
             logger.info("No snapshots to delete")
 
@@ -242,6 +338,7 @@ def delete_ami_and_snapshots(ami_id: str, region: str, logger: logging.Logger, d
         return False
 
 
+@requires_boto3([])
 def list_amis_by_environment(environment: str, region: str, logger: logging.Logger) -> list[Dict[str, Any]]:
     """List all AMIs for a specific environment.
 
@@ -253,22 +350,24 @@ def list_amis_by_environment(environment: str, region: str, logger: logging.Logg
     Returns:
         List of AMI dictionaries sorted by creation date (newest first)
     """
-    if not BOTO3_AVAILABLE:
-        logger.error("boto3 is not installed. Install with: pip install boto3")
-        return []
-
     try:
-        ec2 = boto3.client('ec2', region_name=region)
-        response = ec2.describe_images(
+        ec2 = get_ec2_client(region)
+        paginator = ec2.get_paginator('describe_images')
+        pages = paginator.paginate(
             Owners=['self'],
             Filters=[
                 {'Name': 'name', 'Values': [f'{{{{PROJECT_SLUG}}}}-{environment}-*']},
                 {'Name': 'state', 'Values': ['available']}
-            ]
+            ],
+            PaginationConfig={'PageSize': 1000}
         )
 
         # Sort by creation date (newest first)
-        amis = sorted(response['Images'], key=lambda x: x['CreationDate'], reverse=True)
+        amis = sorted(
+            (image for page in pages for image in page['Images']),
+            key=lambda x: x['CreationDate'],
+            reverse=True
+        )
 
         return amis
 
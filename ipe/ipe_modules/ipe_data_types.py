@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, List, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -266,7 +266,12 @@ class DocumentationResult(BaseModel):
 
 
 class IPEExtractionResult(BaseModel):
-    """Result from extracting IPE information from text."""
+    """Result from extracting IPE information from text.
+
+    Frozen so the empty result can be shared instead of rebuilt per failure.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     workflow_command: Optional[str] = None  # e.g., "ipe_plan_iso" (without slash)
     ipe_id: Optional[str] = None  # 8-character IPE ID
@@ -6,6 +6,7 @@ Provides centralized git operations that build on top of github.py module.
 import subprocess
 import json
 import logging
+import os
 from typing import Optional, Tuple
 
 # Import GitHub functions from existing module
@@ -327,9 +328,24 @@ def finalize_git_operations(
 
                 issue = fetch_issue(issue_number, repo_path)
 
-                from .ipe_workflow_ops import create_pull_request
+                from .ipe_workflow_ops import (
+                    create_pull_request,
+                    create_pull_request_api,
+                )
 
-                pr_url, error = create_pull_request(branch_name, issue, state, logger, cwd)
+                # IPE_PR_VIA_API=1 opens the PR over REST with a templated
+                # body instead of running the PR-writing agent
+                pr_url, error = None, None
+                if os.getenv("IPE_PR_VIA_API") == "1":
+                    pr_url, error = create_pull_request_api(
+                        branch_name, issue, state, logger
+                    )
+                    if error:
+                        logger.warning(f"REST PR creation failed, using agent: {error}")
+                if not pr_url:
+                    pr_url, error = create_pull_request(
+                        branch_name, issue, state, logger, cwd
+                    )
             except Exception as e:
                 logger.error(f"Failed to fetch issue for PR creation: {e}")
                 pr_url, error = None, str(e)
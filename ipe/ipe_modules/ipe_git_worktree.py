@@ -3,23 +3,91 @@
 import subprocess
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
+from .ipe_utils import git_layout_output
 
-def get_git_root() -> Path:
-    """Get git repository root directory.
+
+class _GitInfo(NamedTuple):
+    """Repository layout for a working directory."""
+    toplevel: str  # Root of the worktree containing the directory
+    common_dir: str  # Absolute path of the shared .git directory
+    cdup: str  # Relative path from the directory up to toplevel
+
+
+def _git_info() -> Optional[_GitInfo]:
+    """Get repository layout for the current directory with one git call.
 
     Returns:
-        Path to git root directory
+        _GitInfo, or None if not inside a git work tree
     """
+    cwd = os.getcwd()
+    output = git_layout_output(
+        cwd, "rev-parse", "--show-toplevel", "--git-common-dir", "--show-cdup"
+    )
+    if not output:
+        return None
+
+    # --show-cdup prints an empty line at the top level, which strip() drops
+    toplevel, common_dir, cdup = (output.split("\n") + ["", ""])[:3]
+    return _GitInfo(
+        toplevel=toplevel,
+        common_dir=os.path.realpath(os.path.join(cwd, common_dir)),
+        cdup=cdup,
+    )
+
+
+# common_dir -> (mtime of common_dir/worktrees, resolved worktree paths)
+_WORKTREE_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+
+
+def _get_worktrees(common_dir: str) -> List[str]:
+    """Get the resolved paths of all worktrees sharing common_dir.
+
+    The parsed `git worktree list` is reused until a worktree is added or
+    removed, which is when git touches the common_dir/worktrees directory.
+
+    Raises:
+        subprocess.CalledProcessError: If git worktree list fails
+    """
+    try:
+        stamp = os.stat(os.path.join(common_dir, "worktrees")).st_mtime
+    except OSError:
+        stamp = 0.0
+
+    cached = _WORKTREE_CACHE.get(common_dir)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True,
-        text=True,
+        ["git", "worktree", "list", "--porcelain"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         check=True
     )
-    return Path(result.stdout.strip())
+
+    # Parse porcelain output (decoded once); only the worktree paths are needed
+    paths = [
+        os.path.realpath(line[len("worktree "):])
+        for line in result.stdout.decode("utf-8", errors="replace").splitlines()
+        if line.startswith("worktree ")
+    ]
+    _WORKTREE_CACHE[common_dir] = (stamp, paths)
+    return paths
+
+
+def get_git_root() -> Path:
+    """Get git repository root directory.
+
+    Returns:
+        Path to git root directory
+    """
+    info = _git_info()
+    if info is None:
+        raise subprocess.CalledProcessError(128, ["git", "rev-parse", "--show-toplevel"])
+    return Path(info.toplevel)
 
 
 def ensure_worktree_gitignore():
@@ -30,8 +98,9 @@ def ensure_worktree_gitignore():
     gitignore_entry = "trees/"
 
     if gitignore_path.exists():
-        with open(gitignore_path, "r") as f:
-            if gitignore_entry in f.read():
+        # Compare whole lines so entries like "trees/foo" don't count
+        with open(gitignore_path, "r", newline="") as f:
+            if any(line.strip() == gitignore_entry for line in f):
                 return  # Already present
 
     with open(gitignore_path, "a") as f:
@@ -64,12 +133,43 @@ def create_worktree(
     subprocess.run(
         ["git", "worktree", "add", str(worktree_dir), branch],
         check=True,
-        capture_output=True
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
     )
 
     return str(worktree_dir)
 
 
+def create_worktrees(
+    operations: List[Tuple[str, str]],
+    logger: logging.Logger
+) -> List[str]:
+    """Create several git worktrees concurrently.
+
+    `git worktree add` is I/O bound, so the worktrees are created from a
+    small thread pool instead of one after another.
+
+    Args:
+        operations: (operation_name, branch) pairs, one per worktree
+        logger: Logger instance
+
+    Returns:
+        Paths to the created worktree directories, in input order
+    """
+    if not operations:
+        return []
+
+    # Create trees directory up front so workers don't race on it
+    (get_git_root() / "trees").mkdir(exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(operations))) as pool:
+        futures = [
+            pool.submit(create_worktree, operation_name, branch, logger)
+            for operation_name, branch in operations
+        ]
+        return [future.result() for future in futures]
+
+
 def cleanup_worktree(operation_name: str, logger: logging.Logger):
     """Clean up a git worktree.
 
@@ -80,22 +180,25 @@ def cleanup_worktree(operation_name: str, logger: logging.Logger):
     git_root = get_git_root()
     worktree_dir = git_root / "trees" / operation_name
 
-    if not worktree_dir.exists():
+    if not os.path.lexists(worktree_dir):
         return
 
     logger.info(f"Cleaning up worktree: {worktree_dir}")
 
     # Remove worktree
-    subprocess.run(
+    result = subprocess.run(
         ["git", "worktree", "remove", str(worktree_dir), "--force"],
-        capture_output=True
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
     )
 
-    # Prune worktree references
-    subprocess.run(
-        ["git", "worktree", "prune"],
-        capture_output=True
-    )
+    # A clean remove already drops the reference; prune only on failure
+    if result.returncode != 0:
+        subprocess.run(
+            ["git", "worktree", "prune"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
 
 
 def is_in_worktree() -> Tuple[bool, Optional[Path]]:
@@ -107,43 +210,29 @@ def is_in_worktree() -> Tuple[bool, Optional[Path]]:
         - worktree_path: Path to the worktree root, or None if not in worktree
     """
     try:
-        # Get current working directory
-        cwd = Path(os.getcwd()).resolve()
-
-        # Execute git worktree list to get all worktrees
-        result = subprocess.run(
-            ["git", "worktree", "list", "--porcelain"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        # Parse porcelain output
-        worktrees = []
-        current_worktree = {}
-
-        for line in result.stdout.strip().split('\n'):
-            if line.startswith('worktree '):
-                if current_worktree:
-                    worktrees.append(current_worktree)
-                current_worktree = {'path': Path(line.split(' ', 1)[1]).resolve()}
-            elif line.startswith('branch '):
-                current_worktree['branch'] = line.split(' ', 1)[1]
-
-        # Add last worktree
-        if current_worktree:
-            worktrees.append(current_worktree)
-
-        # Check if current directory is in any worktree
-        for wt in worktrees:
-            wt_path = wt['path']
-            try:
-                # Check if cwd is the worktree or a subdirectory of it
-                cwd.relative_to(wt_path)
-                return True, wt_path
-            except ValueError:
-                # Not relative to this worktree
-                continue
+        info = _git_info()
+        if info is None:
+            return False, None
+
+        # The main checkout keeps its .git directly under the top level, so
+        # `git worktree list` is only needed inside linked worktrees
+        toplevel = os.path.realpath(info.toplevel)
+        if info.common_dir == os.path.join(toplevel, ".git"):
+            return True, Path(toplevel)
+
+        # Resolve current working directory once
+        cwd = os.path.realpath(os.getcwd())
+        worktree_paths = _get_worktrees(info.common_dir)
+
+        # Check if current directory is the worktree or a subdirectory of it;
+        # linked worktrees live under the main checkout (trees/), so prefer
+        # the deepest match
+        matches = [
+            wt_path for wt_path in worktree_paths
+            if cwd == wt_path or cwd.startswith(wt_path.rstrip(os.sep) + os.sep)
+        ]
+        if matches:
+            return True, Path(max(matches, key=len))
 
         return False, None
 
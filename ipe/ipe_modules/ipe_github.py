@@ -1,6 +1,6 @@
 #!/usr/bin/env -S uv run
 # /// script
-# dependencies = ["python-dotenv", "pydantic"]
+# dependencies = ["python-dotenv", "pydantic", "requests"]
 # ///
 
 """
@@ -18,11 +18,21 @@ import sys
 import os
 import json
 from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
 from .ipe_data_types import GitHubIssue, GitHubIssueListItem, GitHubComment
 
 # Bot identifier to prevent webhook loops and filter bot comments
 IPE_BOT_IDENTIFIER = "[IPE-AGENTS]"
 
+GITHUB_API_URL = "https://api.github.com"
+
+# Shared HTTP session so REST calls reuse one keep-alive connection to the API
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 
 def get_github_env() -> Optional[dict]:
     """Get environment with GitHub token set up. Returns None if no GITHUB_PAT.
@@ -76,6 +86,69 @@ def extract_repo_path(github_url: str) -> str:
     return github_url.replace("https://github.com/", "").replace(".git", "")
 
 
+def _github_api_post(path: str, payload: dict) -> dict:
+    """POST a JSON payload to the GitHub REST API using GITHUB_PAT.
+
+    Args:
+        path: API path below GITHUB_API_URL, e.g. "/repos/owner/repo/pulls"
+        payload: JSON request body
+
+    Returns:
+        Decoded JSON response
+
+    Raises:
+        RuntimeError: If GITHUB_PAT is not set or the request fails
+    """
+    github_pat = os.getenv("GITHUB_PAT")
+    if not github_pat:
+        raise RuntimeError("GITHUB_PAT is not set")
+
+    headers = {
+        "Authorization": f"Bearer {github_pat}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    try:
+        response = _HTTP.post(
+            f"{GITHUB_API_URL}{path}", json=payload, headers=headers, timeout=30
+        )
+    except requests.RequestException as e:
+        raise RuntimeError(f"GitHub API request failed: {e}")
+
+    if response.status_code >= 400:
+        raise RuntimeError(
+            f"GitHub API returned {response.status_code}: {response.text}"
+        )
+    return response.json()
+
+
+def create_pull_request_rest(
+    repo_path: str, head: str, title: str, body: str, base: str = "main"
+) -> str:
+    """Open a pull request through the GitHub REST API.
+
+    Avoids spawning gh for every PR; the branch must already be pushed.
+
+    Args:
+        repo_path: Repository in owner/repo form
+        head: Branch containing the changes
+        title: Pull request title
+        body: Pull request body
+        base: Branch to merge into
+
+    Returns:
+        URL of the created pull request
+
+    Raises:
+        RuntimeError: If GITHUB_PAT is not set or the API rejects the request
+    """
+    data = _github_api_post(
+        f"/repos/{repo_path}/pulls",
+        {"title": title, "head": head, "base": base, "body": body},
+    )
+    return data["html_url"]
+
+
 def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
     """Fetch GitHub issue using gh CLI and return typed model."""
     # Use JSON output for structured data
@@ -124,7 +197,11 @@ def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
 
 
 def make_issue_comment(issue_id: str, comment: str) -> None:
-    """Post a comment to a GitHub issue using gh CLI."""
+    """Post a comment to a GitHub issue using gh CLI.
+
+    With IPE_COMMENTS_VIA_API=1 and GITHUB_PAT set, the comment is posted
+    through the shared GitHub REST session instead of spawning gh.
+    """
     # Get repo information from git remote
     github_repo_url = get_repo_url()
     repo_path = extract_repo_path(github_repo_url)
@@ -133,6 +210,14 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
     if not comment.startswith(IPE_BOT_IDENTIFIER):
         comment = f"{IPE_BOT_IDENTIFIER} {comment}"
 
+    # Opt-in, like IPE_PR_VIA_API: post through the shared API session
+    if os.getenv("IPE_COMMENTS_VIA_API") == "1" and os.getenv("GITHUB_PAT"):
+        _github_api_post(
+            f"/repos/{repo_path}/issues/{issue_id}/comments", {"body": comment}
+        )
+        print(f"Successfully posted comment to issue #{issue_id}")
+        return
+
     # Build command
     cmd = [
         "gh",
@@ -4,19 +4,86 @@ This module provides centralized logging capabilities for ipe_deploy.py,
 capturing full command output and automatically saving detailed failure logs.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import shutil
+import tarfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Iterator, Tuple
 import re
 
+# Logger name -> listener writing that logger's file handlers on a
+# background thread; stopped (and drained) at interpreter exit
+_LISTENERS: Dict[str, logging.handlers.QueueListener] = {}
 
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a 64 KiB buffer.
+
+    Records are only flushed to disk on ERROR and above, on an explicit
+    flush(), or when the handler is closed, instead of after every line.
+    """
+
+    buffer_size = 65536
+
+    def __init__(self, *args, **kwargs):
+        self._deferring = False
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=self.errors
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # StreamHandler.emit() flushes after each record; defer that
+        # unless the record is an error someone may need to see right away
+        self._deferring = record.levelno < logging.ERROR
+        try:
+            super().emit(record)
+        finally:
+            self._deferring = False
+
+    def flush(self) -> None:
+        if not self._deferring:
+            super().flush()
+
+
+# Logger name -> ((command, trigger_type), ipe_logs file) it was set up with
+_CONFIGURED: Dict[str, Tuple[Tuple[str, str], Path]] = {}
+
+
+def _stop_listener(name: str) -> None:
+    """Drain and stop a logger's listener, closing its file handlers."""
+    listener = _LISTENERS.pop(name, None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_all_listeners() -> None:
+    """Flush pending file records before the interpreter exits."""
+    for name in list(_LISTENERS):
+        _stop_listener(name)
+
+
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory.
 
+    Cached; tests that relocate the project must call
+    get_project_root.cache_clear() (and ensure_ipe_logs_directory's).
+
     Returns:
         Path to project root
     """
@@ -24,9 +91,13 @@ def get_project_root() -> Path:
     return Path(__file__).parent.parent.parent
 
 
+@functools.lru_cache(maxsize=1)
 def ensure_ipe_logs_directory() -> Path:
     """Ensure ipe_logs directory structure exists.
 
+    The directories are created on the first call only; later calls
+    return the cached path without touching the filesystem.
+
     Returns:
         Path to ipe_logs directory
     """
@@ -46,7 +117,9 @@ def ensure_ipe_logs_directory() -> Path:
 def get_log_file_path(
     command: str,
     ipe_id: str,
-    failed: bool = False
+    failed: bool = False,
+    *,
+    timestamp: Optional[datetime] = None
 ) -> Tuple[Path, Path]:
     """Generate log file paths for a deployment operation.
 
@@ -54,6 +127,7 @@ def get_log_file_path(
         command: Command being executed (deploy, build-ami, etc.)
         ipe_id: IPE workflow ID
         failed: Whether this is a failure log
+        timestamp: Time to stamp the file names with (defaults to now)
 
     Returns:
         Tuple of (command_log_path, failure_log_path)
@@ -62,24 +136,60 @@ def get_log_file_path(
     ipe_logs = ensure_ipe_logs_directory()
 
     # Generate timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    stamp = (timestamp or datetime.now()).strftime("%Y-%m-%d_%H-%M-%S")
 
     # Normalize command name for directory
     command_dir = command.replace("_", "-")
 
     # Build filename
     suffix = "_FAILED" if failed else ""
-    filename = f"{timestamp}_{ipe_id}{suffix}.log"
+    filename = f"{stamp}_{ipe_id}{suffix}.log"
 
     command_log = ipe_logs / command_dir / filename
 
     if failed:
-        failure_log = ipe_logs / "failures" / f"{timestamp}_{command_dir}{suffix}.log"
+        failure_log = ipe_logs / "failures" / f"{stamp}_{command_dir}{suffix}.log"
         return command_log, failure_log
 
     return command_log, None
 
 
+# Every secret pattern fused into one alternation so a command is scanned
+# once; the named group that matched selects the replacement
+_REDACT_RE = re.compile(
+    r'(?P<aws_secret>AWS_SECRET_ACCESS_KEY=)[^\s]+'
+    r'|(?P<aws_key>AWS_ACCESS_KEY_ID=)[^\s]+'
+    r'|(?P<anthropic>ANTHROPIC_API_KEY=)[^\s]+'
+    r'|(?P<github_pat>GITHUB_PAT=)[^\s]+'
+    r'|(?P<gh_token>GH_TOKEN=)[^\s]+'
+    r'|(?P<anthropic_token>sk-ant-[^\s]+)'
+    r'|(?P<github_token>ghp_[^\s]+)'
+    r'|(?P<ssh_key>-var\s+["\']?ssh_public_key=[^\s"\']+)'
+)
+
+_REDACTIONS = {
+    'aws_secret': 'AWS_SECRET_ACCESS_KEY=***REDACTED***',
+    'aws_key': 'AWS_ACCESS_KEY_ID=***REDACTED***',
+    'anthropic': 'ANTHROPIC_API_KEY=***REDACTED***',
+    'github_pat': 'GITHUB_PAT=***REDACTED***',
+    'gh_token': 'GH_TOKEN=***REDACTED***',
+    'anthropic_token': '***REDACTED***',
+    'github_token': '***REDACTED***',
+    'ssh_key': '-var ssh_public_key=***REDACTED***',
+}
+
+
+# Literal substrings, one of which every _REDACT_RE match contains
+_SECRET_MARKERS = (
+    'AWS_', 'ANTHROPIC_', 'GITHUB_PAT', 'GH_TOKEN', 'sk-ant-', 'ghp_', 'ssh_public_key',
+)
+
+
+def _redact(match: "re.Match[str]") -> str:
+    """Replacement for one _REDACT_RE match."""
+    return _REDACTIONS[match.lastgroup]
+
+
 def sanitize_command_for_logging(command: str) -> str:
     """Sanitize command strings to redact sensitive information.
 
@@ -89,23 +199,12 @@ def sanitize_command_for_logging(command: str) -> str:
     Returns:
         Sanitized command with secrets redacted
     """
-    # Patterns to redact
-    patterns = [
-        (r'(AWS_SECRET_ACCESS_KEY=)[^\s]+', r'\1***REDACTED***'),
-        (r'(AWS_ACCESS_KEY_ID=)[^\s]+', r'\1***REDACTED***'),
-        (r'(ANTHROPIC_API_KEY=)[^\s]+', r'\1***REDACTED***'),
-        (r'(GITHUB_PAT=)[^\s]+', r'\1***REDACTED***'),
-        (r'(GH_TOKEN=)[^\s]+', r'\1***REDACTED***'),
-        (r'(sk-ant-[^\s]+)', r'***REDACTED***'),
-        (r'(ghp_[^\s]+)', r'***REDACTED***'),
-        (r'(-var\s+["\']?ssh_public_key=[^\s"\']+)', r'-var ssh_public_key=***REDACTED***'),
-    ]
+    # Most commands carry no secrets; plain substring checks are far
+    # cheaper than running the regex
+    if not any(marker in command for marker in _SECRET_MARKERS):
+        return command
 
-    sanitized = command
-    for pattern, replacement in patterns:
-        sanitized = re.sub(pattern, replacement, sanitized)
-
-    return sanitized
+    return _REDACT_RE.sub(_redact, command)
 
 
 def setup_dual_logger(
@@ -115,6 +214,9 @@ def setup_dual_logger(
 ) -> Tuple[logging.Logger, Path]:
     """Set up dual logging to both agents/ and ipe_logs/ directories.
 
+    Repeated calls with the same arguments return the already-configured
+    logger instead of opening new log files.
+
     Args:
         ipe_id: IPE workflow ID
         command: Command being executed
@@ -123,6 +225,11 @@ def setup_dual_logger(
     Returns:
         Tuple of (logger, ipe_logs_file_path)
     """
+    logger_name = f"ipe_{ipe_id}"
+    configured = _CONFIGURED.get(logger_name)
+    if configured and configured[0] == (command, trigger_type) and logger_name in _LISTENERS:
+        return logging.getLogger(logger_name), configured[1]
+
     project_root = get_project_root()
 
     # Create agents log directory (existing behavior)
@@ -134,19 +241,25 @@ def setup_dual_logger(
     ipe_logs_file, _ = get_log_file_path(command, ipe_id, failed=False)
 
     # Create logger with unique name
-    logger = logging.getLogger(f"ipe_{ipe_id}")
+    logger = logging.getLogger(logger_name)
     logger.setLevel(logging.DEBUG)
 
-    # Clear any existing handlers
+    # Close and clear any existing handlers (and the listener feeding old
+    # log files) so their file descriptors are released
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
+    _stop_listener(logger_name)
 
-    # File handler for agents/ directory
-    agents_handler = logging.FileHandler(agents_log_file, mode='a')
+    # File handler for agents/ directory; appended to, since the path is
+    # shared by every run of this workflow and trigger
+    agents_handler = BufferedFileHandler(agents_log_file, mode='a')
     agents_handler.setLevel(logging.DEBUG)
 
     # File handler for ipe_logs/ directory
-    ipe_logs_handler = logging.FileHandler(ipe_logs_file, mode='a')
+    ipe_logs_handler = BufferedFileHandler(ipe_logs_file, mode='a')
     ipe_logs_handler.setLevel(logging.DEBUG)
+    file_handlers = [agents_handler, ipe_logs_handler]
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -159,12 +272,21 @@ def setup_dual_logger(
     )
     console_formatter = logging.Formatter('%(message)s')
 
-    agents_handler.setFormatter(file_formatter)
-    ipe_logs_handler.setFormatter(file_formatter)
+    for handler in file_handlers:
+        handler.setFormatter(file_formatter)
     console_handler.setFormatter(console_formatter)
 
-    logger.addHandler(agents_handler)
-    logger.addHandler(ipe_logs_handler)
+    # File writes happen on a listener thread so callers only enqueue;
+    # the console stays synchronous to keep its ordering with other output
+    log_queue: queue.Queue = queue.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *file_handlers, respect_handler_level=True
+    )
+    listener.start()
+    _LISTENERS[logger_name] = listener
+    _CONFIGURED[logger_name] = ((command, trigger_type), ipe_logs_file)
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     logger.addHandler(console_handler)
 
     # Log initialization
@@ -196,11 +318,14 @@ def write_failure_log(
     Returns:
         Tuple of (command_log_path, failure_log_path)
     """
+    # Read the clock once for both the file names and the report
+    now = datetime.now()
+
     # Get log paths
-    command_log, failure_log = get_log_file_path(command, ipe_id, failed=True)
+    command_log, failure_log = get_log_file_path(command, ipe_id, failed=True, timestamp=now)
 
     # Build failure report
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
 
     report_lines = [
         "=" * 80,
@@ -247,8 +372,14 @@ def write_failure_log(
     # Write to command-specific log
     command_log.write_text(report)
 
-    # Copy to failures directory
-    failure_log.write_text(report)
+    # Link into failures directory (same content, no second write); copy
+    # when the filesystem can't link. A failure in the same second reuses
+    # the name, so drop any stale entry first.
+    failure_log.unlink(missing_ok=True)
+    try:
+        os.link(command_log, failure_log)
+    except OSError:
+        shutil.copyfile(command_log, failure_log)
 
     if logger:
         logger.debug(f"Failure log written to: {command_log}")
@@ -257,6 +388,23 @@ def write_failure_log(
     return command_log, failure_log
 
 
+def _walk_logs(root: Path) -> Iterator[Tuple[str, int, float]]:
+    """Yield (path, size, mtime) for every .log file under root.
+
+    Uses os.scandir so each file is stat'ed once for both size and mtime.
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".log"):
+                    st = entry.stat()
+                    yield entry.path, st.st_size, st.st_mtime
+
+
 def rotate_logs_if_needed(max_size_mb: int = 100, max_age_days: int = 30) -> None:
     """Rotate logs if they exceed size or age limits.
 
@@ -269,10 +417,9 @@ def rotate_logs_if_needed(max_size_mb: int = 100, max_age_days: int = 30) -> Non
     if not ipe_logs.exists():
         return
 
-    # Calculate total size
-    total_size = 0
-    for log_file in ipe_logs.rglob("*.log"):
-        total_size += log_file.stat().st_size
+    # One walk collects everything: total size now, mtime order if rotating
+    all_logs = list(_walk_logs(ipe_logs))
+    total_size = sum(size for _, size, _ in all_logs)
 
     total_size_mb = total_size / (1024 * 1024)
 
@@ -282,19 +429,17 @@ def rotate_logs_if_needed(max_size_mb: int = 100, max_age_days: int = 30) -> Non
         archive_name = f"ipe_logs_archive_{datetime.now().strftime('%Y-%m')}.tar.gz"
         archive_path = get_project_root() / archive_name
 
-        # Create archive (simple implementation - compress entire directory)
-        shutil.make_archive(
-            str(archive_path.with_suffix('')),
-            'gztar',
-            str(ipe_logs.parent),
-            'ipe_logs'
-        )
+        # Create archive (simple implementation - compress entire directory);
+        # gzip level 1 is much cheaper than make_archive's level 9 and
+        # plain-text logs still compress well
+        with tarfile.open(archive_path, "w:gz", compresslevel=1) as archive:
+            archive.add(str(ipe_logs), arcname="ipe_logs")
 
         # Clean old logs (keep last 100 files)
-        all_logs = sorted(ipe_logs.rglob("*.log"), key=lambda p: p.stat().st_mtime)
         if len(all_logs) > 100:
-            for old_log in all_logs[:-100]:
-                old_log.unlink()
+            all_logs.sort(key=lambda log: log[2])
+            for old_log, _, _ in all_logs[:-100]:
+                os.unlink(old_log)
 
 
 def display_failure_message(
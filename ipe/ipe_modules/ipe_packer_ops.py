@@ -1,9 +1,49 @@
-"""Packer operations for AMI builds."""
+"""Packer operations for AMI builds.
 
+Set IPE_PACKER_DEBUG=1 to run `packer build` with PACKER_LOG=1 (verbose
+debug logging); it is off by default because it multiplies output volume.
+"""
+
+import os
 import subprocess
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+
+def _run_streaming(
+    cmd: list[str],
+    cwd: Path,
+    logger: logging.Logger,
+    env: Optional[Dict[str, str]] = None
+) -> Tuple[int, str]:
+    """Run a command, logging its combined output line by line as it arrives.
+
+    Args:
+        cmd: Command and arguments
+        cwd: Working directory
+        logger: Logger instance
+        env: Environment for the child process (defaults to ours)
+
+    Returns:
+        Tuple of (return code, combined stdout and stderr)
+    """
+    # Keep the raw bytes and decode the whole output once at the end;
+    # only the logged copy of each line is decoded as it arrives
+    raw = bytearray()
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env=env
+    ) as proc:
+        for line in proc.stdout:
+            raw += line
+            logger.info(line.decode("utf-8", errors="replace").rstrip())
+        returncode = proc.wait()
+
+    return returncode, raw.decode("utf-8", errors="replace")
 
 
 def init_packer(packer_dir: Path, logger: logging.Logger) -> bool:
@@ -18,18 +58,12 @@ def init_packer(packer_dir: Path, logger: logging.Logger) -> bool:
     """
     logger.info("Initializing Packer...")
 
-    result = subprocess.run(
-        ["packer", "init", "app.pkr.hcl"],
-        cwd=packer_dir,
-        capture_output=True,
-        text=True
-    )
+    returncode, _ = _run_streaming(["packer", "init", "app.pkr.hcl"], packer_dir, logger)
 
-    if result.returncode != 0:
-        logger.error(f"Packer init failed: {result.stderr}")
+    if returncode != 0:
+        logger.error(f"Packer init failed (exit code {returncode})")
         return False
 
-    logger.info(result.stdout)
     return True
 
 
@@ -45,18 +79,12 @@ def validate_packer(packer_dir: Path, logger: logging.Logger) -> bool:
     """
     logger.info("Validating Packer template...")
 
-    result = subprocess.run(
-        ["packer", "validate", "app.pkr.hcl"],
-        cwd=packer_dir,
-        capture_output=True,
-        text=True
-    )
+    returncode, _ = _run_streaming(["packer", "validate", "app.pkr.hcl"], packer_dir, logger)
 
-    if result.returncode != 0:
-        logger.error(f"Packer validation failed: {result.stderr}")
+    if returncode != 0:
+        logger.error(f"Packer validation failed (exit code {returncode})")
         return False
 
-    logger.info(result.stdout)
     return True
 
 
@@ -69,6 +97,9 @@ def build_packer_ami(
 ) -> tuple[bool, Optional[str]]:
     """Build Packer AMI.
 
+    Output is logged line by line while the build runs rather than
+    buffered until it finishes.
+
     Args:
         packer_dir: Packer directory
         logger: Logger instance
@@ -77,7 +108,8 @@ def build_packer_ami(
         environment: Environment (optional)
 
     Returns:
-        Tuple of (success, output) where output contains Packer stdout
+        Tuple of (success, output) where output contains Packer's combined
+        stdout and stderr (also on failure, for failure logs)
     """
     logger.info("Building AMI (this will take 5-10 minutes)...")
 
@@ -94,22 +126,16 @@ def build_packer_ami(
 
     cmd.append("app.pkr.hcl")
 
-    # Enable Packer debug logging
-    import os
-    env = os.environ.copy()
-    env["PACKER_LOG"] = "1"
+    # Enable Packer debug logging only when asked for
+    env = None
+    if os.environ.get("IPE_PACKER_DEBUG") == "1":
+        env = os.environ.copy()
+        env["PACKER_LOG"] = "1"
 
-    result = subprocess.run(
-        cmd,
-        cwd=packer_dir,
-        capture_output=True,
-        text=True,
-        env=env
-    )
+    returncode, output = _run_streaming(cmd, packer_dir, logger, env=env)
 
-    if result.returncode != 0:
-        logger.error(f"Packer build failed: {result.stderr}")
-        return False, None
+    if returncode != 0:
+        logger.error(f"Packer build failed (exit code {returncode})")
+        return False, output
 
-    logger.info(result.stdout)
-    return True, result.stdout
+    return True, output
@@ -10,6 +10,24 @@ import sys
 import logging
 from typing import Dict, Any, Optional
 from .ipe_data_types import IPEStateData
+from .ipe_utils import dumps_json_bytes as _dumps, loads_json as _loads
+
+_LOG = logging.getLogger(__name__)
+
+# Fields persisted by IPEState.save() and their defaults, taken from the
+# model so the two can't drift apart. Validation happens on load.
+_STATE_DEFAULTS: Dict[str, Any] = {
+    name: None if field.is_required() else field.get_default(call_default_factory=True)
+    for name, field in IPEStateData.model_fields.items()
+}
+
+# Keys update() accepts: the persisted fields
+_CORE_FIELDS = frozenset(_STATE_DEFAULTS)
+
+# Main repo path (parent of the ipe directory); __file__ never changes
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
 
 
 class IPEState:
@@ -29,20 +47,40 @@ class IPEState:
         self.ipe_id = ipe_id
         # Start with minimal state
         self.data: Dict[str, Any] = {"ipe_id": self.ipe_id}
-        self.logger = logging.getLogger(__name__)
+        self._state_path = os.path.join(
+            _PROJECT_ROOT, "agents", ipe_id, self.STATE_FILENAME
+        )
 
     def update(self, **kwargs):
         """Update state with new key-value pairs."""
         # Filter to only our core fields
-        core_fields = {"ipe_id", "issue_number", "branch_name", "spec_file", "issue_class", "worktree_path", "environment", "terraform_dir", "model_set", "all_ipes"}
         for key, value in kwargs.items():
-            if key in core_fields:
+            if key in _CORE_FIELDS:
                 self.data[key] = value
 
     def get(self, key: str, default=None):
         """Get value from state by key."""
         return self.data.get(key, default)
 
+    def set(self, key: str, value: Any) -> None:
+        """Set an in-memory value (only core fields are persisted by save)."""
+        self.data[key] = value
+
+    def get_log_path(self, name: str) -> str:
+        """Get path to an append-only JSON-lines log for this IPE ID."""
+        return os.path.join(os.path.dirname(self.get_state_path()), f"{name}.jsonl")
+
+    def append(self, name: str, entry: Dict[str, Any]) -> None:
+        """Append an entry to agents/{ipe_id}/{name}.jsonl.
+
+        History-style data goes here instead of into ipe_state.json so each
+        new entry is one appended line rather than a rewrite of the list.
+        """
+        log_path = self.get_log_path(name)
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        with open(log_path, "ab") as f:
+            f.write(_dumps(entry) + b"\n")
+
     def append_ipe_id(self, ipe_id: str):
         """Append an IPE ID to the all_ipes list if not already present."""
         all_ipes = self.data.get("all_ipes", [])
@@ -61,60 +99,45 @@ class IPEState:
             return worktree_path
 
         # Return main repo path (parent of ipe directory)
-        return os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
+        return _PROJECT_ROOT
 
     def get_state_path(self) -> str:
         """Get path to state file."""
-        project_root = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        return os.path.join(project_root, "agents", self.ipe_id, self.STATE_FILENAME)
+        return self._state_path
 
     def save(self, workflow_step: Optional[str] = None) -> None:
         """Save state to file in agents/{ipe_id}/ipe_state.json."""
         state_path = self.get_state_path()
         os.makedirs(os.path.dirname(state_path), exist_ok=True)
 
-        # Create IPEStateData for validation
-        state_data = IPEStateData(
-            ipe_id=self.data.get("ipe_id"),
-            issue_number=self.data.get("issue_number"),
-            branch_name=self.data.get("branch_name"),
-            spec_file=self.data.get("spec_file"),
-            issue_class=self.data.get("issue_class"),
-            worktree_path=self.data.get("worktree_path"),
-            environment=self.data.get("environment", "sandbox"),
-            terraform_dir=self.data.get("terraform_dir"),
-            model_set=self.data.get("model_set", "base"),
-            all_ipes=self.data.get("all_ipes", []),
-        )
+        # self.data is already in IPEStateData's shape; dump the persisted
+        # fields directly instead of re-validating them on every save
+        payload = {
+            name: self.data.get(name, default)
+            for name, default in _STATE_DEFAULTS.items()
+        }
 
         # Save as JSON
-        with open(state_path, "w") as f:
-            json.dump(state_data.model_dump(), f, indent=2)
+        with open(state_path, "wb") as f:
+            f.write(_dumps(payload, pretty=True))
 
-        self.logger.info(f"Saved state to {state_path}")
+        _LOG.info(f"Saved state to {state_path}")
         if workflow_step:
-            self.logger.info(f"State updated by: {workflow_step}")
+            _LOG.info(f"State updated by: {workflow_step}")
 
     @classmethod
     def load(
         cls, ipe_id: str, logger: Optional[logging.Logger] = None
     ) -> Optional["IPEState"]:
         """Load state from file if it exists."""
-        project_root = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        state_path = os.path.join(project_root, "agents", ipe_id, cls.STATE_FILENAME)
+        state_path = os.path.join(_PROJECT_ROOT, "agents", ipe_id, cls.STATE_FILENAME)
 
         if not os.path.exists(state_path):
             return None
 
         try:
-            with open(state_path, "r") as f:
-                data = json.load(f)
+            with open(state_path, "rb") as f:
+                data = _loads(f.read())
 
             # Validate with IPEStateData
             state_data = IPEStateData(**data)
@@ -125,7 +148,7 @@ class IPEState:
 
             if logger:
                 logger.info(f"🔍 Found existing state from {state_path}")
-                logger.info(f"State: {json.dumps(state_data.model_dump(), indent=2)}")
+                logger.info(f"State: {_dumps(state_data.model_dump(), pretty=True).decode()}")
 
             return state
         except Exception as e:
@@ -142,17 +165,20 @@ class IPEState:
         if sys.stdin.isatty():
             return None
         try:
-            input_data = sys.stdin.read()
+            # Parse the raw bytes; both JSON backends accept them, which
+            # skips decoding stdin to str first
+            stream = getattr(sys.stdin, "buffer", sys.stdin)
+            input_data = stream.read()
             if not input_data.strip():
                 return None
-            data = json.loads(input_data)
+            data = _loads(input_data)
             ipe_id = data.get("ipe_id")
             if not ipe_id:
                 return None  # No valid state without ipe_id
             state = cls(ipe_id)
             state.data = data
             return state
-        except (json.JSONDecodeError, EOFError):
+        except (json.JSONDecodeError, UnicodeDecodeError, EOFError):
             return None
 
     def to_stdout(self):
@@ -169,4 +195,14 @@ class IPEState:
             "terraform_dir": self.data.get("terraform_dir"),
             "all_ipes": self.data.get("all_ipes", []),
         }
-        print(json.dumps(output_data, indent=2))
+        payload = _dumps(output_data, pretty=True) + b"\n"
+        stream = getattr(sys.stdout, "buffer", None)
+        if stream is None:
+            # stdout replaced by a text-only stream (e.g. in tests)
+            sys.stdout.write(payload.decode())
+            return
+
+        # Flush pending text first so earlier prints stay ahead of the JSON
+        sys.stdout.flush()
+        stream.write(payload)
+        stream.flush()
@@ -1,22 +1,108 @@
 """Utility functions for IPE (Infrastructure Platform Engineer) system."""
 
+import functools
 import json
 import logging
 import os
 import re
+import subprocess
 import sys
 import uuid
 from datetime import datetime
-from typing import Any, TypeVar, Type, Union, Dict, Optional
+from typing import Any, Callable, TypeVar, Type, Union, Dict, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 T = TypeVar('T')
 
 
+def dumps_json_bytes(
+    obj: Any, pretty: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        obj: Object to serialize
+        pretty: Indent with two spaces
+        default: Fallback for unsupported types, as in json.dumps
+
+    Returns:
+        Encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        if default is not None:
+            # Let default() render datetimes, matching json.dumps(default=str)
+            option |= orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(obj, indent=2 if pretty else None, default=default).encode()
+
+
+def dumps_json(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize to a JSON string, using orjson when it is installed."""
+    return dumps_json_bytes(obj, default=default).decode()
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed.
+
+    Falls back to the stdlib for input orjson rejects but json accepts
+    (NaN, integers wider than 64 bits). Raises json.JSONDecodeError, which
+    orjson.JSONDecodeError subclasses.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def make_ipe_id() -> str:
     """Generate a short 8-character UUID for IPE tracking."""
     return str(uuid.uuid4())[:8]
 
 
+def git_output(cwd: str, *args: str) -> Optional[str]:
+    """Run a read-only git command and return its stripped stdout.
+
+    Not cached: HEAD, branch, describe and status answers change whenever
+    the workflow checks out, commits or edits files.
+
+    Returns:
+        Command stdout, or None if git exited non-zero
+    """
+    result = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+
+    if result.returncode != 0:
+        return None
+
+    return result.stdout.decode("utf-8", errors="replace").strip()
+
+
+@functools.lru_cache(maxsize=None)
+def git_layout_output(cwd: str, *args: str) -> Optional[str]:
+    """git_output for repository-layout queries, cached per working directory.
+
+    Only for answers that are fixed for a directory, such as
+    rev-parse --show-toplevel, --git-common-dir and --show-cdup; anything
+    that depends on HEAD, the index or the work tree must use git_output.
+
+    Returns:
+        Command stdout, or None if git exited non-zero
+    """
+    return git_output(cwd, *args)
+
+
 def setup_logger(ipe_id: str, trigger_type: str = "ipe_plan_iso") -> logging.Logger:
     """Set up logger that writes to both console and file using ipe_id.
 
@@ -134,7 +220,7 @@ def parse_json(text: str, target_type: Type[T] = None) -> Union[T, Any]:
                 json_str = json_str[obj_start:obj_end + 1]
     
     try:
-        result = json.loads(json_str)
+        result = loads_json(json_str)
         
         # If target_type is provided and has from_dict/parse_obj/model_validate methods (Pydantic)
         if target_type and hasattr(target_type, '__origin__'):
@@ -1,12 +1,16 @@
 """Shared Infrastructure Platform Engineer (IPE) workflow operations."""
 
-import glob
+import functools
+import hashlib
 import json
 import logging
 import os
 import subprocess
 import re
-from typing import Tuple, Optional
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, List, Tuple, Optional
 from .ipe_data_types import (
     AgentTemplateRequest,
     GitHubIssue,
@@ -16,9 +20,36 @@ from .ipe_data_types import (
     RetryCode,
 )
 from .ipe_agent import execute_template
-from .ipe_github import get_repo_url, extract_repo_path, IPE_BOT_IDENTIFIER
+from .ipe_github import (
+    get_repo_url,
+    extract_repo_path,
+    create_pull_request_rest,
+    IPE_BOT_IDENTIFIER,
+)
 from .ipe_state import IPEState
-from .ipe_utils import parse_json
+from .ipe_utils import dumps_json, parse_json
+
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+
+# Project root (parent of the ipe directory) and its agents/ directory
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+_AGENTS_DIR = os.path.join(_PROJECT_ROOT, "agents")
+
+# Seconds a slash-command existence check is reused, so edits still show up
+_COMMAND_EXISTS_TTL = 2.0
+
+
+@functools.lru_cache(maxsize=256)
+def _path_exists_recently(path: str, time_bucket: int) -> bool:
+    """os.path.exists(), cached per path for the current time bucket."""
+    return os.path.exists(path)
 
 
 def validate_slash_command_exists(
@@ -41,12 +72,14 @@ def validate_slash_command_exists(
         full_path = os.path.join(working_dir, relative_path)
     else:
         # Default to project root
-        project_root = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        full_path = os.path.join(project_root, relative_path)
+        full_path = os.path.join(_PROJECT_ROOT, relative_path)
 
-    return os.path.exists(full_path), full_path
+    # Key the cache on the absolute path so a relative working_dir can't
+    # reuse an answer given for another cwd
+    exists = _path_exists_recently(
+        os.path.abspath(full_path), int(time.monotonic() // _COMMAND_EXISTS_TTL)
+    )
+    return exists, full_path
 
 
 # Agent name constants
@@ -58,8 +91,8 @@ AGENT_CLASSIFIER = "issue_classifier"
 AGENT_BRANCH_GENERATOR = "branch_generator"
 AGENT_PR_CREATOR = "pr_creator"
 
-# Available ADW workflows for runtime validation
-AVAILABLE_ADW_WORKFLOWS = [
+# Available ADW workflows for runtime validation (ordered, for display)
+AVAILABLE_ADW_WORKFLOWS_ORDERED: Tuple[str, ...] = (
     # Isolated workflows (all workflows are now iso-based)
     "adw_plan_iso",
     "adw_patch_iso",
@@ -75,10 +108,13 @@ AVAILABLE_ADW_WORKFLOWS = [
     "adw_plan_build_document_iso",
     "adw_plan_build_review_iso",
     "adw_sdlc_iso",
-]
+)
 
-# Available IPE workflows for runtime validation
-AVAILABLE_IPE_WORKFLOWS = [
+# Set form for O(1) membership checks
+AVAILABLE_ADW_WORKFLOWS: FrozenSet[str] = frozenset(AVAILABLE_ADW_WORKFLOWS_ORDERED)
+
+# Available IPE workflows for runtime validation (ordered, for display)
+AVAILABLE_IPE_WORKFLOWS_ORDERED: Tuple[str, ...] = (
     # Isolated workflows (all workflows are now iso-based)
     "ipe_plan_iso",
     "ipe_patch_iso",
@@ -95,7 +131,38 @@ AVAILABLE_IPE_WORKFLOWS = [
     "ipe_plan_build_document_iso",
     "ipe_plan_build_review_iso",
     "ipe_sdlc_iso",
-]
+)
+
+# Set form for O(1) membership checks
+AVAILABLE_IPE_WORKFLOWS: FrozenSet[str] = frozenset(AVAILABLE_IPE_WORKFLOWS_ORDERED)
+
+
+# Classifier output: a slash command, or "0" when none applies
+_CLASSIFY_RE = re.compile(r"(/ipe_chore|/ipe_bug|/ipe_feature|0)")
+_VALID_ISSUE_COMMANDS = frozenset({"/ipe_chore", "/ipe_bug", "/ipe_feature"})
+
+# Issue number embedded in a standardized branch name
+_ISSUE_NUM_RE = re.compile(r"issue-(\d+)")
+
+# Opening fence line and closing fence of a markdown code block
+_FENCE_RE = re.compile(r"\A```[^\n]*\n?|\n?[ \t]*```\Z")
+
+
+def _minimal_issue_json(issue: GitHubIssue) -> str:
+    """Serialize just the number, title and body agents need from an issue.
+
+    Builds the same compact JSON as issue.model_dump_json(include=...) but
+    straight from the three scalar fields, without pydantic's serializer.
+    """
+    return json.dumps(
+        {"number": issue.number, "title": issue.title, "body": issue.body},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+# Prefix of every comment the bot posts (see format_issue_message)
+_BOT_PREFIX = f"{IPE_BOT_IDENTIFIER} "
 
 
 def format_issue_message(
@@ -103,9 +170,12 @@ def format_issue_message(
 ) -> str:
     """Format a message for issue comments with ADW tracking and bot identifier."""
     # Always include IPE_BOT_IDENTIFIER to prevent webhook loops
-    if session_id:
-        return f"{IPE_BOT_IDENTIFIER} {ipe_id}_{agent_name}_{session_id}: {message}"
-    return f"{IPE_BOT_IDENTIFIER} {ipe_id}_{agent_name}: {message}"
+    session_suffix = f"_{session_id}" if session_id else ""
+    return f"{_BOT_PREFIX}{ipe_id}_{agent_name}{session_suffix}: {message}"
+
+
+# Shared result for every failed or unrecognised extraction
+_EMPTY_EXTRACTION = IPEExtractionResult()
 
 
 def extract_adw_info(text: str, temp_ipe_id: str) -> IPEExtractionResult:
@@ -125,7 +195,7 @@ def extract_adw_info(text: str, temp_ipe_id: str) -> IPEExtractionResult:
 
         if not response.success:
             print(f"Failed to classify ADW: {response.output}")
-            return IPEExtractionResult()  # Empty result
+            return _EMPTY_EXTRACTION
 
         # Parse JSON response using utility that handles markdown
         try:
@@ -144,15 +214,15 @@ def extract_adw_info(text: str, temp_ipe_id: str) -> IPEExtractionResult:
                     model_set=model_set
                 )
 
-            return IPEExtractionResult()  # Empty result
+            return _EMPTY_EXTRACTION
 
         except ValueError as e:
             print(f"Failed to parse classify_adw response: {e}")
-            return IPEExtractionResult()  # Empty result
+            return _EMPTY_EXTRACTION
 
     except Exception as e:
         print(f"Error calling classify_adw: {e}")
-        return IPEExtractionResult()  # Empty result
+        return _EMPTY_EXTRACTION
 
 
 def extract_ipe_info(text: str, temp_ipe_id: str) -> IPEExtractionResult:
@@ -172,7 +242,7 @@ def extract_ipe_info(text: str, temp_ipe_id: str) -> IPEExtractionResult:
 
         if not response.success:
             print(f"Failed to classify IPE: {response.output}")
-            return IPEExtractionResult()  # Empty result
+            return _EMPTY_EXTRACTION
 
         # Parse JSON response using utility that handles markdown
         try:
@@ -191,15 +261,60 @@ def extract_ipe_info(text: str, temp_ipe_id: str) -> IPEExtractionResult:
                     model_set=model_set
                 )
 
-            return IPEExtractionResult()  # Empty result
+            return _EMPTY_EXTRACTION
 
         except ValueError as e:
             print(f"Failed to parse classify_ipe response: {e}")
-            return IPEExtractionResult()  # Empty result
+            return _EMPTY_EXTRACTION
 
     except Exception as e:
         print(f"Error calling classify_ipe: {e}")
-        return IPEExtractionResult()  # Empty result
+        return _EMPTY_EXTRACTION
+
+
+# Concurrent classifier calls made by the *_batch extractors
+_EXTRACT_BATCH_WORKERS = 4
+
+
+def _extract_batch(
+    extract: Callable[[str, str], IPEExtractionResult],
+    texts: List[str],
+    temp_ipe_id: str,
+) -> List[IPEExtractionResult]:
+    """Run an extractor over several texts concurrently, preserving order.
+
+    Each text gets its own temp ID ({temp_ipe_id}-{index}) because the
+    agent writes its output under agents/{ipe_id}/, which concurrent calls
+    must not share.
+    """
+    if len(texts) <= 1:
+        return [extract(text, temp_ipe_id) for text in texts]
+
+    temp_ids = [f"{temp_ipe_id}-{index}" for index in range(len(texts))]
+    with ThreadPoolExecutor(max_workers=min(_EXTRACT_BATCH_WORKERS, len(texts))) as pool:
+        return list(pool.map(extract, texts, temp_ids))
+
+
+def extract_adw_info_batch(
+    texts: List[str], temp_ipe_id: str
+) -> List[IPEExtractionResult]:
+    """Extract ADW workflow info from several texts concurrently.
+    Returns one IPEExtractionResult per text, in input order."""
+    return _extract_batch(extract_adw_info, texts, temp_ipe_id)
+
+
+def extract_ipe_info_batch(
+    texts: List[str], temp_ipe_id: str
+) -> List[IPEExtractionResult]:
+    """Extract IPE workflow info from several texts concurrently.
+    Returns one IPEExtractionResult per text, in input order."""
+    return _extract_batch(extract_ipe_info, texts, temp_ipe_id)
+
+
+# blake2b digest of an issue's minimal JSON -> its classification, oldest
+# first; only successful classifications are kept
+_CLASSIFY_CACHE: "OrderedDict[bytes, IssueClassSlashCommand]" = OrderedDict()
+_CLASSIFY_CACHE_SIZE = 1024
 
 
 def classify_issue(
@@ -210,9 +325,15 @@ def classify_issue(
 
     # Use the classify_issue slash command template with minimal payload
     # Only include the essential fields: number, title, body
-    minimal_issue_json = issue.model_dump_json(
-        by_alias=True, include={"number", "title", "body"}
-    )
+    minimal_issue_json = _minimal_issue_json(issue)
+
+    # Retries and repeated ticks see the same issue; reuse its classification
+    cache_key = hashlib.blake2b(minimal_issue_json.encode(), digest_size=16).digest()
+    cached = _CLASSIFY_CACHE.get(cache_key)
+    if cached is not None:
+        _CLASSIFY_CACHE.move_to_end(cache_key)
+        logger.debug(f"Using cached classification for issue: {issue.title}")
+        return cached, None
 
     request = AgentTemplateRequest(
         agent_name=AGENT_CLASSIFIER,
@@ -237,7 +358,7 @@ def classify_issue(
 
     # Look for the classification pattern in the output
     # Claude might add explanation, so we need to extract just the command
-    classification_match = re.search(r"(/ipe_chore|/ipe_bug|/ipe_feature|0)", output)
+    classification_match = _CLASSIFY_RE.search(output)
 
     if classification_match:
         issue_command = classification_match.group(1)
@@ -247,9 +368,13 @@ def classify_issue(
     if issue_command == "0":
         return None, f"No command selected: {response.output}"
 
-    if issue_command not in ["/ipe_chore", "/ipe_bug", "/ipe_feature"]:
+    if issue_command not in _VALID_ISSUE_COMMANDS:
         return None, f"Invalid command selected: {response.output}"
 
+    _CLASSIFY_CACHE[cache_key] = issue_command
+    if len(_CLASSIFY_CACHE) > _CLASSIFY_CACHE_SIZE:
+        _CLASSIFY_CACHE.popitem(last=False)
+
     return issue_command, None  # type: ignore
 
 
@@ -276,9 +401,7 @@ def build_plan(
         )
 
     # Use minimal payload like classify_issue does
-    minimal_issue_json = issue.model_dump_json(
-        by_alias=True, include={"number", "title", "body"}
-    )
+    minimal_issue_json = _minimal_issue_json(issue)
 
     issue_plan_template_request = AgentTemplateRequest(
         agent_name=AGENT_PLANNER,
@@ -320,15 +443,17 @@ def implement_plan(
         working_dir=working_dir,
     )
 
-    logger.debug(
-        f"implement_template_request: {implement_template_request.model_dump_json(indent=2, by_alias=True)}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"implement_template_request: {implement_template_request.model_dump_json(indent=2, by_alias=True)}"
+        )
 
     implement_response = execute_template(implement_template_request)
 
-    logger.debug(
-        f"implement_response: {implement_response.model_dump_json(indent=2, by_alias=True)}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"implement_response: {implement_response.model_dump_json(indent=2, by_alias=True)}"
+        )
 
     return implement_response
 
@@ -345,9 +470,7 @@ def generate_branch_name(
     issue_type = issue_class.replace("/", "")
 
     # Use minimal payload like classify_issue does
-    minimal_issue_json = issue.model_dump_json(
-        by_alias=True, include={"number", "title", "body"}
-    )
+    minimal_issue_json = _minimal_issue_json(issue)
 
     request = AgentTemplateRequest(
         agent_name=AGENT_BRANCH_GENERATOR,
@@ -365,13 +488,7 @@ def generate_branch_name(
 
     # Strip markdown code fences if present
     if branch_name.startswith("```"):
-        lines = branch_name.split("\n")
-        # Remove first and last lines if they are code fences
-        if lines[0].startswith("```"):
-            lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        branch_name = "\n".join(lines).strip()
+        branch_name = _FENCE_RE.sub("", branch_name).strip()
 
     logger.info(f"Generated branch name: {branch_name}")
     return branch_name, None
@@ -394,9 +511,7 @@ def create_commit(
     unique_agent_name = f"{agent_name}_committer"
 
     # Use minimal payload like classify_issue does
-    minimal_issue_json = issue.model_dump_json(
-        by_alias=True, include={"number", "title", "body"}
-    )
+    minimal_issue_json = _minimal_issue_json(issue)
 
     request = AgentTemplateRequest(
         agent_name=unique_agent_name,
@@ -433,25 +548,21 @@ def create_pull_request(
     # If we don't have issue data, try to construct minimal data
     if not issue:
         issue_data = state.get("issue", {})
-        issue_json = json.dumps(issue_data) if issue_data else "{}"
+        issue_json = dumps_json(issue_data) if issue_data else "{}"
+    elif isinstance(issue, dict) and "number" in issue and "title" in issue:
+        # Only three scalar fields are sent, so no need to validate the model
+        issue_json = json.dumps(
+            {"number": issue["number"], "title": issue["title"], "body": issue.get("body")},
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
     elif isinstance(issue, dict):
-        # Try to reconstruct as GitHubIssue model which handles datetime serialization
-        from .ipe_data_types import GitHubIssue
-
-        try:
-            issue_model = GitHubIssue(**issue)
-            # Use minimal payload like classify_issue does
-            issue_json = issue_model.model_dump_json(
-                by_alias=True, include={"number", "title", "body"}
-            )
-        except Exception:
-            # Fallback: use json.dumps with default str converter for datetime
-            issue_json = json.dumps(issue, default=str)
+        # Not an issue payload; use json.dumps with default str converter for datetime
+        issue_json = dumps_json(issue, default=str)
     else:
         # Use minimal payload like classify_issue does
-        issue_json = issue.model_dump_json(
-            by_alias=True, include={"number", "title", "body"}
-        )
+        issue_json = _minimal_issue_json(issue)
 
     request = AgentTemplateRequest(
         agent_name=AGENT_PR_CREATOR,
@@ -471,12 +582,71 @@ def create_pull_request(
     return pr_url, None
 
 
+def create_pull_request_api(
+    branch_name: str,
+    issue: GitHubIssue,
+    state: IPEState,
+    logger: logging.Logger,
+) -> Tuple[Optional[str], Optional[str]]:
+    """Create a pull request directly through the GitHub REST API.
+
+    Builds the same title format as /ipe_pull_request without running the
+    agent or gh. The branch must already be pushed.
+    Returns (pr_url, error_message) tuple."""
+    issue_type = (state.get("issue_class") or "/ipe_feature").replace("/", "")
+    spec_file = state.get("spec_file")
+    ipe_id = state.get("ipe_id")
+
+    title = f"{issue_type}: #{issue.number} - {issue.title}"
+    body_lines = ["## Summary", "", issue.title, ""]
+    if spec_file:
+        body_lines += [f"Implementation plan: `{spec_file}`", ""]
+    body_lines += [f"Closes #{issue.number}", "", f"IPE ID: `{ipe_id}`"]
+
+    try:
+        repo_path = extract_repo_path(get_repo_url())
+        pr_url = create_pull_request_rest(
+            repo_path, branch_name, title, "\n".join(body_lines)
+        )
+    except (ValueError, RuntimeError) as e:
+        return None, str(e)
+
+    logger.info(f"Created pull request: {pr_url}")
+    return pr_url, None
+
+
+def _find_first_spec(
+    specs_dir: str, matches: Callable[[str], bool]
+) -> Optional[str]:
+    """Return the first visible *.md file in specs_dir whose name matches.
+
+    Scans the directory once and stops at the first hit.
+
+    Args:
+        specs_dir: Directory holding spec files
+        matches: Predicate on the file name
+
+    Returns:
+        Path joined onto specs_dir, or None if nothing matches
+    """
+    try:
+        with os.scandir(specs_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".md") and not name.startswith(".") and matches(name):
+                    return entry.path
+    except FileNotFoundError:
+        pass
+    return None
+
+
 def ensure_plan_exists(state: IPEState, issue_number: str) -> str:
     """Find or error if no plan exists for issue.
     Used by isolated build workflows in standalone mode."""
     # Check if plan file is in state
-    if state.get("spec_file"):
-        return state.get("spec_file")
+    spec_file = state.get("spec_file")
+    if spec_file:
+        return spec_file
 
     # Check current branch
     from .ipe_git_ops import get_current_branch
@@ -486,9 +656,11 @@ def ensure_plan_exists(state: IPEState, issue_number: str) -> str:
     # Look for plan in branch name
     if f"-{issue_number}-" in branch:
         # Look for plan file
-        plans = glob.glob(f"specs/*{issue_number}*.md")
-        if plans:
-            return plans[0]
+        plan = _find_first_spec(
+            "specs", lambda name: str(issue_number) in name
+        )
+        if plan:
+            return plan
 
     # No plan found
     raise ValueError(
@@ -544,24 +716,65 @@ def ensure_ipe_id(
     return new_ipe_id
 
 
+# How long a listing of branch names is reused before git is asked again
+_BRANCH_CACHE_TTL = 5.0
+
+# Absolute cwd -> (time listed, branch names with refs/heads/ or
+# refs/remotes/origin/ stripped)
+_BRANCH_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+
+
+def invalidate_branch_cache(cwd: Optional[str] = None) -> None:
+    """Forget cached branch names for a checkout (e.g. after creating one)."""
+    _BRANCH_CACHE.pop(os.path.abspath(cwd or os.getcwd()), None)
+
+
+def _list_branches(cwd: Optional[str] = None) -> Optional[List[str]]:
+    """List local and origin branch names, reusing a listing for a few seconds.
+
+    Returns:
+        Branch names, or None if git failed
+    """
+    key = os.path.abspath(cwd or os.getcwd())
+    cached = _BRANCH_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _BRANCH_CACHE_TTL:
+        return cached[1]
+
+    # Stream refs line by line rather than buffering the whole listing
+    branches = []
+    with subprocess.Popen(
+        ["git", "for-each-ref", "--format=%(refname)", "refs/heads", "refs/remotes/origin"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        cwd=cwd,
+    ) as proc:
+        for line in proc.stdout:
+            ref = line.rstrip("\n")
+            if ref.startswith("refs/heads/"):
+                branches.append(ref[len("refs/heads/"):])
+            else:
+                branches.append(ref[len("refs/remotes/origin/"):])
+
+    if proc.returncode != 0:
+        return None
+
+    _BRANCH_CACHE[key] = (time.monotonic(), branches)
+    return branches
+
+
 def find_existing_branch_for_issue(
     issue_number: str, ipe_id: Optional[str] = None, cwd: Optional[str] = None
 ) -> Optional[str]:
     """Find an existing branch for the given issue number.
     Returns branch name if found, None otherwise."""
     # List all branches
-    result = subprocess.run(
-        ["git", "branch", "-a"], capture_output=True, text=True, cwd=cwd
-    )
-
-    if result.returncode != 0:
+    branches = _list_branches(cwd)
+    if branches is None:
         return None
 
-    branches = result.stdout.strip().split("\n")
-
     # Look for branch with standardized pattern: *-issue-{issue_number}-adw-{ipe_id}-*
     for branch in branches:
-        branch = branch.strip().replace("* ", "").replace("remotes/origin/", "")
         # Check for the standardized pattern
         if f"-issue-{issue_number}-" in branch:
             if ipe_id and f"-adw-{ipe_id}-" in branch:
@@ -578,28 +791,26 @@ def find_plan_for_issue(
 ) -> Optional[str]:
     """Find plan file for the given issue number and optional ipe_id.
     Returns path to plan file if found, None otherwise."""
-    import os
-
-    # Get project root
-    project_root = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    agents_dir = os.path.join(project_root, "agents")
-
-    if not os.path.exists(agents_dir):
+    if not os.path.exists(_AGENTS_DIR):
         return None
 
     # If ipe_id is provided, check specific directory first
     if ipe_id:
-        plan_path = os.path.join(agents_dir, ipe_id, AGENT_PLANNER, "plan.md")
+        plan_path = os.path.join(_AGENTS_DIR, ipe_id, AGENT_PLANNER, "plan.md")
         if os.path.exists(plan_path):
             return plan_path
 
     # Otherwise, search all agent directories
-    for agent_id in os.listdir(agents_dir):
-        agent_path = os.path.join(agents_dir, agent_id)
-        if os.path.isdir(agent_path):
-            plan_path = os.path.join(agent_path, AGENT_PLANNER, "plan.md")
+    return _first_agent_plan()
+
+
+def _first_agent_plan() -> Optional[str]:
+    """Return the first planner plan.md found under the agents directory."""
+    with os.scandir(_AGENTS_DIR) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            plan_path = os.path.join(entry.path, AGENT_PLANNER, "plan.md")
             if os.path.exists(plan_path):
                 # Check if this plan is for our issue by reading branch info or checking commits
                 # For now, return the first plan found (can be improved)
@@ -608,6 +819,127 @@ def find_plan_for_issue(
     return None
 
 
+def find_plans_for_issues(
+    issues: Dict[str, Optional[str]]
+) -> Dict[str, Optional[str]]:
+    """Batch form of find_plan_for_issue.
+
+    Args:
+        issues: Mapping of issue number to optional ipe_id
+
+    Returns:
+        Mapping of issue number to plan file path (or None)
+    """
+    if not os.path.exists(_AGENTS_DIR):
+        return {issue_number: None for issue_number in issues}
+
+    plans: Dict[str, Optional[str]] = {}
+    unresolved = []
+    for issue_number, ipe_id in issues.items():
+        if ipe_id:
+            plan_path = os.path.join(_AGENTS_DIR, ipe_id, AGENT_PLANNER, "plan.md")
+            if os.path.exists(plan_path):
+                plans[issue_number] = plan_path
+                continue
+        unresolved.append(issue_number)
+
+    # The fallback search doesn't depend on the issue, so walk the agents
+    # directory once for all of them
+    if unresolved:
+        fallback = _first_agent_plan()
+        for issue_number in unresolved:
+            plans[issue_number] = fallback
+
+    return plans
+
+
+def _checkout_branch(branch_name: str, cwd: Optional[str] = None) -> Tuple[bool, str]:
+    """Check out a branch, in-process via pygit2 when the branch is local.
+
+    Falls back to `git checkout` (which also creates tracking branches for
+    remote-only names) when pygit2 is missing or can't do the checkout.
+
+    Returns:
+        (success, error_output) tuple
+    """
+    if PYGIT2_AVAILABLE:
+        try:
+            repo_path = pygit2.discover_repository(cwd or os.getcwd())
+            if repo_path:
+                repo = pygit2.Repository(repo_path)
+                if branch_name in repo.branches.local:
+                    repo.checkout(f"refs/heads/{branch_name}")
+                    return True, ""
+        except pygit2.GitError:
+            pass  # e.g. local changes conflict; let git report it
+
+    result = subprocess.run(
+        ["git", "checkout", branch_name],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+    )
+    return result.returncode == 0, result.stderr
+
+
+# Title/label hints used to guess an issue's class before the classifier answers
+_BUG_HINT_RE = re.compile(r"\b(bug|fix(es|ed)?|error|fail(s|ed|ure)?|broken|crash(es)?)\b", re.IGNORECASE)
+_CHORE_HINT_RE = re.compile(r"\b(chore|bump|upgrade|update|cleanup|refactor|docs?|rename)\b", re.IGNORECASE)
+
+
+def _guess_issue_class(issue: GitHubIssue) -> IssueClassSlashCommand:
+    """Cheap keyword guess at the class classify_issue will return."""
+    text = " ".join([issue.title, *(label.name for label in issue.labels)])
+    if _BUG_HINT_RE.search(text):
+        return "/ipe_bug"
+    if _CHORE_HINT_RE.search(text):
+        return "/ipe_chore"
+    return "/ipe_feature"
+
+
+def _classify_and_name_branch(
+    issue: GitHubIssue, ipe_id: str, logger: logging.Logger
+) -> Tuple[Optional[IssueClassSlashCommand], Optional[str], Optional[str]]:
+    """Classify the issue, then generate a branch name for that class.
+
+    With IPE_SPECULATIVE_BRANCH_NAMES=1 the branch name is generated for a
+    guessed class while the classifier runs; when the guess is wrong it is
+    regenerated for the real class (one extra agent call).
+
+    Returns:
+        (issue_command, branch_name, error_message) tuple
+    """
+    speculative = None
+    if os.environ.get("IPE_SPECULATIVE_BRANCH_NAMES") == "1":
+        guess = _guess_issue_class(issue)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            classify = pool.submit(classify_issue, issue, ipe_id, logger)
+            speculative = pool.submit(generate_branch_name, issue, guess, ipe_id, logger)
+            issue_command, error = classify.result()
+            if error:
+                speculative.cancel()
+            elif issue_command != guess:
+                # Leaving the pool waits for the discarded call, so it can't
+                # race the regenerated one over the branch generator's output
+                logger.debug(f"Guessed {guess}, classified {issue_command}; regenerating branch name")
+                speculative.cancel()
+                speculative = None
+    else:
+        issue_command, error = classify_issue(issue, ipe_id, logger)
+
+    if error:
+        return None, None, f"Failed to classify issue: {error}"
+
+    if speculative is not None:
+        branch_name, error = speculative.result()
+    else:
+        branch_name, error = generate_branch_name(issue, issue_command, ipe_id, logger)
+    if error:
+        return issue_command, None, f"Failed to generate branch name: {error}"
+
+    return issue_command, branch_name, None
+
+
 def create_or_find_branch(
     issue_number: str,
     issue: GitHubIssue,
@@ -623,6 +955,8 @@ def create_or_find_branch(
 
     Returns (branch_name, error_message) tuple.
     """
+    ipe_id = state.get("ipe_id")
+
     # 1. Check state for branch name
     branch_name = state.get("branch_name") or state.get("branch", {}).get("name")
     if branch_name:
@@ -632,13 +966,8 @@ def create_or_find_branch(
 
         current = get_current_branch(cwd=cwd)
         if current != branch_name:
-            result = subprocess.run(
-                ["git", "checkout", branch_name],
-                capture_output=True,
-                text=True,
-                cwd=cwd,
-            )
-            if result.returncode != 0:
+            checked_out, _ = _checkout_branch(branch_name, cwd)
+            if not checked_out:
                 # Branch might not exist locally, try to create from remote
                 result = subprocess.run(
                     ["git", "checkout", "-b", branch_name, f"origin/{branch_name}"],
@@ -651,41 +980,31 @@ def create_or_find_branch(
         return branch_name, None
 
     # 2. Look for existing branch
-    ipe_id = state.get("ipe_id")
     existing_branch = find_existing_branch_for_issue(issue_number, ipe_id, cwd=cwd)
     if existing_branch:
         logger.info(f"Found existing branch: {existing_branch}")
         # Checkout the branch
-        result = subprocess.run(
-            ["git", "checkout", existing_branch],
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-        )
-        if result.returncode != 0:
-            return "", f"Failed to checkout branch: {result.stderr}"
+        checked_out, error = _checkout_branch(existing_branch, cwd)
+        if not checked_out:
+            return "", f"Failed to checkout branch: {error}"
         state.update(branch_name=existing_branch)
         return existing_branch, None
 
     # 3. Create new branch - classify issue first
     logger.info("No existing branch found, creating new one")
 
-    # Classify the issue
-    issue_command, error = classify_issue(issue, ipe_id, logger)
+    # Classify the issue and generate branch name
+    issue_command, branch_name, error = _classify_and_name_branch(issue, ipe_id, logger)
+    if issue_command:
+        state.update(issue_class=issue_command)
     if error:
-        return "", f"Failed to classify issue: {error}"
-
-    state.update(issue_class=issue_command)
-
-    # Generate branch name
-    branch_name, error = generate_branch_name(issue, issue_command, ipe_id, logger)
-    if error:
-        return "", f"Failed to generate branch name: {error}"
+        return "", error
 
     # Create the branch
     from .ipe_git_ops import create_branch
 
     success, error = create_branch(branch_name, cwd=cwd)
+    invalidate_branch_cache(cwd)
     if not success:
         return "", f"Failed to create branch: {error}"
 
@@ -702,9 +1021,11 @@ def find_spec_file(state: IPEState, logger: logging.Logger) -> Optional[str]:
     """
     # Get worktree path if in isolated workflow
     worktree_path = state.get("worktree_path")
+    spec_file = state.get("spec_file")
+    branch_name = state.get("branch_name")
+    ipe_id = state.get("ipe_id")
 
     # Check if spec file is already in state (from plan phase)
-    spec_file = state.get("spec_file")
     if spec_file:
         # If worktree_path exists and spec_file is relative, make it absolute
         if worktree_path and not os.path.isabs(spec_file):
@@ -736,28 +1057,22 @@ def find_spec_file(state: IPEState, logger: logging.Logger) -> Optional[str]:
             return spec_file
 
     # If still not found, try to derive from branch name
-    branch_name = state.get("branch_name")
     if branch_name:
         # Extract issue number from branch name
-        import re
-
-        match = re.search(r"issue-(\d+)", branch_name)
+        match = _ISSUE_NUM_RE.search(branch_name)
         if match:
             issue_num = match.group(1)
-            ipe_id = state.get("ipe_id")
 
             # Look for spec files matching the pattern
-            import glob
-
             # Use worktree_path if provided, otherwise current directory
             search_dir = worktree_path if worktree_path else os.getcwd()
-            pattern = os.path.join(
-                search_dir, f"specs/issue-{issue_num}-adw-{ipe_id}*.md"
+            prefix = f"issue-{issue_num}-adw-{ipe_id}"
+            spec_file = _find_first_spec(
+                os.path.join(search_dir, "specs"),
+                lambda name: name.startswith(prefix),
             )
-            spec_files = glob.glob(pattern)
 
-            if spec_files:
-                spec_file = spec_files[0]
+            if spec_file:
                 logger.info(f"Found spec file by pattern: {spec_file}")
                 return spec_file
 
@@ -800,15 +1115,17 @@ def create_and_implement_patch(
         working_dir=working_dir,
     )
 
-    logger.debug(
-        f"Patch plan request: {request.model_dump_json(indent=2, by_alias=True)}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Patch plan request: {request.model_dump_json(indent=2, by_alias=True)}"
+        )
 
     response = execute_template(request)
 
-    logger.debug(
-        f"Patch plan response: {response.model_dump_json(indent=2, by_alias=True)}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Patch plan response: {response.model_dump_json(indent=2, by_alias=True)}"
+        )
 
     if not response.success:
         logger.error(f"Error creating patch plan: {response.output}")
@@ -9,18 +9,87 @@ This module provides all Terraform operations needed for infrastructure workflow
 """
 
 import subprocess
-import json
+import functools
+import hashlib
 import os
 import shutil
-from typing import Tuple, Optional, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple, Optional, Dict, Any, List
 import logging
-from datetime import datetime
 from pathlib import Path
 
+from .ipe_utils import loads_json
+
+
+# Shared provider cache so each init (and each worktree) doesn't re-download
+# providers; TF_PLUGIN_CACHE_DIR in the environment takes precedence
+_DEFAULT_PLUGIN_CACHE_DIR = Path.home() / ".terraform.d" / "plugin-cache"
+
+
+# Concurrent resource operations for plan/apply/destroy (Terraform's default
+# is 10); IPE_TF_PARALLELISM overrides it, e.g. when providers throttle
+def _parallelism_from_env() -> int:
+    """Read IPE_TF_PARALLELISM, falling back to a CPU-based default.
+
+    Returns:
+        The configured value, or the default when unset or not a positive integer
+    """
+    default = min(32, 3 * (os.cpu_count() or 4))
+    raw = os.getenv("IPE_TF_PARALLELISM")
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logging.getLogger(__name__).warning(
+            f"Ignoring invalid IPE_TF_PARALLELISM={raw!r}; using {default}"
+        )
+        return default
+    return value
+
+
+_DEFAULT_PARALLELISM = _parallelism_from_env()
+
+# Fixed command lines; subprocess accepts any sequence
+_INIT_CMD = ("terraform", "init", "-input=false")
+_VALIDATE_CMD = ("terraform", "validate", "-json")
+_FMT_CMD = ("terraform", "fmt", "-recursive")
+_FMT_CHECK_CMD = ("terraform", "fmt", "-check", "-recursive")
+_TFLINT_INIT_CMD = ("tflint", "--init")
+_TFLINT_CMD = ("tflint", "--format=json")
+_CHECKOV_CMD = ("checkov", "-d", ".", "--output", "json", "--quiet", "--compact")
+_TFSEC_CMD = ("tfsec", ".", "--format", "json")
+_WORKSPACE_LIST_CMD = ("terraform", "workspace", "list")
+_INFRACOST_CMD = ("infracost", "breakdown", "--path", ".", "--format", "json")
+_OUTPUT_CMD = ("terraform", "output", "-json")
+
+# Written under .terraform/ after a successful init; holds _init_fingerprint()
+_INIT_STAMP = ".ipe_init_stamp"
+
+# Saved plans keyed by _plan_fingerprint(), used when IPE_TF_PLAN_CACHE=1.
+# A plan also reflects remote state, so entries expire; terraform apply
+# still rejects a saved plan whose state has since changed.
+_PLAN_CACHE_DIR = Path.home() / ".cache" / "ipe" / "plans"
+_PLAN_CACHE_TTL = 600.0
+
+
+@functools.lru_cache(maxsize=None)
+def _which(tool: str) -> Optional[str]:
+    """shutil.which(), cached so repeated checks don't re-walk PATH."""
+    return shutil.which(tool)
+
+
+def invalidate_tool_cache() -> None:
+    """Forget cached tool lookups (e.g. after installing a scanner)."""
+    _which.cache_clear()
+
 
 def check_terraform_installed() -> bool:
     """Check if Terraform is installed."""
-    return shutil.which("terraform") is not None
+    return _which("terraform") is not None
 
 
 def create_tfvars_override(
@@ -41,11 +110,25 @@ def create_tfvars_override(
     try:
         # Create override tfvars file
         override_file = terraform_dir / "override.auto.tfvars"
-
-        with open(override_file, 'w') as f:
-            f.write(f'# Auto-generated override for custom AMI deployment\n')
-            f.write(f'# Generated: {datetime.now().isoformat()}\n')
-            f.write(f'ami_id = "{ami_id}"\n')
+        ami_line = f'ami_id = "{ami_id}"\n'
+
+        # Leave an identical override alone so the plan cache key stays stable
+        try:
+            if override_file.read_text().endswith(ami_line):
+                logger.info(f"tfvars override already set: {override_file}")
+                return override_file
+        except OSError:
+            pass
+
+        # Write beside the target and rename so a concurrent plan never
+        # reads a half-written file
+        tmp_file = terraform_dir / f".override.auto.tfvars.{os.getpid()}.tmp"
+        tmp_file.write_text(
+            '# Auto-generated override for custom AMI deployment\n'
+            f'# Generated: {time.strftime("%Y-%m-%dT%H:%M:%S")}\n'
+            f'{ami_line}'
+        )
+        os.replace(tmp_file, override_file)
 
         logger.info(f"Created tfvars override: {override_file}")
         return override_file
@@ -55,6 +138,121 @@ def create_tfvars_override(
         return None
 
 
+def _terraform_env(workspace: Optional[str] = None, **overrides: str) -> Optional[Dict[str, str]]:
+    """Build the subprocess env for a Terraform command.
+
+    Returns None (inherit the parent environment, no copy) when there is
+    nothing to override.
+    """
+    if workspace:
+        overrides["TF_WORKSPACE"] = workspace
+    if not overrides:
+        return None
+    return {**os.environ, **overrides}
+
+
+def _config_fingerprint(
+    cwd: str, workspace: Optional[str], suffixes: Tuple[str, ...], extra: str = ""
+) -> str:
+    """Hash the workspace, lock file and top-level files with the given suffixes."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update((workspace or "").encode())
+    digest.update(extra.encode())
+    names = sorted(
+        name for name in os.listdir(cwd)
+        if name.endswith(suffixes) or name == ".terraform.lock.hcl"
+    )
+    for name in names:
+        digest.update(name.encode())
+        with open(os.path.join(cwd, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _init_fingerprint(cwd: str, workspace: Optional[str]) -> str:
+    """Hash what terraform init depends on: lock file, *.tf files and workspace.
+
+    Backend blocks, module sources and provider requirements all live in
+    the top-level *.tf files, so any change to them forces a fresh init.
+    """
+    return _config_fingerprint(cwd, workspace, (".tf",))
+
+
+def _selected_workspace(cwd: str, workspace: Optional[str]) -> str:
+    """Workspace a Terraform command in cwd will use.
+
+    The explicit argument wins, then TF_WORKSPACE, then the one chosen with
+    `terraform workspace select` (recorded in .terraform/environment).
+    """
+    if workspace:
+        return workspace
+    if os.environ.get("TF_WORKSPACE"):
+        return os.environ["TF_WORKSPACE"]
+    try:
+        with open(os.path.join(cwd, ".terraform", "environment")) as f:
+            return f.read().strip() or "default"
+    except OSError:
+        return "default"
+
+
+def _local_module_dirs(cwd: str) -> List[str]:
+    """Directories of local modules (./modules/x, ../shared) installed by init.
+
+    Remote modules are copied under .terraform/modules and pinned by the
+    top-level configuration, so only local sources are returned.
+    """
+    try:
+        with open(os.path.join(cwd, ".terraform", "modules", "modules.json"), "rb") as f:
+            modules = loads_json(f.read()).get("Modules") or []
+    except (OSError, ValueError, AttributeError):
+        return []
+
+    dirs = set()
+    for module in modules:
+        module_dir = os.path.normpath(module.get("Dir") or ".")
+        if module_dir == "." or module_dir.split(os.sep)[0] == ".terraform":
+            continue
+        dirs.add(os.path.normpath(os.path.join(cwd, module_dir)))
+    return sorted(dirs)
+
+
+def _hash_tree(digest: Any, root: str) -> None:
+    """Feed every file under root (skipping .terraform/) into digest, in a stable order."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name != ".terraform")
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            digest.update(os.path.relpath(path, root).encode())
+            try:
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+            except OSError:
+                continue
+
+
+def _plan_fingerprint(cwd: str, workspace: Optional[str]) -> str:
+    """Hash the plan inputs.
+
+    Covers the init inputs, variable files, TF_VAR_* env, the selected
+    workspace and the full contents of every local module. A saved plan
+    embeds the configuration, and terraform apply only rejects it when the
+    state has changed, so any configuration edit must miss the cache.
+    """
+    tf_vars = "\0".join(
+        f"{key}={value}" for key, value in sorted(os.environ.items())
+        if key.startswith("TF_VAR_")
+    )
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_config_fingerprint(
+        cwd, _selected_workspace(cwd, workspace), (".tf", ".tfvars", ".tfvars.json"),
+        extra=tf_vars,
+    ).encode())
+    for module_dir in _local_module_dirs(cwd):
+        digest.update(b"\0" + module_dir.encode() + b"\0")
+        _hash_tree(digest, module_dir)
+    return digest.hexdigest()
+
+
 def run_terraform_init(
     cwd: str,
     logger: logging.Logger,
@@ -62,6 +260,9 @@ def run_terraform_init(
 ) -> Tuple[bool, Optional[str]]:
     """Initialize Terraform in the working directory.
 
+    Skips the subprocess when .terraform/ was initialized from the same
+    lock file, configuration and workspace.
+
     Args:
         cwd: Working directory path
         logger: Logger instance
@@ -71,14 +272,25 @@ def run_terraform_init(
         Tuple of (success, error_message)
     """
     try:
-        env = os.environ.copy()
+        stamp_path = os.path.join(cwd, ".terraform", _INIT_STAMP)
+        try:
+            with open(stamp_path) as f:
+                if f.read() == _init_fingerprint(cwd, workspace):
+                    logger.info("✅ Terraform already initialized (init cache hit)")
+                    return True, None
+        except OSError:
+            pass
+
         if workspace:
-            env["TF_WORKSPACE"] = workspace
             logger.info(f"Using TFC workspace: {workspace}")
 
+        plugin_cache = Path(os.environ.get("TF_PLUGIN_CACHE_DIR") or _DEFAULT_PLUGIN_CACHE_DIR)
+        plugin_cache.mkdir(parents=True, exist_ok=True)
+        env = _terraform_env(workspace, TF_PLUGIN_CACHE_DIR=str(plugin_cache))
+
         logger.info("Running terraform init...")
         result = subprocess.run(
-            ["terraform", "init", "-input=false"],
+            _INIT_CMD,
             cwd=cwd,
             capture_output=True,
             text=True,
@@ -87,6 +299,12 @@ def run_terraform_init(
         )
         if result.returncode == 0:
             logger.info("✅ Terraform init successful")
+            # Fingerprint after init, which may have just written the lock file
+            try:
+                with open(stamp_path, "w") as f:
+                    f.write(_init_fingerprint(cwd, workspace))
+            except OSError as e:
+                logger.debug(f"Could not write init stamp: {e}")
             return True, None
         logger.error(f"Terraform init failed: {result.stderr}")
         return False, result.stderr
@@ -112,22 +330,19 @@ def run_terraform_validate(
         Test result dictionary
     """
     try:
-        env = os.environ.copy()
-        if workspace:
-            env["TF_WORKSPACE"] = workspace
+        env = _terraform_env(workspace)
 
         logger.info("Running terraform validate...")
         result = subprocess.run(
-            ["terraform", "validate", "-json"],
+            _VALIDATE_CMD,
             cwd=cwd,
             capture_output=True,
-            text=True,
             timeout=60,
             env=env
         )
 
         # Parse JSON output
-        output = json.loads(result.stdout) if result.stdout else {}
+        output = loads_json(result.stdout) if result.stdout else {}
 
         passed = result.returncode == 0 and output.get("valid", False)
         error_msg = None
@@ -135,9 +350,9 @@ def run_terraform_validate(
         if not passed:
             if "diagnostics" in output:
                 errors = [d.get("summary", "") for d in output["diagnostics"] if d.get("severity") == "error"]
-                error_msg = "\n".join(errors) if errors else result.stderr
+                error_msg = "\n".join(errors) if errors else result.stderr.decode("utf-8", "replace")
             else:
-                error_msg = result.stderr
+                error_msg = result.stderr.decode("utf-8", "replace")
 
         return {
             "test_name": "terraform_validate",
@@ -169,25 +384,28 @@ def run_terraform_fmt(cwd: str, logger: logging.Logger) -> Tuple[bool, Optional[
     try:
         logger.info("Running terraform fmt...")
         result = subprocess.run(
-            ["terraform", "fmt", "-recursive"],
+            _FMT_CMD,
             cwd=cwd,
             capture_output=True,
-            text=True,
             timeout=60
         )
 
         # terraform fmt returns 0 on success, even if it formatted files
         if result.returncode == 0:
-            formatted_files = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            if formatted_files and formatted_files[0]:
-                logger.info(f"✅ Formatted {len(formatted_files)} file(s)")
-                return True, f"Formatted: {', '.join(formatted_files)}"
+            # One formatted file per line
+            stdout = result.stdout.strip()
+            if stdout:
+                count = stdout.count(b"\n") + 1
+                logger.info(f"✅ Formatted {count} file(s)")
+                files = stdout.decode("utf-8", "replace").replace("\n", ", ")
+                return True, f"Formatted: {files}"
             else:
                 logger.info("✅ All files already formatted correctly")
                 return True, "All files already formatted"
 
-        logger.warning(f"Terraform fmt reported issues: {result.stderr}")
-        return False, result.stderr
+        stderr = result.stderr.decode("utf-8", "replace")
+        logger.warning(f"Terraform fmt reported issues: {stderr}")
+        return False, stderr
 
     except Exception as e:
         logger.error(f"Error running terraform fmt: {e}")
@@ -207,10 +425,10 @@ def run_terraform_fmt_check(cwd: str, logger: logging.Logger) -> Dict[str, Any]:
     try:
         logger.info("Running terraform fmt check...")
         result = subprocess.run(
-            ["terraform", "fmt", "-check", "-recursive"],
+            _FMT_CHECK_CMD,
             cwd=cwd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=60
         )
 
@@ -218,9 +436,10 @@ def run_terraform_fmt_check(cwd: str, logger: logging.Logger) -> Dict[str, Any]:
         error_msg = None
 
         if not passed:
-            # List files that need formatting
-            files = result.stdout.strip().split('\n') if result.stdout else []
-            error_msg = f"Files need formatting: {', '.join(files)}" if files else "Formatting issues found"
+            # List files that need formatting (stdout is empty on success)
+            stdout = result.stdout.strip()
+            files = stdout.decode("utf-8", "replace").replace("\n", ", ")
+            error_msg = f"Files need formatting: {files}" if files else "Formatting issues found"
 
         return {
             "test_name": "terraform_fmt",
@@ -243,27 +462,42 @@ def run_terraform_plan(
     cwd: str,
     logger: logging.Logger,
     out_file: str = "tfplan",
-    workspace: Optional[str] = None
+    workspace: Optional[str] = None,
+    parallelism: int = _DEFAULT_PARALLELISM
 ) -> Tuple[bool, Optional[str], Optional[str]]:
     """Generate Terraform plan.
 
+    With IPE_TF_PLAN_CACHE=1, a recent plan for identical configuration,
+    variables and workspace is copied to out_file instead of re-planning.
+
     Args:
         cwd: Working directory path
         logger: Logger instance
         out_file: Output file for plan
         workspace: TFC workspace name (e.g., "{{PROJECT_SLUG}}-dev")
+        parallelism: Maximum concurrent resource operations
 
     Returns:
         Tuple of (success, plan_output, error_message)
     """
     try:
-        env = os.environ.copy()
-        if workspace:
-            env["TF_WORKSPACE"] = workspace
+        cached_plan = None
+        if os.getenv("IPE_TF_PLAN_CACHE") == "1":
+            cached_plan = _PLAN_CACHE_DIR / _plan_fingerprint(cwd, workspace)
+            try:
+                if time.time() - cached_plan.stat().st_mtime < _PLAN_CACHE_TTL:
+                    plan_output = cached_plan.with_suffix(".txt").read_text()
+                    shutil.copyfile(cached_plan, os.path.join(cwd, out_file))
+                    logger.info("✅ Reusing cached Terraform plan")
+                    return True, plan_output, None
+            except OSError:
+                pass
+
+        env = _terraform_env(workspace)
 
         logger.info("Generating Terraform plan...")
         result = subprocess.run(
-            ["terraform", "plan", f"-out={out_file}", "-input=false"],
+            ["terraform", "plan", f"-out={out_file}", "-input=false", f"-parallelism={parallelism}"],
             cwd=cwd,
             capture_output=True,
             text=True,
@@ -273,6 +507,14 @@ def run_terraform_plan(
 
         if result.returncode == 0:
             logger.info("✅ Terraform plan generated successfully")
+            if cached_plan is not None:
+                try:
+                    # Plans can contain sensitive values; keep the cache private
+                    _PLAN_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+                    cached_plan.with_suffix(".txt").write_text(result.stdout)
+                    shutil.copyfile(os.path.join(cwd, out_file), cached_plan)
+                except OSError as e:
+                    logger.debug(f"Could not cache plan: {e}")
             return True, result.stdout, None
 
         logger.error(f"Terraform plan failed: {result.stderr}")
@@ -283,6 +525,44 @@ def run_terraform_plan(
         return False, None, str(e)
 
 
+def run_terraform_pipeline(
+    cwd: str,
+    logger: logging.Logger,
+    out_file: str = "tfplan",
+    workspace: Optional[str] = None
+) -> Tuple[bool, Dict[str, Any]]:
+    """Run init, validate and plan for one module, stopping at the first failure.
+
+    Init is skipped when the module is already initialized for the current
+    configuration (see run_terraform_init), so an unchanged module costs
+    two Terraform processes instead of three.
+
+    Args:
+        cwd: Working directory path
+        logger: Logger instance
+        out_file: Output file for plan
+        workspace: TFC workspace name (e.g., "{{PROJECT_SLUG}}-dev")
+
+    Returns:
+        Tuple of (success, per-step results keyed "init", "validate", "plan")
+    """
+    steps: Dict[str, Any] = {}
+
+    success, error = run_terraform_init(cwd, logger, workspace)
+    steps["init"] = {"passed": success, "error": error}
+    if not success:
+        return False, steps
+
+    validate_result = run_terraform_validate(cwd, logger, workspace)
+    steps["validate"] = validate_result
+    if not validate_result["passed"]:
+        return False, steps
+
+    success, plan_output, error = run_terraform_plan(cwd, logger, out_file, workspace)
+    steps["plan"] = {"passed": success, "output": plan_output, "error": error}
+    return success, steps
+
+
 def run_terraform_plan_json(
     cwd: str,
     logger: logging.Logger,
@@ -304,14 +584,13 @@ def run_terraform_plan_json(
             ["terraform", "show", "-json", plan_file],
             cwd=cwd,
             capture_output=True,
-            text=True,
             timeout=120
         )
 
         if result.returncode == 0:
-            return json.loads(result.stdout)
+            return loads_json(result.stdout)
 
-        logger.error(f"Failed to get plan JSON: {result.stderr}")
+        logger.error(f"Failed to get plan JSON: {result.stderr.decode('utf-8', 'replace')}")
         return None
     except Exception as e:
         logger.error(f"Error getting plan JSON: {e}")
@@ -328,7 +607,7 @@ def run_tflint(cwd: str, logger: logging.Logger) -> Optional[Dict[str, Any]]:
     Returns:
         Test result dictionary or None if tflint not available
     """
-    if not shutil.which("tflint"):
+    if not _which("tflint"):
         logger.info("tflint not installed, skipping")
         return None
 
@@ -337,7 +616,7 @@ def run_tflint(cwd: str, logger: logging.Logger) -> Optional[Dict[str, Any]]:
 
         # Initialize tflint
         init_result = subprocess.run(
-            ["tflint", "--init"],
+            _TFLINT_INIT_CMD,
             cwd=cwd,
             capture_output=True,
             text=True,
@@ -346,15 +625,14 @@ def run_tflint(cwd: str, logger: logging.Logger) -> Optional[Dict[str, Any]]:
 
         # Run tflint
         result = subprocess.run(
-            ["tflint", "--format=json"],
+            _TFLINT_CMD,
             cwd=cwd,
             capture_output=True,
-            text=True,
             timeout=120
         )
 
         # Parse output
-        issues = json.loads(result.stdout) if result.stdout else {}
+        issues = loads_json(result.stdout) if result.stdout else {}
 
         # tflint returns 0 for no issues, 2 for issues found
         passed = result.returncode == 0
@@ -394,26 +672,26 @@ def run_checkov(cwd: str, logger: logging.Logger) -> Optional[Dict[str, Any]]:
     Returns:
         Test result dictionary or None if checkov not available
     """
-    if not shutil.which("checkov"):
+    if not _which("checkov"):
         logger.info("checkov not installed, skipping")
         return None
 
     try:
         logger.info("Running Checkov security scan...")
         result = subprocess.run(
-            ["checkov", "-d", ".", "--output", "json", "--quiet"],
+            _CHECKOV_CMD,
             cwd=cwd,
             capture_output=True,
-            text=True,
             timeout=180
         )
 
         # Parse output
-        output = json.loads(result.stdout) if result.stdout else {}
+        output = loads_json(result.stdout) if result.stdout else {}
 
-        # Check results
-        summary = output.get("summary", {})
-        failed = summary.get("failed", 0)
+        # Check results; checkov emits a list of reports when it ran
+        # more than one framework
+        reports = output if isinstance(output, list) else [output]
+        failed = sum(report.get("summary", {}).get("failed", 0) for report in reports)
         passed = failed == 0
 
         error_msg = None
@@ -447,22 +725,21 @@ def run_tfsec(cwd: str, logger: logging.Logger) -> Optional[Dict[str, Any]]:
     Returns:
         Test result dictionary or None if tfsec not available
     """
-    if not shutil.which("tfsec"):
+    if not _which("tfsec"):
         logger.info("tfsec not installed, skipping")
         return None
 
     try:
         logger.info("Running tfsec security scan...")
         result = subprocess.run(
-            ["tfsec", ".", "--format", "json"],
+            _TFSEC_CMD,
             cwd=cwd,
             capture_output=True,
-            text=True,
             timeout=120
         )
 
         # Parse output
-        output = json.loads(result.stdout) if result.stdout else {}
+        output = loads_json(result.stdout) if result.stdout else {}
 
         # Check results
         results = output.get("results", [])
@@ -489,6 +766,91 @@ def run_tfsec(cwd: str, logger: logging.Logger) -> Optional[Dict[str, Any]]:
         }
 
 
+def run_all_terraform_tests(
+    cwd: str,
+    logger: logging.Logger,
+    workspace: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Run the read-only Terraform checks and scanners concurrently.
+
+    fmt check, validate, tflint, checkov and tfsec don't depend on each
+    other, so total time is the slowest check rather than the sum.
+
+    Args:
+        cwd: Working directory path
+        logger: Logger instance
+        workspace: TFC workspace name (e.g., "{{PROJECT_SLUG}}-dev")
+
+    Returns:
+        Test result dictionaries in the order above, omitting scanners
+        that aren't installed
+    """
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [
+            pool.submit(run_terraform_fmt_check, cwd, logger),
+            pool.submit(run_terraform_validate, cwd, logger, workspace),
+            pool.submit(run_tflint, cwd, logger),
+            pool.submit(run_checkov, cwd, logger),
+            pool.submit(run_tfsec, cwd, logger),
+        ]
+        results = [future.result() for future in futures]
+
+    return [result for result in results if result is not None]
+
+
+def _run_per_module(
+    check: Callable[..., Dict[str, Any]],
+    dirs: List[str],
+    max_workers: Optional[int],
+    *args: Any
+) -> Dict[str, Dict[str, Any]]:
+    """Run check(dir, *args) for every module directory in a bounded thread pool."""
+    if not dirs:
+        return {}
+    workers = min(len(dirs), max_workers or os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(lambda d: check(d, *args), dirs)
+        return dict(zip(dirs, results))
+
+
+def validate_many(
+    dirs: List[str],
+    logger: logging.Logger,
+    workspace: Optional[str] = None,
+    max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Run terraform validate over several modules concurrently.
+
+    Args:
+        dirs: Module directories (each already initialized)
+        logger: Logger instance
+        workspace: TFC workspace name (e.g., "{{PROJECT_SLUG}}-dev")
+        max_workers: Concurrent validations (defaults to the CPU count)
+
+    Returns:
+        Test result dictionary per directory
+    """
+    return _run_per_module(run_terraform_validate, dirs, max_workers, logger, workspace)
+
+
+def fmt_check_many(
+    dirs: List[str],
+    logger: logging.Logger,
+    max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Run terraform fmt -check over several modules concurrently.
+
+    Args:
+        dirs: Module directories
+        logger: Logger instance
+        max_workers: Concurrent checks (defaults to the CPU count)
+
+    Returns:
+        Test result dictionary per directory
+    """
+    return _run_per_module(run_terraform_fmt_check, dirs, max_workers, logger)
+
+
 def setup_terraform_workspace(
     cwd: str,
     workspace_name: str,
@@ -511,7 +873,7 @@ def setup_terraform_workspace(
     try:
         # Check if workspace exists
         result = subprocess.run(
-            ["terraform", "workspace", "list"],
+            _WORKSPACE_LIST_CMD,
             cwd=cwd,
             capture_output=True,
             text=True,
@@ -558,26 +920,25 @@ def estimate_cost(cwd: str, logger: logging.Logger) -> Optional[Dict[str, Any]]:
     Returns:
         Cost estimate dictionary or None if not available
     """
-    if not shutil.which("infracost"):
+    if not _which("infracost"):
         logger.info("infracost not installed, skipping cost estimation")
         return None
 
     try:
         logger.info("Running Infracost cost estimation...")
         result = subprocess.run(
-            ["infracost", "breakdown", "--path", ".", "--format", "json"],
+            _INFRACOST_CMD,
             cwd=cwd,
             capture_output=True,
-            text=True,
             timeout=180
         )
 
         if result.returncode == 0:
-            cost_data = json.loads(result.stdout)
+            cost_data = loads_json(result.stdout)
             logger.info("✅ Cost estimation complete")
             return cost_data
 
-        logger.warning(f"Infracost failed: {result.stderr}")
+        logger.warning(f"Infracost failed: {result.stderr.decode('utf-8', 'replace')}")
         return None
     except Exception as e:
         logger.warning(f"Infracost error: {e}")
@@ -587,7 +948,9 @@ def estimate_cost(cwd: str, logger: logging.Logger) -> Optional[Dict[str, Any]]:
 def apply_terraform_changes(
     cwd: str,
     logger: logging.Logger,
-    auto_approve: bool = False
+    auto_approve: bool = False,
+    parallelism: int = _DEFAULT_PARALLELISM,
+    plan_file: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
     """Apply Terraform changes - USE WITH EXTREME CAUTION.
 
@@ -595,6 +958,9 @@ def apply_terraform_changes(
         cwd: Working directory path
         logger: Logger instance
         auto_approve: Whether to auto-approve (DANGEROUS!)
+        parallelism: Maximum concurrent resource operations
+        plan_file: Saved plan to apply (relative to cwd); applying a saved
+            plan never prompts
 
     Returns:
         Tuple of (success, error_message)
@@ -606,7 +972,9 @@ def apply_terraform_changes(
         cmd = ["terraform", "apply"]
         if auto_approve:
             cmd.append("-auto-approve")
-        cmd.extend(["-input=false"])
+        cmd.extend(["-input=false", f"-parallelism={parallelism}"])
+        if plan_file:
+            cmd.append(plan_file)
 
         # Apply
         result = subprocess.run(
@@ -624,13 +992,14 @@ def apply_terraform_changes(
         logger.error(f"Terraform apply failed: {result.stderr}")
         return False, result.stderr
     except subprocess.TimeoutExpired:
+        logger.error("Terraform apply timed out after 30 minutes")
         return False, "Terraform apply timed out after 30 minutes"
     except Exception as e:
+        logger.error(f"Terraform apply error: {e}")
         return False, str(e)
 
 
 # Helper functions for ipe_deploy.py compatibility
-from pathlib import Path
 
 
 def init_terraform(
@@ -694,48 +1063,46 @@ def plan_terraform(
     return success
 
 
-def apply_terraform(terraform_dir: Path, plan_file: str, logger: logging.Logger) -> bool:
+def apply_terraform(
+    terraform_dir: Path,
+    plan_file: str,
+    logger: logging.Logger,
+    parallelism: int = _DEFAULT_PARALLELISM
+) -> bool:
     """Apply Terraform plan (wrapper for ipe_deploy compatibility).
 
     Args:
         terraform_dir: Terraform directory path
         plan_file: Plan file to apply
         logger: Logger instance
+        parallelism: Maximum concurrent resource operations
 
     Returns:
         True if successful
     """
-    try:
-        logger.info("Applying Terraform plan...")
-        result = subprocess.run(
-            ["terraform", "apply", "-input=false", os.path.basename(plan_file)],
-            cwd=str(terraform_dir),
-            capture_output=True,
-            text=True,
-            timeout=1800  # 30 minute timeout
-        )
-
-        if result.returncode == 0:
-            logger.info("✅ Terraform apply completed successfully")
-            return True
-
-        logger.error(f"Terraform apply failed: {result.stderr}")
-        return False
-    except subprocess.TimeoutExpired:
-        logger.error("Terraform apply timed out after 30 minutes")
-        return False
-    except Exception as e:
-        logger.error(f"Terraform apply error: {e}")
-        return False
+    logger.info("Applying Terraform plan...")
+    success, _ = apply_terraform_changes(
+        str(terraform_dir),
+        logger,
+        parallelism=parallelism,
+        plan_file=os.path.basename(plan_file),
+    )
+    return success
 
 
-def destroy_terraform(terraform_dir: Path, logger: logging.Logger, auto_approve: bool = False) -> bool:
+def destroy_terraform(
+    terraform_dir: Path,
+    logger: logging.Logger,
+    auto_approve: bool = False,
+    parallelism: int = _DEFAULT_PARALLELISM
+) -> bool:
     """Destroy Terraform infrastructure (wrapper for ipe_deploy compatibility).
 
     Args:
         terraform_dir: Terraform directory path
         logger: Logger instance
         auto_approve: Whether to auto-approve
+        parallelism: Maximum concurrent resource operations
 
     Returns:
         True if successful
@@ -747,7 +1114,7 @@ def destroy_terraform(terraform_dir: Path, logger: logging.Logger, auto_approve:
         cmd = ["terraform", "destroy"]
         if auto_approve:
             cmd.append("-auto-approve")
-        cmd.extend(["-input=false"])
+        cmd.extend(["-input=false", f"-parallelism={parallelism}"])
 
         # Destroy
         result = subprocess.run(
@@ -785,22 +1152,20 @@ def get_terraform_outputs(terraform_dir: Path, logger: logging.Logger) -> Option
     try:
         logger.info("Getting Terraform outputs...")
         result = subprocess.run(
-            ["terraform", "output", "-json"],
+            _OUTPUT_CMD,
             cwd=str(terraform_dir),
             capture_output=True,
-            text=True,
             timeout=60
         )
 
         if result.returncode == 0:
-            outputs_raw = json.loads(result.stdout)
             # Extract values from output format
-            outputs = {}
-            for key, value in outputs_raw.items():
-                outputs[key] = value.get("value")
-            return outputs
+            return {
+                key: value.get("value")
+                for key, value in loads_json(result.stdout).items()
+            }
 
-        logger.warning(f"Failed to get outputs: {result.stderr}")
+        logger.warning(f"Failed to get outputs: {result.stderr.decode('utf-8', 'replace')}")
         return None
     except Exception as e:
         logger.warning(f"Error getting outputs: {e}")
@@ -0,0 +1,11 @@
+"""Pytest configuration for the IPE module tests.
+
+Puts ipe/ on sys.path once per session so the test modules can import
+ipe_modules directly.
+"""
+
+import os
+import sys
+
+ipe_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ipe_root)
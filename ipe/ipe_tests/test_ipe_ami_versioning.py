@@ -0,0 +1,99 @@
+"""Tests for ipe_modules.ipe_ami_versioning."""
+
+import json
+import logging
+import os
+
+import pytest
+
+from ipe_modules import ipe_ami_versioning as versioning
+from ipe_modules.ipe_ami_versioning import (
+    AMI_VERSION_HISTORY_LOG,
+    VersionStrategy,
+    extract_ami_id_from_packer_output,
+    generate_ami_name,
+    generate_version,
+    get_semantic_version,
+    load_ami_version_history,
+    track_ami_version,
+)
+
+logger = logging.getLogger("test_ipe_ami_versioning")
+
+
+class FakeState:
+    """Minimal IPEState stand-in: append-only JSON-lines logs plus a dict."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.data = {}
+
+    def get_log_path(self, name):
+        return os.path.join(self.directory, f"{name}.jsonl")
+
+    def append(self, name, entry):
+        with open(self.get_log_path(name), "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def set(self, key, value):
+        self.data[key] = value
+
+
+@pytest.fixture
+def describe(monkeypatch):
+    """Make `git describe --tags --long` return the given string."""
+    def set_output(output):
+        monkeypatch.setattr(versioning, "git_output", lambda cwd, *args: output)
+    return set_output
+
+
+@pytest.mark.parametrize("described, expected", [
+    ("v1.2.3-0-gabc1234", "v1.2.3"),
+    ("v1.2.3-5-gabc1234", "v1.2.3-dev-abc1234"),
+    ("abc1234", "v0.1.0"),
+    (None, "v0.1.0"),
+])
+def test_get_semantic_version(describe, described, expected):
+    describe(described)
+    assert get_semantic_version(logger) == expected
+
+
+def test_generate_version_strategies(describe):
+    describe("v2.0.0-0-gdeadbee")
+    assert generate_version(VersionStrategy.SEMANTIC, logger) == "v2.0.0"
+    assert generate_version(VersionStrategy.CUSTOM, logger, "v9.9.9") == "v9.9.9"
+    # Custom without a version, and unknown strategies, fall back to semantic
+    assert generate_version(VersionStrategy.CUSTOM, logger) == "v2.0.0"
+    assert generate_version("nonsense", logger) == "v2.0.0"
+
+
+def test_generate_ami_name_sanitizes_version():
+    assert generate_ami_name("app", "v1.2.3+build/7", "dev", logger) == "app-dev-v1.2.3-build-7"
+
+
+def test_track_and_load_ami_version_history(tmp_path):
+    state = FakeState(str(tmp_path))
+    assert list(load_ami_version_history(state)) == []
+
+    for version, ami_id in (("v1.0.0", "ami-0a"), ("v1.1.0", "ami-0b")):
+        track_ami_version(
+            state, version, ami_id, f"app-dev-{version}", "dev",
+            "abc1234", "main", "20250101-000000", "us-east-1", logger,
+        )
+
+    history = list(load_ami_version_history(state))
+    assert [entry["ami_id"] for entry in history] == ["ami-0a", "ami-0b"]
+    assert os.path.exists(state.get_log_path(AMI_VERSION_HISTORY_LOG))
+    assert state.data["latest_ami_version"] == "v1.1.0"
+    assert state.data["latest_ami_id"] == "ami-0b"
+
+
+@pytest.mark.parametrize("output, expected", [
+    ("==> amazon-ebs: AMI: ami-0123456789abcdef0\n", "ami-0123456789abcdef0"),
+    ('{"artifact_id": "us-east-1:ami-0fedcba987654321"}', "ami-0fedcba987654321"),
+    # Found outside the tail that is searched first
+    ("AMI: ami-0abc\n" + "x" * 70000, "ami-0abc"),
+    ("no image here", None),
+])
+def test_extract_ami_id_from_packer_output(output, expected):
+    assert extract_ami_id_from_packer_output(output, logger) == expected
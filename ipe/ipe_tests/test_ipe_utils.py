@@ -0,0 +1,51 @@
+"""Tests for the git helpers in ipe_modules.ipe_utils."""
+
+import subprocess
+
+import pytest
+
+from ipe_modules.ipe_utils import git_layout_output, git_output
+
+
+def _git(cwd, *args):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository with one commit on branch main."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "ipe@example.com")
+    _git(tmp_path, "config", "user.name", "IPE")
+    (tmp_path / "README.md").write_text("one\n")
+    _git(tmp_path, "add", "README.md")
+    _git(tmp_path, "commit", "-q", "-m", "first")
+    return tmp_path
+
+
+def test_git_output_sees_new_commits_and_checkouts(repo):
+    cwd = str(repo)
+    first = git_output(cwd, "rev-parse", "--short", "HEAD")
+
+    (repo / "README.md").write_text("two\n")
+    assert git_output(cwd, "describe", "--always", "--dirty").endswith("-dirty")
+
+    _git(repo, "commit", "-q", "-am", "second")
+    assert git_output(cwd, "rev-parse", "--short", "HEAD") != first
+
+    _git(repo, "checkout", "-q", "-b", "feature")
+    assert git_output(cwd, "branch", "--show-current") == "feature"
+
+
+def test_git_output_returns_none_on_failure(tmp_path):
+    assert git_output(str(tmp_path), "rev-parse", "--show-toplevel") is None
+
+
+def test_git_layout_output_is_cached(repo):
+    git_layout_output.cache_clear()
+    cwd = str(repo)
+    toplevel = git_layout_output(cwd, "rev-parse", "--show-toplevel")
+
+    assert toplevel == git_output(cwd, "rev-parse", "--show-toplevel")
+    assert git_layout_output(cwd, "rev-parse", "--show-toplevel") == toplevel
+    assert git_layout_output.cache_info().hits == 1
@@ -0,0 +1,65 @@
+"""Tests for the plan-cache fingerprint and settings in ipe_modules.terraform_ops."""
+
+import json
+
+import pytest
+
+from ipe_modules.terraform_ops import (
+    _local_module_dirs,
+    _parallelism_from_env,
+    _plan_fingerprint,
+)
+
+
+@pytest.fixture
+def tf_dir(tmp_path, monkeypatch):
+    """Root module calling a local and a remote module, as left by init."""
+    monkeypatch.delenv("TF_WORKSPACE", raising=False)
+    (tmp_path / "main.tf").write_text('module "vpc" { source = "./modules/vpc" }\n')
+    (tmp_path / "modules" / "vpc").mkdir(parents=True)
+    (tmp_path / "modules" / "vpc" / "main.tf").write_text('variable "cidr" {}\n')
+    (tmp_path / ".terraform" / "modules" / "remote").mkdir(parents=True)
+    (tmp_path / ".terraform" / "modules" / "modules.json").write_text(json.dumps({
+        "Modules": [
+            {"Key": "", "Source": "", "Dir": "."},
+            {"Key": "vpc", "Source": "./modules/vpc", "Dir": "modules/vpc"},
+            {"Key": "remote", "Source": "registry/x", "Dir": ".terraform/modules/remote"},
+        ]
+    }))
+    return tmp_path
+
+
+def test_local_module_dirs_skips_root_and_remote(tf_dir):
+    assert _local_module_dirs(str(tf_dir)) == [str(tf_dir / "modules" / "vpc")]
+
+
+def test_plan_fingerprint_changes_with_local_module(tf_dir):
+    before = _plan_fingerprint(str(tf_dir), None)
+    assert _plan_fingerprint(str(tf_dir), None) == before
+
+    (tf_dir / "modules" / "vpc" / "outputs.tf").write_text('output "id" { value = 1 }\n')
+    assert _plan_fingerprint(str(tf_dir), None) != before
+
+
+def test_plan_fingerprint_follows_selected_workspace(tf_dir):
+    default = _plan_fingerprint(str(tf_dir), None)
+
+    (tf_dir / ".terraform" / "environment").write_text("staging")
+    selected = _plan_fingerprint(str(tf_dir), None)
+    assert selected != default
+    # Selecting the workspace explicitly is the same plan input
+    assert _plan_fingerprint(str(tf_dir), "staging") == selected
+
+
+def test_parallelism_from_env_uses_valid_value(monkeypatch):
+    monkeypatch.setenv("IPE_TF_PARALLELISM", "7")
+    assert _parallelism_from_env() == 7
+
+
+@pytest.mark.parametrize("raw", ["abc", "2.5", "0", "-3"])
+def test_parallelism_from_env_falls_back_on_invalid(monkeypatch, caplog, raw):
+    monkeypatch.delenv("IPE_TF_PARALLELISM", raising=False)
+    default = _parallelism_from_env()
+    monkeypatch.setenv("IPE_TF_PARALLELISM", raw)
+    assert _parallelism_from_env() == default
+    assert "IPE_TF_PARALLELISM" in caplog.text
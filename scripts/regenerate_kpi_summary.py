@@ -19,11 +19,29 @@ Usage:
 """
 
 import argparse
+import hashlib
+import json
+import os
 import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Tuple
+
+# KPI table header row (the ID column is "ADW ID" or "ASW ID"), the
+# separator row beneath it, and a data row's cells between the outer pipes
+_HEADER_RE = re.compile(r'^.*\|\s*Date\b.*\|\s*A[DS]W ID\b.*$', re.MULTILINE)
+_SEP_RE = re.compile(r'^\s*\|[\s:|-]*---[\s:|-]*$')
+_ROW_RE = re.compile(r'^\s*\|(.*)\|')
+
+# Appended to the summary; records which entries file it was built from so
+# an unchanged entries file doesn't trigger a rebuild
+_HASH_MARKER = "<!-- kpi-entries-hash: {} -->"
+
+# Running totals and a resume offset per entries file, so appending rows
+# only costs parsing the new rows
+_STATE_DIR = Path.home() / ".cache" / "ipe" / "kpi"
+_STATE_VERSION = 1
 
 
 class SimpleLogger:
@@ -42,6 +60,10 @@ class SimpleLogger:
 class KPIEntry:
     """Represents a single KPI entry from the table."""
 
+    __slots__ = ('date', 'adw_id', 'issue_number', 'issue_class', 'attempts',
+                 'plan_size', 'diff_added', 'diff_removed', 'diff_files',
+                 'created', 'updated')
+
     def __init__(self, date: str, adw_id: str, issue_number: str,
                  issue_class: str, attempts: int, plan_size: int,
                  diff_added: int, diff_removed: int, diff_files: int,
@@ -74,151 +96,177 @@ def parse_diff_size(diff_str: str) -> Tuple[int, int, int]:
     Returns:
         Tuple of (added, removed, files) as integers
     """
+    # A missing or extra '/' leaves a part int() rejects ('' or '1/2')
+    added, _, rest = diff_str.partition('/')
+    removed, _, files = rest.partition('/')
     try:
-        parts = diff_str.split('/')
-        if len(parts) != 3:
-            return (0, 0, 0)
-        return (int(parts[0]), int(parts[1]), int(parts[2]))
-    except (ValueError, IndexError):
+        return (int(added), int(removed), int(files))
+    except ValueError:
         return (0, 0, 0)
 
 
-def parse_kpi_entries(entries_file: Path, logger: SimpleLogger) -> List[KPIEntry]:
+def _is_table_end(line: str) -> bool:
+    """Return True for the empty line or heading that ends the table."""
+    stripped = line.strip()
+    return not stripped or (stripped.startswith('#') and '|' not in line)
+
+
+def _parse_row(line: str, logger: SimpleLogger) -> Optional[KPIEntry]:
     """
-    Parse KPI entries from the markdown table.
+    Parse one table line.
 
     Args:
-        entries_file: Path to agentic_kpis.md
+        line: Line from inside the KPIs table
         logger: Logger instance
 
     Returns:
-        List of KPIEntry objects
+        KPIEntry, or None if the line isn't a well-formed data row
     """
-    if not entries_file.exists():
-        logger.error(f"Entries file not found: {entries_file}")
-        return []
+    row = _ROW_RE.match(line)
+    if not row:
+        return None
 
-    content = entries_file.read_text()
-    entries = []
+    # Split the cells between the outer pipes and clean up
+    parts = [p.strip() for p in row.group(1).split('|')]
 
-    # Find the ADW KPIs table section
-    lines = content.split('\n')
-    in_table = False
-    header_seen = False
-
-    for line in lines:
-        # Look for table header
-        if '| Date' in line and '| ADW ID' in line:
-            in_table = True
-            continue
-
-        # Skip separator line (contains dashes between pipes)
-        if in_table and not header_seen and '|' in line and '---' in line:
-            header_seen = True
-            continue
-
-        # Parse data rows
-        if in_table and header_seen:
-            # Stop if we hit an empty line or another section
-            if not line.strip() or (line.strip().startswith('#') and not '|' in line):
-                break
-
-            if line.strip().startswith('|'):
-                # Split by pipe and clean up
-                parts = [p.strip() for p in line.split('|')[1:-1]]  # Skip first/last empty
-
-                if len(parts) < 9:
-                    logger.warning(f"Skipping malformed row: {line}")
-                    continue
-
-                try:
-                    date = parts[0]
-                    adw_id = parts[1]
-                    issue_number = parts[2]
-                    issue_class = parts[3]
-                    attempts = int(parts[4])
-                    plan_size = int(parts[5])
-                    diff_added, diff_removed, diff_files = parse_diff_size(parts[6])
-                    created = parts[7]
-                    updated = parts[8] if len(parts) > 8 else '-'
-
-                    entry = KPIEntry(
-                        date=date,
-                        adw_id=adw_id,
-                        issue_number=issue_number,
-                        issue_class=issue_class,
-                        attempts=attempts,
-                        plan_size=plan_size,
-                        diff_added=diff_added,
-                        diff_removed=diff_removed,
-                        diff_files=diff_files,
-                        created=created,
-                        updated=updated
-                    )
-                    entries.append(entry)
-
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Error parsing row: {line} - {e}")
-                    continue
-
-    logger.info(f"Parsed {len(entries)} KPI entries")
-    return entries
-
-
-def calculate_current_streak(entries: List[KPIEntry]) -> int:
-    """
-    Calculate current streak (consecutive rows from bottom where Attempts <= 2).
+    if len(parts) < 9:
+        logger.warning(f"Skipping malformed row: {line}")
+        return None
 
-    Args:
-        entries: List of KPIEntry objects
-
-    Returns:
-        Current streak count
+    try:
+        # Dates and issue classes repeat across rows; share one copy
+        date = sys.intern(parts[0])
+        adw_id = parts[1]
+        issue_number = parts[2]
+        issue_class = sys.intern(parts[3])
+        attempts = int(parts[4])
+        plan_size = int(parts[5])
+        diff_added, diff_removed, diff_files = parse_diff_size(parts[6])
+        created = parts[7]
+        updated = parts[8] if len(parts) > 8 else '-'
+
+        return KPIEntry(
+            date=date,
+            adw_id=adw_id,
+            issue_number=issue_number,
+            issue_class=issue_class,
+            attempts=attempts,
+            plan_size=plan_size,
+            diff_added=diff_added,
+            diff_removed=diff_removed,
+            diff_files=diff_files,
+            created=created,
+            updated=updated
+        )
+
+    except (ValueError, IndexError) as e:
+        logger.warning(f"Error parsing row: {line} - {e}")
+        return None
+
+
+def _table_start(content: str) -> int:
+    """Return the offset of the first data line of the KPIs table, or -1."""
+    header = _HEADER_RE.search(content)
+    if not header:
+        return -1
+    pos = content.find('\n', header.end())
+    while pos != -1:
+        pos += 1
+        end = content.find('\n', pos)
+        if end == -1:
+            return -1
+        if _SEP_RE.match(content[pos:end]):
+            return end + 1
+        pos = end
+    return -1
+
+
+def _scan_table(content: str, pos: int,
+                logger: SimpleLogger) -> Tuple[List[KPIEntry], int, bool, Optional[KPIEntry]]:
     """
-    streak = 0
-    for entry in reversed(entries):
-        if entry.attempts <= 2:
-            streak += 1
-        else:
-            break
-    return streak
+    Parse table lines starting at pos.
 
-
-def calculate_longest_streak(entries: List[KPIEntry]) -> int:
-    """
-    Calculate longest streak (maximum consecutive sequence where Attempts <= 2).
+    Only newline-terminated lines count as consumed; an unterminated last
+    line is parsed but left for the next scan, since it may still grow.
 
     Args:
-        entries: List of KPIEntry objects
+        content: Text of agentic_kpis.md
+        pos: Offset of a line inside the table
+        logger: Logger instance
 
     Returns:
-        Longest streak count
+        Tuple of (entries from consumed lines, offset after the last consumed
+        line, whether the end of the table was reached, entry parsed from an
+        unterminated last line or None)
     """
-    max_streak = 0
-    current_streak = 0
-
-    for entry in entries:
+    entries = []
+    while True:
+        end = content.find('\n', pos)
+        if end == -1:
+            tail = content[pos:]
+            if tail and not _is_table_end(tail):
+                return entries, pos, False, _parse_row(tail, logger)
+            return entries, pos, False, None
+        line = content[pos:end]
+        if _is_table_end(line):
+            return entries, end + 1, True, None
+        entry = _parse_row(line, logger)
+        if entry is not None:
+            entries.append(entry)
+        pos = end + 1
+
+
+class KPITotals:
+    """Running totals behind the summary metrics, updated one row at a time."""
+
+    __slots__ = ('count', 'current_streak', 'longest_streak', 'total_plan_size',
+                 'largest_plan_size', 'total_diff_size', 'largest_diff_size',
+                 'total_attempts')
+
+    def __init__(self, **values: int):
+        for name in self.__slots__:
+            setattr(self, name, values.get(name, 0))
+
+    def add(self, entry: KPIEntry):
+        """Fold one entry (the next row in table order) into the totals."""
+        self.count += 1
+        # Streak: consecutive rows where Attempts <= 2; the run still open
+        # at the last row is the current streak
         if entry.attempts <= 2:
-            current_streak += 1
-            max_streak = max(max_streak, current_streak)
+            self.current_streak += 1
+            self.longest_streak = max(self.longest_streak, self.current_streak)
         else:
-            current_streak = 0
+            self.current_streak = 0
+        self.total_plan_size += entry.plan_size
+        self.largest_plan_size = max(self.largest_plan_size, entry.plan_size)
+        diff_total = entry.diff_total
+        self.total_diff_size += diff_total
+        self.largest_diff_size = max(self.largest_diff_size, diff_total)
+        self.total_attempts += entry.attempts
 
-    return max_streak
+    def to_dict(self) -> dict:
+        """Return the totals as a JSON-serializable dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-def calculate_summary_metrics(entries: List[KPIEntry], logger: SimpleLogger) -> dict:
+def calculate_summary_metrics(entries: Iterable[KPIEntry], logger: SimpleLogger,
+                              totals: Optional[KPITotals] = None) -> dict:
     """
-    Calculate all summary metrics from entries.
+    Calculate all summary metrics from entries in a single pass.
 
     Args:
-        entries: List of KPIEntry objects
+        entries: KPIEntry objects in table order
         logger: Logger instance
+        totals: Totals for rows preceding entries; not modified
 
     Returns:
         Dictionary of metric names to values
     """
-    if not entries:
+    totals = KPITotals(**totals.to_dict()) if totals else KPITotals()
+    for entry in entries:
+        totals.add(entry)
+
+    if not totals.count:
         logger.warning("No entries found, returning zero metrics")
         return {
             'current_streak': 0,
@@ -230,53 +278,108 @@ def calculate_summary_metrics(entries: List[KPIEntry], logger: SimpleLogger) ->
             'average_presence': 0.0
         }
 
-    current_streak = calculate_current_streak(entries)
-    longest_streak = calculate_longest_streak(entries)
+    average_presence = totals.total_attempts / totals.count
 
-    plan_sizes = [e.plan_size for e in entries]
-    total_plan_size = sum(plan_sizes)
-    largest_plan_size = max(plan_sizes)
-
-    diff_totals = [e.diff_total for e in entries]
-    total_diff_size = sum(diff_totals)
-    largest_diff_size = max(diff_totals)
-
-    attempts = [e.attempts for e in entries]
-    average_presence = sum(attempts) / len(attempts) if attempts else 0.0
-
-    logger.info(f"Current Streak: {current_streak}")
-    logger.info(f"Longest Streak: {longest_streak}")
-    logger.info(f"Total Plan Size: {total_plan_size}")
-    logger.info(f"Largest Plan Size: {largest_plan_size}")
-    logger.info(f"Total Diff Size: {total_diff_size}")
-    logger.info(f"Largest Diff Size: {largest_diff_size}")
+    logger.info(f"Current Streak: {totals.current_streak}")
+    logger.info(f"Longest Streak: {totals.longest_streak}")
+    logger.info(f"Total Plan Size: {totals.total_plan_size}")
+    logger.info(f"Largest Plan Size: {totals.largest_plan_size}")
+    logger.info(f"Total Diff Size: {totals.total_diff_size}")
+    logger.info(f"Largest Diff Size: {totals.largest_diff_size}")
     logger.info(f"Average Presence: {average_presence:.2f}")
 
     return {
-        'current_streak': current_streak,
-        'longest_streak': longest_streak,
-        'total_plan_size': total_plan_size,
-        'largest_plan_size': largest_plan_size,
-        'total_diff_size': total_diff_size,
-        'largest_diff_size': largest_diff_size,
+        'current_streak': totals.current_streak,
+        'longest_streak': totals.longest_streak,
+        'total_plan_size': totals.total_plan_size,
+        'largest_plan_size': totals.largest_plan_size,
+        'total_diff_size': totals.total_diff_size,
+        'largest_diff_size': totals.largest_diff_size,
         'average_presence': average_presence
     }
 
 
-def generate_summary_markdown(metrics: dict, logger: SimpleLogger) -> str:
+def _state_file(entries_file: Path) -> Path:
+    """Return the incremental-state file for an entries file."""
+    key = hashlib.blake2b(str(entries_file.resolve()).encode(), digest_size=16).hexdigest()
+    return _STATE_DIR / f"{key}.json"
+
+
+def _prefix_hash(content: str, length: int) -> str:
+    """Hash the first length characters of content."""
+    return hashlib.blake2b(content[:length].encode(), digest_size=16).hexdigest()
+
+
+def update_kpi_totals(content: str, state_file: Path, logger: SimpleLogger,
+                      use_state: bool = True) -> Tuple[KPITotals, Optional[KPIEntry]]:
     """
-    Generate the summary markdown file content.
+    Bring the running totals up to date with the entries file.
+
+    The state file records the totals, the offset parsing stopped at and a
+    hash of everything before it. If the file still starts with that exact
+    text (rows were only appended), only the rest is parsed; anything else
+    (edited rows, a truncated file, a missing or unreadable state file)
+    falls back to a full parse. The updated state is written back.
 
     Args:
-        metrics: Dictionary of calculated metrics
+        content: Text of agentic_kpis.md
+        state_file: Where the totals are kept between runs
         logger: Logger instance
+        use_state: False to ignore the saved state and parse everything
 
     Returns:
-        Markdown content as string
+        Tuple of (totals for every newline-terminated row, entry from an
+        unterminated last row or None, which isn't folded into the totals)
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    state = None
+    if use_state:
+        try:
+            state = json.loads(state_file.read_text())
+            if (state.get('version') != _STATE_VERSION
+                    or state['prefix_len'] > len(content)
+                    or _prefix_hash(content, state['prefix_len']) != state['prefix_hash']):
+                state = None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            state = None
+
+    if state is not None:
+        totals = KPITotals(**state['totals'])
+        pos, ended = state['prefix_len'], state['ended']
+        logger.info(f"Resuming after {totals.count} already-counted entries")
+    else:
+        totals = KPITotals()
+        pos = _table_start(content)
+        if pos == -1:
+            # No table yet; nothing worth saving
+            return totals, None
+        ended = False
+
+    partial = None
+    if not ended:
+        entries, pos, ended, partial = _scan_table(content, pos, logger)
+        for entry in entries:
+            totals.add(entry)
+        logger.info(f"Parsed {len(entries)} new KPI entries")
+
+    try:
+        _STATE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = state_file.with_suffix('.tmp')
+        tmp.write_text(json.dumps({
+            'version': _STATE_VERSION,
+            'prefix_len': pos,
+            'prefix_hash': _prefix_hash(content, pos),
+            'ended': ended,
+            'totals': totals.to_dict(),
+        }))
+        os.replace(tmp, state_file)
+    except OSError as e:
+        logger.warning(f"Could not save KPI state: {e}")
 
-    content = f"""# Agentic KPIs Summary
+    return totals, partial
+
+
+# Summary file layout, filled in by generate_summary_markdown()
+_SUMMARY_TEMPLATE = """# Agentic KPIs Summary
 
 Performance metrics for the AI Developer Workflow (ADW) system.
 
@@ -287,15 +390,31 @@ Performance metrics for the AI Developer Workflow (ADW) system.
 
 | Metric            | Value       | Last Updated     |
 | ----------------- | ----------- | ---------------- |
-| Current Streak    | {metrics['current_streak']}          | {timestamp} |
-| Longest Streak    | {metrics['longest_streak']}          | {timestamp} |
-| Total Plan Size   | {metrics['total_plan_size']} lines  | {timestamp} |
-| Largest Plan Size | {metrics['largest_plan_size']} lines   | {timestamp} |
-| Total Diff Size   | {metrics['total_diff_size']} lines | {timestamp} |
-| Largest Diff Size | {metrics['largest_diff_size']} lines   | {timestamp} |
-| Average Presence  | {metrics['average_presence']:.2f}        | {timestamp} |
+| Current Streak    | {current_streak}          | {timestamp} |
+| Longest Streak    | {longest_streak}          | {timestamp} |
+| Total Plan Size   | {total_plan_size} lines  | {timestamp} |
+| Largest Plan Size | {largest_plan_size} lines   | {timestamp} |
+| Total Diff Size   | {total_diff_size} lines | {timestamp} |
+| Largest Diff Size | {largest_diff_size} lines   | {timestamp} |
+| Average Presence  | {average_presence:.2f}        | {timestamp} |
 """
 
+
+def generate_summary_markdown(metrics: dict, logger: SimpleLogger) -> str:
+    """
+    Generate the summary markdown file content.
+
+    Args:
+        metrics: Dictionary of calculated metrics
+        logger: Logger instance
+
+    Returns:
+        Markdown content as string
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    content = _SUMMARY_TEMPLATE.format(timestamp=timestamp, **metrics)
+
     return content
 
 
@@ -316,6 +435,11 @@ def main():
         default='app_docs/agentic_kpis_summary.md',
         help='Path to summary output file (default: app_docs/agentic_kpis_summary.md)'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate and reparse every row even if the entries file is unchanged'
+    )
 
     args = parser.parse_args()
     logger = SimpleLogger()
@@ -329,18 +453,39 @@ def main():
         logger.info(f"Reading entries from: {entries_file}")
         logger.info(f"Writing summary to: {summary_file}")
 
-        # Parse entries
-        entries = parse_kpi_entries(entries_file, logger)
+        # Read the entries once; the bytes are hashed, then parsed
+        entries_data = entries_file.read_bytes() if entries_file.exists() else None
+
+        # Skip the rebuild if the summary was generated from identical entries
+        entries_hash = hashlib.blake2b(
+            entries_data or b"", digest_size=16
+        ).hexdigest()
+        marker = _HASH_MARKER.format(entries_hash)
+        if (not args.force and summary_file.exists()
+                and marker in summary_file.read_text()):
+            logger.info("Entries unchanged, summary is up to date")
+            return 0
+
+        if entries_data is None:
+            logger.error(f"Entries file not found: {entries_file}")
+            return 1
+
+        # Parse entries (only rows appended since the last run, when possible)
+        totals, partial = update_kpi_totals(
+            entries_data.decode(), _state_file(entries_file), logger,
+            use_state=not args.force
+        )
+        pending = [partial] if partial else []
 
-        if not entries:
+        if not totals.count and not pending:
             logger.error("No entries found to process")
             return 1
 
         # Calculate metrics
-        metrics = calculate_summary_metrics(entries, logger)
+        metrics = calculate_summary_metrics(pending, logger, totals=totals)
 
         # Generate summary
-        summary_content = generate_summary_markdown(metrics, logger)
+        summary_content = generate_summary_markdown(metrics, logger) + f"\n{marker}\n"
 
         # Write summary file
         summary_file.write_text(summary_content)
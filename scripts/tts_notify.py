@@ -6,7 +6,6 @@
 #   "openai",
 #   "python-dotenv",
 #   "sounddevice",
-#   "soundfile",
 # ]
 # ///
 
@@ -22,12 +21,11 @@ Or import as a module:
     speak_notification("Task complete!")
 """
 
+import hashlib
 import os
 import sys
 import tempfile
-import sounddevice as sd
-import soundfile as sf
-from openai import OpenAI
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -37,14 +35,75 @@ load_dotenv()
 TTS_VOICE = os.getenv("TTS_VOICE", "nova")  # Options: alloy, echo, fable, onyx, nova, shimmer
 TTS_SPEED = float(os.getenv("TTS_SPEED", "1.1"))  # Slightly faster for notifications
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+# The "pcm" response format is raw 24kHz 16-bit signed little-endian mono,
+# so chunks can go straight to the output device as they arrive
+PCM_SAMPLE_RATE = 24000
+PCM_FRAME_BYTES = 2
+STREAM_CHUNK_BYTES = 4096
+
+# Synthesized phrases are cached on disk so repeated notifications
+# ("Task complete!") skip the API round-trip; oldest-used files are evicted
+# once the directory passes TTS_CACHE_MAX_BYTES
+TTS_CACHE_DIR = Path(os.getenv("TTS_CACHE_DIR", Path.home() / ".cache" / "ipe" / "tts"))
+TTS_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+# OpenAI client, created on first use; openai and sounddevice are imported
+# lazily so importing this module (or a usage error) stays cheap
+_client = None
+
+
+def _get_client():
+    """Return the shared OpenAI client, creating it on first use."""
+    global _client
+    if _client is None:
+        from openai import OpenAI
+        _client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+    return _client
+
+
+def _cache_path(text: str, voice: str, speed: float) -> Path:
+    """Return the cache file for a synthesized phrase."""
+    key = hashlib.blake2b(f"{voice}|{speed}|{text}".encode(), digest_size=16).hexdigest()
+    return TTS_CACHE_DIR / f"{key}.pcm"
+
+
+def _evict_cache():
+    """Delete the least recently used cache files while over the size cap."""
+    try:
+        entries = [(f.stat(), f) for f in TTS_CACHE_DIR.glob("*.pcm")]
+    except OSError:
+        return
+    total = sum(st.st_size for st, _ in entries)
+    if total <= TTS_CACHE_MAX_BYTES:
+        return
+    # mtime is bumped on every hit, so it tracks last use even on noatime mounts
+    for st, f in sorted(entries, key=lambda e: e[0].st_mtime):
+        if total <= TTS_CACHE_MAX_BYTES:
+            break
+        try:
+            f.unlink()
+            total -= st.st_size
+        except OSError:
+            pass
+
+
+def _write_frames(stream, pending: bytes, chunk: bytes) -> bytes:
+    """Write the whole frames of pending + chunk; return the leftover bytes."""
+    # Chunks can split a sample; only write whole frames
+    pending += chunk
+    whole = len(pending) - len(pending) % PCM_FRAME_BYTES
+    if whole:
+        stream.write(pending[:whole])
+        pending = pending[whole:]
+    return pending
 
 
 def speak_notification(text: str, voice: str = None, speed: float = None):
     """
     Convert text to speech and play it immediately.
 
+    Repeated phrases are played from the on-disk cache without calling the API.
+
     Args:
         text: The text to speak
         voice: Voice to use (default: nova)
@@ -57,28 +116,52 @@ def speak_notification(text: str, voice: str = None, speed: float = None):
     speed = speed or TTS_SPEED
 
     try:
+        import sounddevice as sd
+
         print(f"🔊 Speaking: {text}")
 
-        # Generate speech
-        response = client.audio.speech.create(
-            model="tts-1",
-            voice=voice,
-            input=text,
-            speed=speed,
-        )
-
-        # Create temporary file and write audio data
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_filename = temp_file.name
-            temp_file.write(response.content)
-
-        # Play audio
-        data, samplerate = sf.read(temp_filename)
-        sd.play(data, samplerate)
-        sd.wait()
-
-        # Clean up
-        os.unlink(temp_filename)
+        cache_file = _cache_path(text, voice, speed)
+        try:
+            audio = cache_file.read_bytes()
+        except OSError:
+            audio = None
+
+        if audio is not None:
+            os.utime(cache_file)
+            with sd.RawOutputStream(
+                samplerate=PCM_SAMPLE_RATE, channels=1, dtype="int16"
+            ) as stream:
+                _write_frames(stream, b"", audio)
+            print("✅ Notification spoken")
+            return
+
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=TTS_CACHE_DIR, suffix=".tmp")
+        try:
+            # Stream speech to the output device; playback starts with the
+            # first chunk instead of after the whole response is downloaded.
+            # The same chunks are teed into the cache file.
+            with os.fdopen(fd, "wb") as cache_out, \
+                    _get_client().audio.speech.with_streaming_response.create(
+                        model="tts-1",
+                        voice=voice,
+                        input=text,
+                        speed=speed,
+                        response_format="pcm",
+                    ) as response, \
+                    sd.RawOutputStream(
+                        samplerate=PCM_SAMPLE_RATE, channels=1, dtype="int16"
+                    ) as stream:
+                pending = b""
+                for chunk in response.iter_bytes(STREAM_CHUNK_BYTES):
+                    cache_out.write(chunk)
+                    pending = _write_frames(stream, pending, chunk)
+            # Only a fully received response is cached
+            os.replace(tmp_name, cache_file)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+        _evict_cache()
 
         print("✅ Notification spoken")
 
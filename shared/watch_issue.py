@@ -2,9 +2,9 @@
 # /// script
 # requires-python = ">=3.12"
 # dependencies = [
-#     "schedule",
 #     "python-dotenv",
 #     "pydantic",
+#     "orjson",
 # ]
 # ///
 
@@ -21,26 +21,18 @@ Usage:
 import os
 import signal
 import sys
+import threading
 import time
+import urllib.error
+import urllib.request
 from pathlib import Path
-from typing import Optional, Dict, Any
-from datetime import datetime
-
-import schedule
-from dotenv import load_dotenv
+from typing import Optional, Dict, Any, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Load environment variables
-load_dotenv()
-
-# Import GitHub operations from unified ASW modules
-from asw.modules import (
-    fetch_issue,
-    get_repo_url,
-    extract_repo_path,
-)
+# dotenv and the ASW modules are imported in main() once the arguments are
+# valid, so --help and usage errors return without loading them
 
 
 def parse_arguments() -> int:
@@ -84,6 +76,56 @@ def parse_arguments() -> int:
         sys.exit(1)
 
 
+# Shared "nothing changed" result; tuples so callers can't mutate it
+_UNCHANGED: Dict[str, Any] = {"changed": False, "fields": (), "messages": ()}
+
+# (issue, assignee logins, label names) for the last issue seen, so the
+# previous state's sets aren't rebuilt on every poll
+_issue_sets_cache: Tuple[Any, frozenset, frozenset] = (None, frozenset(), frozenset())
+
+
+def _same_keys(old_items, new_items, key: str) -> bool:
+    """Return True if both lists carry the same key values in the same order.
+
+    Args:
+        old_items: Previous assignee or label dicts (may be None)
+        new_items: Current assignee or label dicts (may be None)
+        key: Dict key to compare ("login" or "name")
+    """
+    old_items = old_items or ()
+    new_items = new_items or ()
+    return len(old_items) == len(new_items) and all(
+        a.get(key) == b.get(key) for a, b in zip(old_items, new_items)
+    )
+
+
+def _issue_sets(issue, previous=None) -> Tuple[frozenset, frozenset]:
+    """Return an issue's assignee logins and label names, memoized per issue.
+
+    Args:
+        issue: Issue state (GitHubIssue model)
+        previous: Issue whose sets are cached; reused as-is when its
+            assignees and labels match issue's in order
+
+    Returns:
+        Tuple of (assignee logins, label names)
+    """
+    global _issue_sets_cache
+    cached_issue, assignees, labels = _issue_sets_cache
+    if cached_issue is issue:
+        return assignees, labels
+    if not (
+        cached_issue is not None
+        and cached_issue is previous
+        and _same_keys(previous.assignees, issue.assignees, "login")
+        and _same_keys(previous.labels, issue.labels, "name")
+    ):
+        assignees = frozenset(a.get("login") for a in (issue.assignees or []))
+        labels = frozenset(label.get("name") for label in (issue.labels or []))
+    _issue_sets_cache = (issue, assignees, labels)
+    return assignees, labels
+
+
 def detect_changes(old_issue, new_issue) -> Dict[str, Any]:
     """Detect what changed between two issue states.
 
@@ -96,14 +138,32 @@ def detect_changes(old_issue, new_issue) -> Dict[str, Any]:
             - changed (bool): Whether any changes were detected
             - fields (list): List of field names that changed
             - messages (list): Human-readable change messages
+        When nothing changed, a shared read-only result is returned.
     """
     if old_issue is None:
+        _issue_sets(new_issue)
         return {
             "changed": True,
             "fields": ["initial"],
             "messages": [f"Started watching issue #{new_issue.number}: {new_issue.title}"]
         }
 
+    # The cache holds old_issue from the previous poll; read it before
+    # new_issue replaces it
+    old_assignees, old_labels = _issue_sets(old_issue)
+    new_assignees, new_labels = _issue_sets(new_issue, previous=old_issue)
+    old_comment_count = len(old_issue.comments or [])
+    new_comment_count = len(new_issue.comments or [])
+
+    if (
+        old_issue.state == new_issue.state
+        and old_assignees == new_assignees
+        and old_labels == new_labels
+        and old_comment_count == new_comment_count
+        and old_issue.updated_at == new_issue.updated_at
+    ):
+        return _UNCHANGED
+
     changes = {
         "changed": False,
         "fields": [],
@@ -119,8 +179,6 @@ def detect_changes(old_issue, new_issue) -> Dict[str, Any]:
         )
 
     # Check assignees
-    old_assignees = {a.get("login") for a in (old_issue.assignees or [])}
-    new_assignees = {a.get("login") for a in (new_issue.assignees or [])}
     if old_assignees != new_assignees:
         changes["changed"] = True
         changes["fields"].append("assignees")
@@ -132,8 +190,6 @@ def detect_changes(old_issue, new_issue) -> Dict[str, Any]:
             changes["messages"].append(f"Unassigned from: {', '.join(removed)}")
 
     # Check labels
-    old_labels = {label.get("name") for label in (old_issue.labels or [])}
-    new_labels = {label.get("name") for label in (new_issue.labels or [])}
     if old_labels != new_labels:
         changes["changed"] = True
         changes["fields"].append("labels")
@@ -145,8 +201,6 @@ def detect_changes(old_issue, new_issue) -> Dict[str, Any]:
             changes["messages"].append(f"Labels removed: {', '.join(removed)}")
 
     # Check comments count
-    old_comment_count = len(old_issue.comments or [])
-    new_comment_count = len(new_issue.comments or [])
     if old_comment_count != new_comment_count:
         changes["changed"] = True
         changes["fields"].append("comments")
@@ -186,7 +240,14 @@ def signal_handler(signum, frame):
     print(f"\n\nReceived {signal_name}, stopping watch...")
     print("Gracefully shutting down...")
     shutdown_requested = True
+    shutdown_event.set()
+
+
+# Wakes the main loop's sleep between polls as soon as shutdown is requested
+shutdown_event = threading.Event()
 
+POLL_INTERVAL = 30
+GITHUB_API_URL = "https://api.github.com"
 
 # Global state for tracking
 previous_issue_state = None
@@ -194,23 +255,75 @@ repo_path = ""
 issue_number_global = 0
 poll_count = 0
 
+# ETag / Last-Modified of the issue as of previous_issue_state, sent back so
+# an unchanged issue costs a bodyless 304 instead of a full fetch
+conditional_headers: Dict[str, str] = {}
+
+
+def check_issue_modified() -> Tuple[bool, Dict[str, str]]:
+    """Ask the GitHub REST API whether the issue changed since the last fetch.
+
+    Comments, labels, assignees and state changes all bump the issue's
+    ETag. Conditional requests need GITHUB_PAT (an authorized 304 doesn't
+    count against the rate limit); without it every poll is a change.
+
+    Returns:
+        Tuple of (modified, validator headers for the next request)
+    """
+    github_pat = os.getenv("GITHUB_PAT")
+    if not github_pat:
+        return True, {}
+
+    request = urllib.request.Request(
+        f"{GITHUB_API_URL}/repos/{repo_path}/issues/{issue_number_global}",
+        headers={
+            "Authorization": f"Bearer {github_pat}",
+            "Accept": "application/vnd.github+json",
+            **conditional_headers,
+        },
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            headers = response.headers
+    except urllib.error.HTTPError as e:
+        # 304 Not Modified; anything else, fall back to a full fetch
+        return e.code != 304, conditional_headers
+    except (urllib.error.URLError, OSError):
+        return True, {}
+
+    validators = {}
+    if headers.get("ETag"):
+        validators["If-None-Match"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = headers["Last-Modified"]
+    return True, validators
+
+
 def poll_issue():
     """Poll the GitHub issue and display any changes.
 
-    This function is called periodically by the scheduler. It fetches the
+    This function is called periodically by the main loop. It fetches the
     current issue state, compares it to the previous state, and displays
-    any changes detected.
+    any changes detected. The full fetch is skipped when GitHub reports the
+    issue unmodified.
     """
-    global previous_issue_state, poll_count, shutdown_requested
+    global previous_issue_state, poll_count, shutdown_requested, conditional_headers
 
     if shutdown_requested:
         return
 
     poll_count += 1
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
 
     try:
-        # Fetch current issue state
+        modified, validators = check_issue_modified()
+        if not modified and previous_issue_state is not None:
+            print(f"[{timestamp}] Poll #{poll_count} - No changes (state: {previous_issue_state.state})", end="\r")
+            sys.stdout.flush()
+            return
+
+        # Fetch current issue state (already loaded by main())
+        from asw.modules import fetch_issue
         current_issue = fetch_issue(str(issue_number_global), repo_path)
 
         # Detect changes
@@ -235,8 +348,9 @@ def poll_issue():
             print(f"[{timestamp}] Poll #{poll_count} - No changes (state: {current_issue.state})", end="\r")
             sys.stdout.flush()
 
-        # Update previous state
+        # Update previous state (and the validators that describe it)
         previous_issue_state = current_issue
+        conditional_headers = validators
 
     except Exception as e:
         print(f"\n[{timestamp}] Poll #{poll_count} - Error: {e}", file=sys.stderr)
@@ -254,6 +368,14 @@ def main():
     # Parse arguments
     issue_number_global = parse_arguments()
 
+    from dotenv import load_dotenv
+
+    # Load environment variables
+    load_dotenv()
+
+    # Import GitHub operations from unified ASW modules
+    from asw.modules import get_repo_url, extract_repo_path
+
     # Get repository information
     try:
         github_repo_url = get_repo_url()
@@ -268,7 +390,7 @@ def main():
     print("=" * 60)
     print(f"Repository: {repo_path}")
     print(f"Issue Number: #{issue_number_global}")
-    print(f"Poll Interval: 30 seconds")
+    print(f"Poll Interval: {POLL_INTERVAL} seconds")
     print(f"Press Ctrl+C to stop watching")
     print("=" * 60)
     print()
@@ -277,9 +399,6 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Schedule polling every 30 seconds
-    schedule.every(30).seconds.do(poll_issue)
-
     # Run initial poll immediately
     print("Fetching initial issue state...")
     poll_issue()
@@ -288,11 +407,20 @@ def main():
     if shutdown_requested:
         return
 
-    # Main loop
+    # Main loop: sleep until the next poll is due (or shutdown wakes us)
     print("\nWatching for changes...\n")
+    next_poll = time.monotonic() + POLL_INTERVAL
     while not shutdown_requested:
-        schedule.run_pending()
-        time.sleep(1)
+        shutdown_event.wait(max(0.0, next_poll - time.monotonic()))
+        if shutdown_requested:
+            break
+        poll_issue()
+        # Keep a fixed cadence; after a stall (a slow poll or a suspended
+        # process), start a fresh interval rather than polling again at once
+        next_poll += POLL_INTERVAL
+        now = time.monotonic()
+        if next_poll <= now:
+            next_poll = now + POLL_INTERVAL
 
     # Cleanup message
     print("\n" + "=" * 60)
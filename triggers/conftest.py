@@ -0,0 +1,36 @@
+"""Pytest configuration for the webhook trigger tests.
+
+Puts the repository root and triggers/ on sys.path once per session so the
+test modules can import trigger_webhook directly, and keeps the tests from
+writing agent output into the repository.
+"""
+
+import os
+import sys
+
+import pytest
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repo_root)
+sys.path.insert(0, os.path.join(repo_root, "triggers"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_agents(tmp_path, monkeypatch):
+    """Stub the classify_adw agent and point agent output at tmp_path.
+
+    The real extract_adw_info runs an agent that writes prompts and raw
+    output under agents/<id>/; tests only need the no-match fallback.
+    """
+    import trigger_webhook
+    from adw_modules.data_types import ADWExtractionResult
+
+    calls = []
+
+    def fake_extract_adw_info(text, temp_adw_id):
+        calls.append((text, temp_adw_id))
+        return ADWExtractionResult()
+
+    monkeypatch.setattr(trigger_webhook, "extract_adw_info", fake_extract_adw_info)
+    monkeypatch.setattr(trigger_webhook, "AGENTS_DIR", str(tmp_path / "agents"))
+    return calls
@@ -12,14 +12,8 @@ Usage: uv run test_unified_webhook.py
 """
 
 import pytest
-import sys
-import os
-
-# Add parent directory to path for imports
-repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, repo_root)
-sys.path.insert(0, os.path.join(repo_root, "triggers"))
 
+# sys.path setup lives in conftest.py
 from trigger_webhook import detect_workflow_type, extract_workflow_info
 
 
@@ -108,7 +102,7 @@ def test_case_insensitive():
 def test_bot_identifier_prevention():
     """Test that bot messages would be ignored."""
 
-    from trigger_webhook import BOT_IDENTIFIERS
+    from trigger_webhook import BOT_IDENTIFIERS, is_bot_message
 
     # Check that bot identifiers exist
     assert "[ADW-AGENTS]" in BOT_IDENTIFIERS
@@ -116,51 +110,61 @@ def test_bot_identifier_prevention():
 
     # Test bot message detection
     content = "[ADW-AGENTS] Webhook: Starting adw_plan_iso"
-    assert any(bot_id in content for bot_id in BOT_IDENTIFIERS)
+    assert is_bot_message(content)
 
     content = "🤖 IPE Webhook: Starting ipe_plan_iso"
-    assert any(bot_id in content for bot_id in BOT_IDENTIFIERS)
+    assert is_bot_message(content)
 
+    # Identifiers are matched case-sensitively, as before
+    assert not is_bot_message("Please run adw_plan_iso")
+    assert not is_bot_message("[adw-agents] lowercase is not the bot")
 
-def test_all_adw_workflows():
-    """Test detection of all ADW workflows."""
 
-    adw_workflows = [
-        "adw_plan_iso",
-        "adw_build_iso",
-        "adw_test_iso",
-        "adw_review_iso",
-        "adw_document_iso",
-        "adw_ship_iso",
-        "adw_sdlc_iso",
-        "adw_patch_iso",
-    ]
-
-    for workflow in adw_workflows:
-        content = f"Run {workflow} now"
-        workflow_type, workflow_command = detect_workflow_type(content)
-        assert workflow_type == "adw", f"Failed to detect {workflow}"
-        assert workflow_command == workflow, f"Wrong command for {workflow}"
-
-
-def test_all_ipe_workflows():
-    """Test detection of all IPE workflows."""
+def test_bot_or_error_message():
+    """Test the combined loop guard used by the webhook handler."""
 
-    ipe_workflows = [
-        "ipe_plan_iso",
-        "ipe_build_iso",
-        "ipe_test_iso",
-        "ipe_review_iso",
-        "ipe_document_iso",
-        "ipe_ship_iso",
-        "ipe_sdlc_iso",
-    ]
+    from trigger_webhook import is_bot_or_error_message
 
-    for workflow in ipe_workflows:
-        content = f"Run {workflow} now"
-        workflow_type, workflow_command = detect_workflow_type(content)
-        assert workflow_type == "ipe", f"Failed to detect {workflow}"
-        assert workflow_command == workflow, f"Wrong command for {workflow}"
+    assert is_bot_or_error_message("[ADW-AGENTS] Webhook: Starting adw_plan_iso")
+    assert is_bot_or_error_message("[adw-agents] Webhook: Starting adw_plan_iso")
+    assert is_bot_or_error_message("adw_plan_iso FAILED to start")
+    assert not is_bot_or_error_message("Please run adw_plan_iso")
+    assert not is_bot_or_error_message("")
+
+
+@pytest.mark.parametrize("workflow", [
+    "adw_plan_iso",
+    "adw_build_iso",
+    "adw_test_iso",
+    "adw_review_iso",
+    "adw_document_iso",
+    "adw_ship_iso",
+    "adw_sdlc_iso",
+    "adw_patch_iso",
+])
+def test_all_adw_workflows(workflow):
+    """Test detection of all ADW workflows."""
+    content = f"Run {workflow} now"
+    workflow_type, workflow_command = detect_workflow_type(content)
+    assert workflow_type == "adw", f"Failed to detect {workflow}"
+    assert workflow_command == workflow, f"Wrong command for {workflow}"
+
+
+@pytest.mark.parametrize("workflow", [
+    "ipe_plan_iso",
+    "ipe_build_iso",
+    "ipe_test_iso",
+    "ipe_review_iso",
+    "ipe_document_iso",
+    "ipe_ship_iso",
+    "ipe_sdlc_iso",
+])
+def test_all_ipe_workflows(workflow):
+    """Test detection of all IPE workflows."""
+    content = f"Run {workflow} now"
+    workflow_type, workflow_command = detect_workflow_type(content)
+    assert workflow_type == "ipe", f"Failed to detect {workflow}"
+    assert workflow_command == workflow, f"Wrong command for {workflow}"
 
 
 def test_dependent_workflows():
@@ -229,40 +233,39 @@ def test_markdown_formatted_content():
     assert workflow_command == "ipe_plan_iso"
 
 
-def test_e2b_mode_detection():
-    """Test E2B execution mode detection."""
-    from trigger_webhook import detect_e2b_mode
-
+@pytest.mark.parametrize("text,expected", [
     # Positive cases - standalone flags
-    assert detect_e2b_mode("Run adw_plan_iso --e2b") == True
-    assert detect_e2b_mode("adw_plan_iso -e2b") == True
-    assert detect_e2b_mode("--e2b adw_plan_iso") == True
-    assert detect_e2b_mode("-e2b adw_plan_iso") == True
-
+    ("Run adw_plan_iso --e2b", True),
+    ("adw_plan_iso -e2b", True),
+    ("--e2b adw_plan_iso", True),
+    ("-e2b adw_plan_iso", True),
     # Positive cases - with equals
-    assert detect_e2b_mode("adw_plan_iso e2b=true") == True
-    assert detect_e2b_mode("Run adw_plan_iso --e2b=true") == True
-    assert detect_e2b_mode("adw_plan_iso --e2b=true") == True
-    assert detect_e2b_mode("e2b=true adw_plan_iso") == True
-
+    ("adw_plan_iso e2b=true", True),
+    ("Run adw_plan_iso --e2b=true", True),
+    ("adw_plan_iso --e2b=true", True),
+    ("e2b=true adw_plan_iso", True),
     # Positive cases - case insensitive
-    assert detect_e2b_mode("ADW_PLAN_ISO E2B=TRUE") == True
-    assert detect_e2b_mode("ADW_PLAN_ISO --E2B") == True
-    assert detect_e2b_mode("ADW_PLAN_ISO -E2B") == True
-
+    ("ADW_PLAN_ISO E2B=TRUE", True),
+    ("ADW_PLAN_ISO --E2B", True),
+    ("ADW_PLAN_ISO -E2B", True),
     # Positive cases - with whitespace variations
-    assert detect_e2b_mode("adw_plan_iso e2b = true") == True
-    assert detect_e2b_mode("adw_plan_iso e2b= true") == True
-    assert detect_e2b_mode("adw_plan_iso e2b =true") == True
-
+    ("adw_plan_iso e2b = true", True),
+    ("adw_plan_iso e2b= true", True),
+    ("adw_plan_iso e2b =true", True),
     # Negative cases
-    assert detect_e2b_mode("Run adw_plan_iso") == False
-    assert detect_e2b_mode("adw_plan_iso") == False
-    assert detect_e2b_mode("adw_plan_iso e2b=false") == False
-    assert detect_e2b_mode("use2b flag") == False  # Should not match partial
-    assert detect_e2b_mode("note2business") == False  # Should not match partial
-    assert detect_e2b_mode("e2b") == False  # No word boundary at start
-    assert detect_e2b_mode("Let's use e2b later") == False  # Should not match without flag syntax
+    ("Run adw_plan_iso", False),
+    ("adw_plan_iso", False),
+    ("adw_plan_iso e2b=false", False),
+    ("use2b flag", False),  # Should not match partial
+    ("note2business", False),  # Should not match partial
+    ("e2b", False),  # No word boundary at start
+    ("Let's use e2b later", False),  # Should not match without flag syntax
+])
+def test_e2b_mode_detection(text, expected):
+    """Test E2B execution mode detection."""
+    from trigger_webhook import detect_e2b_mode
+
+    assert detect_e2b_mode(text) is expected
 
 
 def test_e2b_mode_in_workflow_info():
@@ -273,23 +276,23 @@ def test_e2b_mode_in_workflow_info():
     content = "adw_plan_iso --e2b"
     temp_id = "adw-test1234"
     info = extract_workflow_info(content, "adw", temp_id)
-    assert info.get("e2b_mode") == True
+    assert info.e2b_mode is True
 
     # Test ADW workflow without E2B flag
     content = "adw_plan_iso"
     info = extract_workflow_info(content, "adw", temp_id)
-    assert info.get("e2b_mode") == False
+    assert info.e2b_mode is False
 
     # Test IPE workflow with E2B flag
     content = "ipe_plan_iso e2b=true"
     temp_id = "ipe-test5678"
     info = extract_workflow_info(content, "ipe", temp_id)
-    assert info.get("e2b_mode") == True
+    assert info.e2b_mode is True
 
     # Test IPE workflow without E2B flag
     content = "ipe_plan_iso"
     info = extract_workflow_info(content, "ipe", temp_id)
-    assert info.get("e2b_mode") == False
+    assert info.e2b_mode is False
 
 
 def test_e2b_mode_with_other_params():
@@ -301,20 +304,210 @@ def test_e2b_mode_with_other_params():
     content = "adw_test_iso adw-12345678 --e2b"
     temp_id = "adw-temp9999"
     info = extract_workflow_info(content, "adw", temp_id)
-    assert info.get("e2b_mode") == True
+    assert info.e2b_mode is True
     # Workflow ID extraction depends on AI classifier, so we just verify e2b_mode
 
     # IPE workflow with ID and E2B
     content = "ipe_build_iso ipe-87654321 e2b=true"
     temp_id = "ipe-temp8888"
     info = extract_workflow_info(content, "ipe", temp_id)
-    assert info.get("e2b_mode") == True
-    assert info.get("workflow_id") == "ipe-87654321"
+    assert info.e2b_mode is True
+    assert info.workflow_id == "ipe-87654321"
+
+
+@pytest.mark.parametrize("content,expected_id", [
+    # Explicit ID forms
+    ("adw_plan_iso adw-1a2b3c4d", "1a2b3c4d"),
+    ("adw_plan_iso adw_id: 1a2b3c4d", "1a2b3c4d"),
+    ("adw_plan_iso ADW ID=1A2B3C4D", "1a2b3c4d"),
+    ("adw_build_iso adw_id 00000000", "00000000"),
+    # Bare hex token right after the workflow name
+    ("adw_build_iso 9f8e7d6c", "9f8e7d6c"),
+    # Words shaped like IDs are not IDs
+    ("adw_plan_iso adw-isolated", None),
+    ("adw_plan_iso on the adw-settings page", None),
+    ("adw_plan_iso tomorrow", None),
+    ("adw_plan_iso deadbeef", None),
+    ("adw_plan_iso adw-1a2b3c4d5", None),
+])
+def test_adw_fast_extraction_ids(content, expected_id):
+    """Test the ADW IDs the deterministic parser accepts."""
+    from trigger_webhook import _extract_adw_info_fast
+
+    info = _extract_adw_info_fast(content)
+    assert info is not None
+    assert info.has_workflow is True
+    assert info.workflow_id == expected_id
+
+
+@pytest.mark.parametrize("content", [
+    # Dependent workflows without a recognizable ID
+    "adw_build_iso",
+    "adw_build_iso adw-isolated",
+    "adw_test_iso for the adw-settings page",
+    "adw_review_iso deadbeef",
+    # "heavy" outside a model_set phrase
+    "adw_plan_iso with heavy lifting",
+    # No ADW workflow at all
+    "ipe_plan_iso",
+    "just a comment",
+    "",
+])
+def test_adw_fast_extraction_falls_back(content):
+    """Test that ambiguous content is left to the classifier (None)."""
+    from trigger_webhook import _extract_adw_info_fast
+
+    assert _extract_adw_info_fast(content) is None
+
+
+@pytest.mark.parametrize("content,expected_model_set", [
+    ("adw_plan_iso", "base"),
+    ("adw_plan_iso model_set heavy", "heavy"),
+    ("adw_plan_iso model set: heavy", "heavy"),
+    ("adw_plan_iso model-set=base", "base"),
+    ("adw_plan_iso MODEL_SET HEAVY", "heavy"),
+])
+def test_adw_fast_extraction_model_set(content, expected_model_set):
+    """Test model_set parsing in the deterministic ADW parser."""
+    from trigger_webhook import _extract_adw_info_fast
+
+    assert _extract_adw_info_fast(content).model_set == expected_model_set
+
+
+@pytest.mark.parametrize("content,expected_command", [
+    ("adw_sdlc_zte_iso", "adw_sdlc_ZTE_iso"),
+    ("ADW_SDLC_ZTE_ISO", "adw_sdlc_ZTE_iso"),
+    ("adw_sdlc_iso", "adw_sdlc_iso"),
+    ("adw_plan_iso", "adw_plan_iso"),
+])
+def test_adw_fast_extraction_canonical_names(content, expected_command):
+    """Test that detection names map to the names classify_adw uses."""
+    from trigger_webhook import _extract_adw_info_fast
+
+    assert _extract_adw_info_fast(content).workflow_command == expected_command
+
+
+def _drain_comments():
+    """Wait for the comment worker to mark every queued comment done."""
+    import threading
+    from trigger_webhook import _COMMENT_QUEUE
+
+    waiter = threading.Thread(target=_COMMENT_QUEUE.join, daemon=True)
+    waiter.start()
+    waiter.join(timeout=5)
+    assert not waiter.is_alive(), "comment queue never drained"
+    assert _COMMENT_QUEUE.unfinished_tasks == 0
+
+
+def _hold_worker():
+    """Park the comment worker in a post so the next comments form one batch."""
+    import threading
+    from trigger_webhook import _post_comment
+
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_comment(issue_number, body):
+        started.set()
+        release.wait(timeout=5)
+
+    _post_comment(blocking_comment, "0", "hold")
+    assert started.wait(timeout=5)
+    return release
+
+
+def test_comment_worker_merges_comments_per_issue():
+    """Test that a batch becomes one comment per (function, issue), in order."""
+    from trigger_webhook import _post_comment
+
+    posted_a, posted_b = [], []
+
+    def comment_a(issue_number, body):
+        posted_a.append((issue_number, body))
+
+    def comment_b(issue_number, body):
+        posted_b.append((issue_number, body))
+
+    release = _hold_worker()
+    _post_comment(comment_a, "1", "first")
+    _post_comment(comment_a, "2", "other issue")
+    _post_comment(comment_b, "1", "other client")
+    _post_comment(comment_a, "1", "second")
+    release.set()
+    _drain_comments()
+
+    assert posted_a == [("1", "first\n\n---\n\nsecond"), ("2", "other issue")]
+    assert posted_b == [("1", "other client")]
+
+
+def test_comment_worker_continues_after_failed_post():
+    """Test that a failing post neither stops later posts nor leaks task_done."""
+    from trigger_webhook import _post_comment
+
+    posted = []
+
+    def failing_comment(issue_number, body):
+        raise RuntimeError("GitHub unavailable")
+
+    def comment(issue_number, body):
+        posted.append((issue_number, body))
+
+    release = _hold_worker()
+    _post_comment(failing_comment, "1", "lost")
+    _post_comment(comment, "2", "delivered")
+    release.set()
+    _drain_comments()
+
+    _post_comment(comment, "3", "next batch")
+    _drain_comments()
+
+    assert posted == [("2", "delivered"), ("3", "next batch")]
+
+
+def test_comment_worker_starts_once_under_concurrency(monkeypatch):
+    """Test that concurrent first posts start a single comment worker."""
+    import threading
+    import time
+    import types
+    import trigger_webhook
+
+    started, exit_hooks = [], []
+
+    def fake_worker():
+        started.append(threading.current_thread().name)
+
+    def slow_thread(*args, **kwargs):
+        time.sleep(0.01)  # widen the window between the check and the start
+        return threading.Thread(*args, **kwargs)
+
+    monkeypatch.setattr(trigger_webhook, "_comment_worker_thread", None)
+    monkeypatch.setattr(trigger_webhook, "_comment_worker", fake_worker)
+    monkeypatch.setattr(trigger_webhook, "threading", types.SimpleNamespace(Thread=slow_thread))
+    monkeypatch.setattr(trigger_webhook.atexit, "register", exit_hooks.append)
+
+    barrier = threading.Barrier(8)
+
+    def start():
+        barrier.wait()
+        trigger_webhook._start_comment_worker()
+
+    starters = [threading.Thread(target=start) for _ in range(8)]
+    for t in starters:
+        t.start()
+    for t in starters:
+        t.join()
+    trigger_webhook._comment_worker_thread.join(timeout=5)
+
+    assert started == ["comment-worker"]
+    assert exit_hooks == [trigger_webhook._COMMENT_QUEUE.join]
 
 
 if __name__ == "__main__":
     # Run tests
     print("Running Unified Webhook Router Tests...\n")
 
-    # Run pytest
-    pytest.main([__file__, "-v", "--tb=short"])
+    # Run pytest; a standalone run skips the .pytest_cache writes (CI runs
+    # through plain pytest keep the cache for --lf / --ff ordering)
+    pytest.main([
+        __file__, "-v", "--tb=short",
+        "-p", "no:cacheprovider", "--import-mode=importlib",
+    ])
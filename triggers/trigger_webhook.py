@@ -1,6 +1,6 @@
 #!/usr/bin/env -S uv run
 # /// script
-# dependencies = ["fastapi", "uvicorn", "python-dotenv", "claude-agent-sdk", "pydantic"]
+# dependencies = ["fastapi", "uvicorn", "uvloop; sys_platform != 'win32'", "httptools", "python-dotenv", "claude-agent-sdk", "pydantic", "orjson"]
 # ///
 
 """
@@ -14,22 +14,40 @@ Usage: uv run trigger_webhook.py
 
 Environment Requirements:
 - PORT: Server port (default: 8000)
+- LOG_LEVEL: Router log level (default: INFO)
 - GITHUB_PAT: GitHub Personal Access Token
 - CLAUDE_CODE_OAUTH_TOKEN: Claude API key
 """
 
+import asyncio
+import atexit
+import contextlib
+import functools
+import logging
+import logging.handlers
 import os
+import queue
+import re
 import subprocess
 import sys
-from typing import Optional, Literal
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import FrozenSet, NamedTuple, Optional, Literal
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 import uvicorn
 
-# Add both adws and ipe to path
+# Add both adws and ipe to path (needed by the imports below, so this stays
+# at import time; skipped if already present, e.g. on re-import)
 repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, os.path.join(repo_root, "adws"))
-sys.path.insert(0, os.path.join(repo_root, "ipe"))
+ADWS_DIR = os.path.join(repo_root, "adws")
+IPE_DIR = os.path.join(repo_root, "ipe")
+AGENTS_DIR = os.path.join(repo_root, "agents")
+for _path in (ADWS_DIR, IPE_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 # Import from ADW system
 from adw_modules.utils import make_adw_id, setup_logger as adw_setup_logger, get_safe_subprocess_env
@@ -38,26 +56,64 @@ from adw_modules.workflow_ops import extract_adw_info, AVAILABLE_ADW_WORKFLOWS
 from adw_modules.state import ADWState
 
 # Import from IPE system (legacy)
-from ipe_modules.ipe_utils import make_ipe_id, setup_logger as ipe_setup_logger
+from ipe_modules.ipe_utils import loads_json, make_ipe_id, setup_logger as ipe_setup_logger
 from ipe_modules.ipe_github import make_issue_comment as ipe_make_issue_comment
 from ipe_modules.ipe_state import IPEState
 
-# Load environment variables
-load_dotenv()
+# Configuration (PORT is read from the environment by _bootstrap)
+PORT = 8000
 
-# Configuration
-PORT = int(os.getenv("PORT", "8000"))
+# Router log; handlers are attached by _setup_logging
+log = logging.getLogger("webhook_router")
 
-# Bot identifiers to prevent loops
-BOT_IDENTIFIERS = [
+
+@functools.lru_cache(maxsize=None)
+def _bootstrap() -> None:
+    """Load .env and read the configuration, once per process.
+
+    Called from __main__ and the app lifespan rather than at import, so
+    importing the module (tests, tooling) does not parse .env.
+    """
+    global PORT
+    load_dotenv()
+    PORT = int(os.getenv("PORT", "8000"))
+    _setup_logging(os.getenv("LOG_LEVEL", "INFO"))
+    log.info("Starting Unified Webhook Router on port %d", PORT)
+
+
+def _setup_logging(level: str) -> None:
+    """Send the router log to stdout through a background listener thread.
+
+    Handlers only enqueue records, so webhook handling never waits on a
+    stdout write or flush.
+    """
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    log_queue: queue.Queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, console_handler)
+    listener.start()
+    # Drain queued records before the interpreter exits
+    atexit.register(listener.stop)
+
+    log.setLevel(level.upper())
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.propagate = False
+
+# Bot identifiers to prevent loops (tuples: _BOT_RE and _BOT_OR_ERROR_RE are
+# compiled from these at import, so they must not change afterwards)
+BOT_IDENTIFIERS = (
     ADW_BOT_IDENTIFIER,  # "[ADW-AGENTS]"
     "[IPE-AGENTS]",
     "🤖 IPE",
     "🤖 ADW",
-]
+)
+
+# Single-scan matcher for any bot identifier (case-sensitive, like the list)
+_BOT_RE = re.compile("|".join(map(re.escape, BOT_IDENTIFIERS)))
 
 # Error patterns that indicate failure/error messages (shouldn't trigger workflows)
-ERROR_PATTERNS = [
+ERROR_PATTERNS = (
     "failed",
     "error:",
     "traceback",
@@ -69,11 +125,20 @@ ERROR_PATTERNS = [
     "isolated test phase failed",
     "isolated review phase failed",
     "isolated ship phase failed",
-]
+)
+
+# Loop guard: bot identifiers (case-folded) and error patterns in one scan
+# of lowercased content
+_BOT_OR_ERROR_RE = re.compile("|".join(
+    map(re.escape, [identifier.lower() for identifier in BOT_IDENTIFIERS] + list(ERROR_PATTERNS))
+))
 
-# Track recent failures to prevent loops
-RECENT_FAILURES = {}
+# Track recent failures to prevent loops. Keys are kept in failure-time
+# order, so expired entries are always at the front and can be dropped
+# without scanning the rest.
+RECENT_FAILURES: "OrderedDict[str, float]" = OrderedDict()
 FAILURE_COOLDOWN_SECONDS = 300  # 5 minutes
+MAX_RECENT_FAILURES = 4096
 
 # IMPORTANT: Workflow lists MUST be ordered by specificity (longest/most-specific first).
 # This prevents substring matching bugs where shorter workflow names match before longer ones.
@@ -96,15 +161,18 @@ AVAILABLE_ADW_WORKFLOWS_LOCAL = [
 # Only needed for workflows where script filename differs from detection name
 ADW_WORKFLOW_TO_SCRIPT = {}
 
-ADW_DEPENDENT_WORKFLOWS = [
+# Sets (not lists) for O(1) membership checks; the ordered lists above and
+# below remain the single source of names for detection and display
+ADW_DEPENDENT_WORKFLOWS: FrozenSet[str] = frozenset({
     "adw_build_iso",
     "adw_test_iso",
     "adw_review_iso",
     "adw_document_iso",
     "adw_ship_iso",
-]
+})
 
 # IPE Workflows - ORDERED BY SPECIFICITY (longest/most-specific first)
+# All names are lowercase for case-insensitive matching
 AVAILABLE_IPE_WORKFLOWS = [
     "ipe_sdlc_iso",       # Full SDLC first (in case future variants exist)
     "ipe_document_iso",
@@ -120,34 +188,146 @@ AVAILABLE_IPE_WORKFLOWS = [
 ]
 
 # Destructive workflows that require explicit confirmation
-IPE_DESTRUCTIVE_WORKFLOWS = [
+IPE_DESTRUCTIVE_WORKFLOWS: FrozenSet[str] = frozenset({
     "ipe_destroy",
-]
+})
 
-IPE_DEPENDENT_WORKFLOWS = [
+IPE_DEPENDENT_WORKFLOWS: FrozenSet[str] = frozenset({
     "ipe_build_ami_iso",  # Requires IPE ID (NEW)
     "ipe_build_iso",
     "ipe_test_iso",
     "ipe_review_iso",
     "ipe_document_iso",
     "ipe_ship_iso",
-]
+})
+
+# One precompiled alternation over every ADW and IPE workflow name, so
+# detection is a single scan of the content. No workflow name is a substring
+# of (or overlaps) another, so findall() sees every occurrence; list order
+# still decides between several. Both lists are lowercase, so the names are
+# used as-is against lowercased content, never lowered per call.
+_WORKFLOW_RE = re.compile(
+    "|".join(map(re.escape, AVAILABLE_IPE_WORKFLOWS + AVAILABLE_ADW_WORKFLOWS_LOCAL))
+)
+
+# Every workflow with its system, in detection priority: IPE (the more
+# specific system) before ADW, each list in its own specificity order
+_ALL_WORKFLOWS = (
+    [(workflow, "ipe") for workflow in AVAILABLE_IPE_WORKFLOWS]
+    + [(workflow, "adw") for workflow in AVAILABLE_ADW_WORKFLOWS_LOCAL]
+)
+
+# "adw_" / "ipe_": every workflow name starts with one of these
+_WORKFLOW_PREFIXES = tuple(sorted({
+    workflow[:4] for workflow in AVAILABLE_IPE_WORKFLOWS + AVAILABLE_ADW_WORKFLOWS_LOCAL
+}))
+
+# Anything shorter than the shortest workflow name can't contain one
+_MIN_WORKFLOW_LEN = min(map(len, AVAILABLE_IPE_WORKFLOWS + AVAILABLE_ADW_WORKFLOWS_LOCAL))
+
+_AMI_ID_RE = re.compile(r'ami_id=(ami-[a-f0-9]+)')
+
+# Each IPE workflow name as a standalone token, capturing (in a lookahead,
+# so back-to-back commands are all seen) the next two tokens that may carry
+# the IPE ID and model set. Matched against lowercased content.
+_IPE_COMMAND_RES = {
+    workflow: re.compile(
+        r"(?<!\S)" + re.escape(workflow) + r"(?!\S)(?=(?:\s+(\S+))?(?:\s+(\S+))?)"
+    )
+    for workflow in AVAILABLE_IPE_WORKFLOWS
+}
+_IPE_MODEL_SETS = frozenset({"sonnet", "opus", "haiku"})
+
+# Every IPE key=value flag checked by extract_ipe_info_local, matched in one
+# pass over lowercased content. "deploy-" stands for any other deploy-* mode.
+_IPE_PARAM_RE = re.compile(
+    r"(?:environment|mode|delete_ami|build_new_ami|build-new-ami)="
+    r"(?:staging|prod|dev|deploy-custom-ami|deploy-latest-ami|deploy-?|plan-only|true|false)"
+    r"|delete-ami"
+)
+
+# Workflows that read an environment=... flag
+_IPE_ENVIRONMENT_WORKFLOWS: FrozenSet[str] = frozenset({"ipe_destroy", "ipe_deploy"})
+
+# Flag -> value, in precedence order (first flag present wins)
+_ENVIRONMENT_FLAGS = (
+    ("environment=staging", "staging"),
+    ("environment=prod", "prod"),
+    ("environment=dev", "dev"),
+)
+_DEPLOY_MODE_FLAGS = (
+    ("mode=deploy-custom-ami", "deploy-custom-ami"),
+    ("mode=deploy-latest-ami", "deploy-latest-ami"),
+    ("mode=deploy", "deploy"),
+    ("mode=plan-only", "plan-only"),
+)
+
+# Deterministic ADW extraction, tried before the classify_adw agent. An ADW
+# ID is the first 8 hex digits of a uuid4 (make_adw_id): "adw-<id>",
+# "adw_id: <id>", or a bare token right after the workflow name. The ID must
+# contain a digit, so words like "isolated", "settings" or "deadbeef" are
+# never taken for one; the rare all-letter ID just falls back to the agent.
+# Matched against lowercased content.
+_ADW_ID_RE = re.compile(
+    r'\badw(?:-|[ _]?id\s*[:=]?\s*)((?=[a-f]*[0-9])[0-9a-f]{8})\b', re.ASCII
+)
+_BARE_ADW_ID_RE = re.compile(r'(?=[a-f]*[0-9])[0-9a-f]{8}')
+_ADW_MODEL_SET_RE = re.compile(r'\bmodel[\s_-]?set\W*(base|heavy)\b', re.ASCII)
+
+# Detection names (lowercase) to the names classify_adw validates against
+_ADW_CANONICAL_NAMES = {name.lower(): name for name in AVAILABLE_ADW_WORKFLOWS}
+
+# E2B execution flag as a standalone token: --e2b, -e2b, --e2b=true or
+# e2b=true (spaces allowed around "="); matched against lowercased content
+_E2B_RE = re.compile(r'(?:(?<=\s)|^)(?:--?e2b(?:\s*=\s*true)?|e2b\s*=\s*true)(?=\s|$)')
+
+# Only these events can carry a workflow command; anything else is
+# rejected before the payload is read
+SUPPORTED_EVENTS = frozenset({"issues", "issue_comment"})
+
+# Routing tasks for accepted webhooks; the event loop only keeps weak
+# references to tasks, so they are held here until done
+_BACKGROUND_TASKS: set = set()
 
 # Type definitions
 WorkflowType = Literal["adw", "ipe"]
 
+@contextlib.asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Run _bootstrap before serving, and finish accepted work on shutdown."""
+    _bootstrap()
+    yield
+    if _BACKGROUND_TASKS:
+        log.info("Waiting for %d accepted webhook(s) to finish routing", len(_BACKGROUND_TASKS))
+        await asyncio.gather(*_BACKGROUND_TASKS, return_exceptions=True)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Unified Webhook Router",
     description="Routes GitHub webhooks to ADW or IPE workflows",
+    lifespan=_lifespan,
 )
 
-print(f"Starting Unified Webhook Router on port {PORT}")
 
+@functools.lru_cache(maxsize=32)
+def _lowercase(content: str) -> str:
+    """Return content.lower(), shared by every check on the same webhook body.
 
+    The bot/error check, workflow detection, IPE extraction and the E2B flag
+    check all want the lowercased body; the cache hit costs only a lookup
+    on the (already hashed) string instead of another full pass.
+    """
+    return content.lower()
+
+
+@functools.lru_cache(maxsize=256)
 def detect_workflow_type(content: str) -> tuple[Optional[WorkflowType], Optional[str]]:
     """Detect workflow type and command from content.
 
+    The result depends only on content, so it is cached; webhook retries and
+    redeliveries then skip the scan.
+
     IMPORTANT: Workflow lists must be ordered by specificity (longest/most-specific first)
     to prevent substring matching bugs. For example, 'adw_sdlc_zte_iso' must come
     before 'adw_sdlc_iso' since the latter is a substring prefix.
@@ -155,61 +335,131 @@ def detect_workflow_type(content: str) -> tuple[Optional[WorkflowType], Optional
     Returns:
         tuple[WorkflowType | None, str | None]: (workflow_type, workflow_command)
     """
-    content_lower = content.lower()
+    # Events without a body (edits, labels, closes) arrive as ""
+    if not content:
+        return (None, None)
 
-    # Check for IPE workflows first (more specific system)
-    for workflow in AVAILABLE_IPE_WORKFLOWS:
-        if workflow.lower() in content_lower:
-            return ("ipe", workflow)
+    content_lower = _lowercase(content)
 
-    # Check for ADW workflows
-    for workflow in AVAILABLE_ADW_WORKFLOWS_LOCAL:
-        if workflow.lower() in content_lower:
-            return ("adw", workflow)
+    # Most comments name no workflow at all; length and substring tests for
+    # the name prefixes are much cheaper than the regex scan
+    if len(content_lower) < _MIN_WORKFLOW_LEN or not any(
+        prefix in content_lower for prefix in _WORKFLOW_PREFIXES
+    ):
+        return (None, None)
+
+    found = set(_WORKFLOW_RE.findall(content_lower))
+    if not found:
+        return (None, None)
+
+    # IPE workflows come first in _ALL_WORKFLOWS (more specific system)
+    for workflow, workflow_type in _ALL_WORKFLOWS:
+        if workflow in found:
+            return (workflow_type, workflow)
 
     return (None, None)
 
 
+@functools.lru_cache(maxsize=256)
+def detect_e2b_mode(content: str) -> bool:
+    """Check whether content asks for the workflow to run in an E2B sandbox.
+
+    Accepts --e2b, -e2b, --e2b=true and e2b=true in any case. A bare "e2b"
+    or a flag glued to other text doesn't count. Cached like
+    detect_workflow_type.
+
+    Returns:
+        bool: True if an E2B flag is present
+    """
+    if not content:
+        return False
+    content_lower = _lowercase(content)
+    if "e2b" not in content_lower:
+        return False
+    return _E2B_RE.search(content_lower) is not None
+
+
+def is_bot_message(content: str) -> bool:
+    """Check if content carries one of the BOT_IDENTIFIERS."""
+    return _BOT_RE.search(content) is not None
+
+
 def is_bot_or_error_message(content: str) -> bool:
-    """Check if content is from bot or an error message that shouldn't trigger workflows."""
-    content_lower = content.lower()
+    """Check if content is from bot or an error message that shouldn't trigger workflows.
 
-    # Check for bot identifiers
-    if any(bot_id in content for bot_id in BOT_IDENTIFIERS):
-        return True
+    Unlike is_bot_message, bot identifiers match in any case here; for the
+    loop guard, erring towards ignoring a comment is the safe side.
+    """
+    if not content:
+        return False
 
-    # Check for error patterns (case-insensitive)
-    if any(pattern in content_lower for pattern in ERROR_PATTERNS):
-        return True
+    return _BOT_OR_ERROR_RE.search(_lowercase(content)) is not None
 
-    return False
 
 
 
+def _expire_failures(now: float) -> None:
+    """Drop failures older than the cooldown from the front of RECENT_FAILURES."""
+    while RECENT_FAILURES:
+        key, failure_time = next(iter(RECENT_FAILURES.items()))
+        if now - failure_time < FAILURE_COOLDOWN_SECONDS:
+            break
+        del RECENT_FAILURES[key]
+
 
 def check_recent_failure(issue_number: str, workflow_command: str) -> bool:
     """Check if this workflow recently failed for this issue."""
-    import time
+    now = monotonic()
+    _expire_failures(now)
 
     key = f"{issue_number}:{workflow_command}"
+    failure_time = RECENT_FAILURES.get(key)
 
-    if key in RECENT_FAILURES:
-        failure_time = RECENT_FAILURES[key]
-        elapsed = time.time() - failure_time
-
-        if elapsed < FAILURE_COOLDOWN_SECONDS:
-            print(f"Ignoring {workflow_command} for issue #{issue_number} - recently failed {elapsed:.0f}s ago")
-            return True
+    if failure_time is not None:
+        elapsed = now - failure_time
+        log.info(
+            "Ignoring %s for issue #%s - recently failed %.0fs ago",
+            workflow_command, issue_number, elapsed,
+        )
+        return True
 
     return False
 
 
 def record_failure(issue_number: str, workflow_command: str):
     """Record a workflow failure."""
-    import time
+    now = monotonic()
+    _expire_failures(now)
 
     key = f"{issue_number}:{workflow_command}"
-    RECENT_FAILURES[key] = time.time()
+    RECENT_FAILURES[key] = now
+    RECENT_FAILURES.move_to_end(key)
+    # Bound memory even when many failures land within one cooldown
+    while len(RECENT_FAILURES) > MAX_RECENT_FAILURES:
+        RECENT_FAILURES.popitem(last=False)
+
+
+def _ipe_command_args(content: str, content_lower: str, workflow: str):
+    """Yield the (up to two) tokens after each standalone ``workflow`` token.
+
+    Tokens keep their original case. Only the workflow occurrences are
+    visited, not every token in the body.
+    """
+    if len(content) != len(content_lower):
+        # A character lowercased to several, so offsets no longer line up;
+        # whitespace is unchanged, so the token lists still do
+        parts = content.split()
+        for i, part in enumerate(content_lower.split()):
+            if part == workflow:
+                yield tuple(parts[i + 1:i + 3])
+        return
+
+    for match in _IPE_COMMAND_RES[workflow].finditer(content_lower):
+        yield tuple(
+            content[start:end]
+            for start, end in (match.span(1), match.span(2))
+            if start >= 0
+        )
 
 
 def extract_ipe_info_local(content: str, temp_id: str) -> dict:
@@ -230,14 +480,13 @@ def extract_ipe_info_local(content: str, temp_id: str) -> dict:
     - delete_ami: bool (for ipe_destroy)
     - destroy_confirmed: bool (for ipe_destroy)
     """
-    content_lower = content.lower()
+    content_lower = _lowercase(content)
 
-    # Check if content contains any IPE workflow
-    workflow_found = None
-    for workflow in AVAILABLE_IPE_WORKFLOWS:
-        if workflow.lower() in content_lower:
-            workflow_found = workflow
-            break
+    # Check if content contains any IPE workflow. detect_workflow_type
+    # prefers IPE and is cached, so for a webhook it has already routed
+    # this reuses its scan instead of repeating it
+    workflow_type, detected = detect_workflow_type(content)
+    workflow_found = detected if workflow_type == "ipe" else None
 
     if not workflow_found:
         return {
@@ -254,35 +503,39 @@ def extract_ipe_info_local(content: str, temp_id: str) -> dict:
 
     # Try to extract IPE ID and model set from content
     # Pattern: ipe_workflow_name [ipe-id] [model]
-    parts = content.split()
     ipe_id = None
     model_set = None
 
-    for i, part in enumerate(parts):
-        if part.lower() == workflow_found:
-            # Check for ipe-id in next parts
-            if i + 1 < len(parts) and parts[i + 1].startswith("ipe-"):
-                ipe_id = parts[i + 1]
-            # Check for model set
-            if i + 2 < len(parts) and parts[i + 2] in ["sonnet", "opus", "haiku"]:
-                model_set = parts[i + 2]
-            elif i + 1 < len(parts) and parts[i + 1] in ["sonnet", "opus", "haiku"]:
-                model_set = parts[i + 1]
+    for following in _ipe_command_args(content, content_lower, workflow_found):
+        # Check for ipe-id in next parts
+        if following and following[0].startswith("ipe-"):
+            ipe_id = following[0]
+        # Check for model set
+        if len(following) > 1 and following[1] in _IPE_MODEL_SETS:
+            model_set = following[1]
+        elif following and following[0] in _IPE_MODEL_SETS:
+            model_set = following[0]
+
+    # Substring tests below are against the matched flags, not the content
+    params = set(_IPE_PARAM_RE.findall(content_lower))
+    # Any other mode=deploy-* value cancels a plain mode=deploy
+    if "mode=deploy-" in params:
+        params.discard("mode=deploy")
+
+    # Destroy and deploy take an environment; dev is the default
+    environment = "dev"
+    if workflow_found in _IPE_ENVIRONMENT_WORKFLOWS:
+        environment = next(
+            (value for flag, value in _ENVIRONMENT_FLAGS if flag in params), "dev"
+        )
 
     # For ipe_destroy, extract additional parameters
-    environment = "dev"  # default
     delete_ami = False
     destroy_confirmed = False
 
     if workflow_found == "ipe_destroy":
-        # Check for environment parameter
-        if "environment=staging" in content_lower:
-            environment = "staging"
-        elif "environment=prod" in content_lower:
-            environment = "prod"
-
         # Check for delete_ami flag
-        if "delete_ami=true" in content_lower or "delete-ami" in content_lower:
+        if "delete_ami=true" in params or "delete-ami" in params:
             delete_ami = True
 
         # Check for DESTROY confirmation (must be uppercase)
@@ -294,34 +547,20 @@ def extract_ipe_info_local(content: str, temp_id: str) -> dict:
     ami_id = None
 
     if workflow_found == "ipe_deploy":
-        deploy_mode = "deploy-latest-ami"  # default
-
-        if "mode=deploy-custom-ami" in content_lower:
-            deploy_mode = "deploy-custom-ami"
-        elif "mode=deploy-latest-ami" in content_lower:
-            deploy_mode = "deploy-latest-ami"
-        elif "mode=deploy" in content_lower and "mode=deploy-" not in content_lower:
-            deploy_mode = "deploy"
-        elif "mode=plan-only" in content_lower:
-            deploy_mode = "plan-only"
-
-        if "environment=staging" in content_lower:
-            environment = "staging"
-        elif "environment=prod" in content_lower:
-            environment = "prod"
-        elif "environment=dev" in content_lower:
-            environment = "dev"
-
-        import re
-        ami_match = re.search(r'ami_id=(ami-[a-f0-9]+)', content_lower)
+        deploy_mode = next(
+            (value for flag, value in _DEPLOY_MODE_FLAGS if flag in params),
+            "deploy-latest-ami",  # default
+        )
+
+        ami_match = _AMI_ID_RE.search(content_lower)
         if ami_match:
             ami_id = ami_match.group(1)
 
     # Extract build_new_ami parameter
     build_new_ami = None
-    if "build_new_ami=true" in content_lower or "build-new-ami=true" in content_lower:
+    if "build_new_ami=true" in params or "build-new-ami=true" in params:
         build_new_ami = True
-    elif "build_new_ami=false" in content_lower or "build-new-ami=false" in content_lower:
+    elif "build_new_ami=false" in params or "build-new-ami=false" in params:
         build_new_ami = False
 
     return {
@@ -338,62 +577,257 @@ def extract_ipe_info_local(content: str, temp_id: str) -> dict:
     }
 
 
-def extract_workflow_info(content: str, workflow_type: WorkflowType, temp_id: str) -> dict:
+class WorkflowInfo(NamedTuple):
+    """Workflow details extracted from an issue or comment."""
+
+    has_workflow: bool
+    workflow_command: Optional[str]
+    workflow_id: Optional[str]  # adw_id or ipe_id
+    model_set: Optional[str]
+    # IPE destroy/deploy parameters
+    environment: Optional[str] = None
+    delete_ami: bool = False
+    destroy_confirmed: bool = False
+    deploy_mode: Optional[str] = None
+    ami_id: Optional[str] = None
+    build_new_ami: Optional[bool] = None
+    e2b_mode: bool = False
+
+
+_NO_WORKFLOW = WorkflowInfo(
+    has_workflow=False, workflow_command=None, workflow_id=None, model_set=None
+)
+
+
+def _extract_adw_info_fast(content: str) -> Optional[WorkflowInfo]:
+    """Extract ADW workflow, ID and model set without the classifier agent.
+
+    Returns None when the content is ambiguous (a dependent workflow with no
+    recognizable ID, or "heavy" mentioned outside a model_set phrase) so the
+    caller can fall back to classify_adw.
+    """
+    workflow_type, detected = detect_workflow_type(content)
+    workflow_command = _ADW_CANONICAL_NAMES.get(detected) if workflow_type == "adw" else None
+    if not workflow_command:
+        return None
+
+    content_lower = _lowercase(content)
+    id_match = _ADW_ID_RE.search(content_lower)
+    adw_id = id_match.group(1) if id_match else None
+    if adw_id is None:
+        following = content_lower.split(detected, 1)[1].split(None, 1)
+        if following and _BARE_ADW_ID_RE.fullmatch(following[0]):
+            adw_id = following[0]
+    if adw_id is None and detected in ADW_DEPENDENT_WORKFLOWS:
+        return None
+
+    model_match = _ADW_MODEL_SET_RE.search(content_lower)
+    if model_match:
+        model_set = model_match.group(1)
+    elif "heavy" in content_lower:
+        return None
+    else:
+        model_set = "base"
+
+    return WorkflowInfo(
+        has_workflow=True,
+        workflow_command=workflow_command,
+        workflow_id=adw_id,
+        model_set=model_set,
+        e2b_mode=detect_e2b_mode(content),
+    )
+
+
+def extract_workflow_info(content: str, workflow_type: WorkflowType, temp_id: str) -> WorkflowInfo:
     """Extract workflow information based on type.
 
     Returns:
-        dict with keys:
-        - has_workflow: bool
-        - workflow_command: str or None
-        - workflow_id: str or None (adw_id or ipe_id)
-        - model_set: str or None
+        WorkflowInfo; IPE-only fields keep their defaults for ADW workflows
     """
     if workflow_type == "adw":
+        # Plain commands parse deterministically; only ambiguous content
+        # pays for a classify_adw agent call
+        info = _extract_adw_info_fast(content)
+        if info is not None:
+            return info
         result = extract_adw_info(content, temp_id)
-        return {
-            "has_workflow": result.has_workflow,
-            "workflow_command": result.workflow_command,
-            "workflow_id": result.adw_id,
-            "model_set": result.model_set,
-        }
+        return WorkflowInfo(
+            has_workflow=result.has_workflow,
+            workflow_command=result.workflow_command,
+            workflow_id=result.adw_id,
+            model_set=result.model_set,
+            e2b_mode=detect_e2b_mode(content),
+        )
     elif workflow_type == "ipe":
         # Use local IPE extraction function
         result = extract_ipe_info_local(content, temp_id)
-        return {
-            "has_workflow": result.get("has_workflow"),
-            "workflow_command": result.get("workflow_command"),
-            "workflow_id": result.get("ipe_id"),
-            "model_set": result.get("model_set"),
+        return WorkflowInfo(
+            has_workflow=result.get("has_workflow"),
+            workflow_command=result.get("workflow_command"),
+            workflow_id=result.get("ipe_id"),
+            model_set=result.get("model_set"),
             # Pass through destroy-specific params
-            "environment": result.get("environment"),
-            "delete_ami": result.get("delete_ami", False),
-            "destroy_confirmed": result.get("destroy_confirmed", False),
+            environment=result.get("environment"),
+            delete_ami=result.get("delete_ami", False),
+            destroy_confirmed=result.get("destroy_confirmed", False),
             # Pass through deploy-specific params
-            "deploy_mode": result.get("deploy_mode"),
-            "ami_id": result.get("ami_id"),
-            "build_new_ami": result.get("build_new_ami"),
-        }
+            deploy_mode=result.get("deploy_mode"),
+            ami_id=result.get("ami_id"),
+            build_new_ami=result.get("build_new_ami"),
+            e2b_mode=detect_e2b_mode(content),
+        )
 
-    return {
-        "has_workflow": False,
-        "workflow_command": None,
-        "workflow_id": None,
-        "model_set": None,
-    }
+    return _NO_WORKFLOW
+
+
+# Issue comments waiting to be posted by the comment worker, as
+# (make_issue_comment, issue_number, body); bounded so a GitHub outage
+# pushes back on the handlers instead of growing without limit
+_COMMENT_QUEUE: "queue.Queue[tuple]" = queue.Queue(maxsize=1024)
+
+
+def _post_comment(make_issue_comment, issue_number: str, comment: str) -> None:
+    """Queue an issue comment for the background comment worker.
+
+    Handlers return without waiting on GitHub; comments keep their order.
+    """
+    _start_comment_worker()
+    _COMMENT_QUEUE.put((make_issue_comment, issue_number, comment))
+
+
+# The single comment worker; started under the lock because handlers call
+# _post_comment from several asyncio.to_thread threads at once
+_COMMENT_WORKER_LOCK = threading.Lock()
+_comment_worker_thread: Optional[threading.Thread] = None
+
+
+def _start_comment_worker() -> None:
+    """Start the comment worker thread on first use.
+
+    Exactly one worker may run: a second would split per-issue merging and
+    let comments overtake each other.
+    """
+    global _comment_worker_thread
+    if _comment_worker_thread is not None:
+        return
+    with _COMMENT_WORKER_LOCK:
+        if _comment_worker_thread is not None:
+            return
+        _comment_worker_thread = threading.Thread(
+            target=_comment_worker, name="comment-worker", daemon=True
+        )
+        _comment_worker_thread.start()
+        # Post whatever is still queued before the interpreter exits
+        atexit.register(_COMMENT_QUEUE.join)
+
+
+def _comment_worker() -> None:
+    """Post queued comments, merging those queued together for one issue.
 
+    Everything already waiting is taken as one batch, so a burst for the
+    same issue becomes a single comment (and a single GitHub request).
+    """
+    while True:
+        batch = [_COMMENT_QUEUE.get()]
+        while True:
+            try:
+                batch.append(_COMMENT_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+
+        grouped: dict = {}
+        for make_issue_comment, issue_number, comment in batch:
+            grouped.setdefault((make_issue_comment, issue_number), []).append(comment)
+
+        for (make_issue_comment, issue_number), comments in grouped.items():
+            try:
+                make_issue_comment(issue_number, "\n\n---\n\n".join(comments))
+            except Exception:
+                log.exception("Failed to post comment to issue #%s", issue_number)
+
+        for _ in batch:
+            _COMMENT_QUEUE.task_done()
+
+
+@functools.lru_cache(maxsize=1)
+def _subprocess_env() -> dict:
+    """get_safe_subprocess_env(), computed on first launch and then reused.
+
+    The router never changes its environment or working directory after
+    startup, so every launch would otherwise rebuild the same dict.
+    """
+    return get_safe_subprocess_env()
+
+
+def _spawn_workflow(
+    cmd: list,
+    workflow_id: str,
+    issue_number: str,
+    logger,
+    make_issue_comment,
+    manual_cmd: str,
+) -> None:
+    """Launch a workflow script detached, logging to agents/<id>/webhook_subprocess.
+
+    On failure, posts an error comment on the issue with ``manual_cmd`` as a
+    fallback and re-raises.
+    """
+    log.info("Working directory: %s", repo_root)
+
+    # Create log directory for subprocess output
+    log_dir = os.path.join(AGENTS_DIR, workflow_id, "webhook_subprocess")
+    os.makedirs(log_dir, exist_ok=True)
+    stdout_log = os.path.join(log_dir, "stdout.log")
+    stderr_log = os.path.join(log_dir, "stderr.log")
+
+    try:
+        # The child keeps its own copies of the log handles; ours are
+        # closed as soon as it has started
+        with open(stdout_log, "w") as stdout_f, open(stderr_log, "w") as stderr_f:
+            process = subprocess.Popen(
+                cmd,
+                cwd=repo_root,
+                env=_subprocess_env(),
+                start_new_session=True,
+                stdout=stdout_f,
+                stderr=stderr_f,
+            )
+            logger.info(f"Successfully launched subprocess PID {process.pid}")
+            log.info("Subprocess launched with PID: %d", process.pid)
+            log.info("Logs: %s, %s", stdout_log, stderr_log)
+    except Exception as e:
+        error_msg = f"Failed to launch subprocess: {str(e)}"
+        logger.error(error_msg)
+        log.error("ERROR: %s", error_msg)
+        _post_comment(
+            make_issue_comment,
+            issue_number,
+            f"❌ **Webhook Error**: Failed to start workflow\n\n"
+            f"Command: `{' '.join(cmd)}`\n"
+            f"Error: `{str(e)}`\n\n"
+            f"Please try triggering manually with:\n"
+            f"```bash\n{manual_cmd}\n```",
+        )
+        raise
 
-async def handle_adw_workflow(
+
+def handle_adw_workflow(
     workflow_command: str,
     issue_number: str,
     adw_id: Optional[str],
     model_set: Optional[str],
     trigger_reason: str,
 ):
-    """Handle ADW workflow routing."""
+    """Handle ADW workflow routing.
+
+    Blocking (state files, GitHub comments, subprocess launch), so
+    route_workflow runs it in a worker thread.
+    """
 
     # Validate dependent workflows
     if workflow_command in ADW_DEPENDENT_WORKFLOWS and not adw_id:
-        adw_make_issue_comment(
+        _post_comment(
+            adw_make_issue_comment,
             issue_number,
             f"❌ Error: `{workflow_command}` requires an existing ADW ID.\n\n"
             f"Example: `{workflow_command} adw-12345678`",
@@ -429,7 +863,8 @@ async def handle_adw_workflow(
     logger.info(f"Routing ADW workflow: {workflow_command} for issue #{issue_number}")
 
     # Post notification
-    adw_make_issue_comment(
+    _post_comment(
+        adw_make_issue_comment,
         issue_number,
         f"[ADW-AGENTS] 🤖 ADW Webhook: Starting `{workflow_command}`\n\n"
         f"ID: `{final_adw_id}`\n"
@@ -440,44 +875,14 @@ async def handle_adw_workflow(
     # Build and launch command
     # Use mapping to get actual script filename if different from detection name
     script_name = ADW_WORKFLOW_TO_SCRIPT.get(workflow_command, workflow_command)
-    script_path = os.path.join(repo_root, "adws", f"{script_name}.py")
+    script_path = os.path.join(ADWS_DIR, f"{script_name}.py")
     cmd = ["uv", "run", script_path, issue_number, final_adw_id]
 
-    print(f"Launching ADW workflow: {' '.join(cmd)}")
-    print(f"Working directory: {repo_root}")
-
-    # Create log directory for subprocess output
-    log_dir = os.path.join(repo_root, "agents", final_adw_id, "webhook_subprocess")
-    os.makedirs(log_dir, exist_ok=True)
-    stdout_log = os.path.join(log_dir, "stdout.log")
-    stderr_log = os.path.join(log_dir, "stderr.log")
-
-    try:
-        with open(stdout_log, "w") as stdout_f, open(stderr_log, "w") as stderr_f:
-            process = subprocess.Popen(
-                cmd,
-                cwd=repo_root,
-                env=get_safe_subprocess_env(),
-                start_new_session=True,
-                stdout=stdout_f,
-                stderr=stderr_f,
-            )
-            logger.info(f"Successfully launched subprocess PID {process.pid}")
-            print(f"Subprocess launched with PID: {process.pid}")
-            print(f"Logs: {stdout_log}, {stderr_log}")
-    except Exception as e:
-        error_msg = f"Failed to launch subprocess: {str(e)}"
-        logger.error(error_msg)
-        print(f"ERROR: {error_msg}")
-        adw_make_issue_comment(
-            issue_number,
-            f"❌ **Webhook Error**: Failed to start workflow\n\n"
-            f"Command: `{' '.join(cmd)}`\n"
-            f"Error: `{str(e)}`\n\n"
-            f"Please try triggering manually with:\n"
-            f"```bash\nuv run adws/{workflow_command}.py {issue_number}\n```",
-        )
-        raise
+    log.info("Launching ADW workflow: %s", " ".join(cmd))
+    _spawn_workflow(
+        cmd, final_adw_id, issue_number, logger, adw_make_issue_comment,
+        manual_cmd=f"uv run adws/{workflow_command}.py {issue_number}",
+    )
 
     return {
         "status": "accepted",
@@ -487,7 +892,7 @@ async def handle_adw_workflow(
     }
 
 
-async def handle_ipe_workflow(
+def handle_ipe_workflow(
     workflow_command: str,
     issue_number: str,
     ipe_id: Optional[str],
@@ -502,12 +907,16 @@ async def handle_ipe_workflow(
     ami_id: Optional[str] = None,
     build_new_ami: Optional[bool] = None,
 ):
-    """Handle IPE workflow routing."""
+    """Handle IPE workflow routing.
+
+    Blocking like handle_adw_workflow; run via route_workflow.
+    """
 
     # Special handling for destructive workflows
     if workflow_command == "ipe_destroy":
         if not destroy_confirmed:
-            ipe_make_issue_comment(
+            _post_comment(
+                ipe_make_issue_comment,
                 issue_number,
                 "## Safety Check Failed\n\n"
                 "Infrastructure destruction requires explicit confirmation.\n\n"
@@ -529,7 +938,8 @@ async def handle_ipe_workflow(
     # Special handling for deploy workflows
     if workflow_command == "ipe_deploy":
         if deploy_mode == "deploy-custom-ami" and not ami_id:
-            ipe_make_issue_comment(
+            _post_comment(
+                ipe_make_issue_comment,
                 issue_number,
                 "## Parameter Validation Failed\n\n"
                 "The `deploy-custom-ami` mode requires an AMI ID.\n\n"
@@ -547,7 +957,8 @@ async def handle_ipe_workflow(
 
     # Validate dependent workflows
     if workflow_command in IPE_DEPENDENT_WORKFLOWS and not ipe_id:
-        ipe_make_issue_comment(
+        _post_comment(
+            ipe_make_issue_comment,
             issue_number,
             f"❌ Error: `{workflow_command}` requires an existing IPE ID.\n\n"
             f"Example: `{workflow_command} ipe-12345678`",
@@ -583,7 +994,8 @@ async def handle_ipe_workflow(
     logger.info(f"Routing IPE workflow: {workflow_command} for issue #{issue_number}")
 
     # Post notification
-    ipe_make_issue_comment(
+    _post_comment(
+        ipe_make_issue_comment,
         issue_number,
         f"🤖 IPE Webhook: Starting `{workflow_command}`\n\n"
         f"ID: `{final_ipe_id}`\n"
@@ -594,7 +1006,7 @@ async def handle_ipe_workflow(
     # Build and launch command
     if workflow_command == "ipe_destroy":
         # Special command format for destroy
-        script_path = os.path.join(repo_root, "ipe", "ipe_destroy.py")
+        script_path = os.path.join(IPE_DIR, "ipe_destroy.py")
         cmd = [
             "uv", "run", script_path,
             issue_number,
@@ -604,7 +1016,7 @@ async def handle_ipe_workflow(
         ]
     elif workflow_command == "ipe_deploy":
         # Special command format for deploy
-        script_path = os.path.join(repo_root, "ipe", "ipe_deploy.py")
+        script_path = os.path.join(IPE_DIR, "ipe_deploy.py")
         # Convert build_new_ami to string for CLI
         build_new_ami_str = ""
         if build_new_ami is True:
@@ -622,44 +1034,14 @@ async def handle_ipe_workflow(
         ]
     else:
         # Standard IPE workflow command
-        script_path = os.path.join(repo_root, "ipe", f"{workflow_command}.py")
+        script_path = os.path.join(IPE_DIR, f"{workflow_command}.py")
         cmd = ["uv", "run", script_path, issue_number, final_ipe_id]
 
-    print(f"Launching IPE workflow: {' '.join(cmd)}")
-    print(f"Working directory: {repo_root}")
-
-    # Create log directory for subprocess output
-    log_dir = os.path.join(repo_root, "agents", final_ipe_id, "webhook_subprocess")
-    os.makedirs(log_dir, exist_ok=True)
-    stdout_log = os.path.join(log_dir, "stdout.log")
-    stderr_log = os.path.join(log_dir, "stderr.log")
-
-    try:
-        with open(stdout_log, "w") as stdout_f, open(stderr_log, "w") as stderr_f:
-            process = subprocess.Popen(
-                cmd,
-                cwd=repo_root,
-                env=get_safe_subprocess_env(),
-                start_new_session=True,
-                stdout=stdout_f,
-                stderr=stderr_f,
-            )
-            logger.info(f"Successfully launched subprocess PID {process.pid}")
-            print(f"Subprocess launched with PID: {process.pid}")
-            print(f"Logs: {stdout_log}, {stderr_log}")
-    except Exception as e:
-        error_msg = f"Failed to launch subprocess: {str(e)}"
-        logger.error(error_msg)
-        print(f"ERROR: {error_msg}")
-        ipe_make_issue_comment(
-            issue_number,
-            f"❌ **Webhook Error**: Failed to start workflow\n\n"
-            f"Command: `{' '.join(cmd)}`\n"
-            f"Error: `{str(e)}`\n\n"
-            f"Please try triggering manually with:\n"
-            f"```bash\nuv run ipe/{workflow_command}.py {issue_number}\n```",
-        )
-        raise
+    log.info("Launching IPE workflow: %s", " ".join(cmd))
+    _spawn_workflow(
+        cmd, final_ipe_id, issue_number, logger, ipe_make_issue_comment,
+        manual_cmd=f"uv run ipe/{workflow_command}.py {issue_number}",
+    )
 
     return {
         "status": "accepted",
@@ -685,14 +1067,20 @@ async def route_workflow(
     ami_id: Optional[str] = None,
     build_new_ami: Optional[bool] = None,
 ):
-    """Route workflow to appropriate system."""
+    """Route workflow to appropriate system.
+
+    The handlers do disk, GitHub and subprocess I/O, so they run in the
+    default thread pool instead of blocking the event loop.
+    """
 
     if workflow_type == "adw":
-        return await handle_adw_workflow(
+        return await asyncio.to_thread(
+            handle_adw_workflow,
             workflow_command, issue_number, workflow_id, model_set, trigger_reason,
         )
     elif workflow_type == "ipe":
-        return await handle_ipe_workflow(
+        return await asyncio.to_thread(
+            handle_ipe_workflow,
             workflow_command, issue_number, workflow_id, model_set, trigger_reason,
             environment=environment,
             delete_ami=delete_ami,
@@ -708,13 +1096,18 @@ async def github_webhook(request: Request):
     """Unified webhook handler for ADW and IPE."""
     try:
         event_type = request.headers.get("X-GitHub-Event", "")
-        payload = await request.json()
+        if event_type not in SUPPORTED_EVENTS:
+            log.info("Ignoring unsupported webhook event: %s", event_type)
+            return {"status": "ignored", "reason": f"Unsupported event: {event_type}"}
+
+        payload = loads_json(await request.body())
         action = payload.get("action", "")
         issue = payload.get("issue", {})
         issue_number = issue.get("number")
 
-        print(
-            f"Received webhook: event={event_type}, action={action}, issue_number={issue_number}"
+        log.info(
+            "Received webhook: event=%s, action=%s, issue_number=%s",
+            event_type, action, issue_number,
         )
 
         content_to_check = ""
@@ -727,20 +1120,20 @@ async def github_webhook(request: Request):
 
         # Check for bot messages or error messages to prevent loops
         if is_bot_or_error_message(content_to_check):
-            print("Ignoring bot/error message to prevent loop")
+            log.info("Ignoring bot/error message to prevent loop")
             return {"status": "ignored", "reason": "Bot or error message - preventing loop"}
 
         # Detect workflow type
         workflow_type, workflow_command = detect_workflow_type(content_to_check)
 
         if not workflow_type:
-            print("No ADW or IPE workflow detected")
+            log.info("No ADW or IPE workflow detected")
             return {
                 "status": "ignored",
                 "reason": "No ADW or IPE workflow detected",
             }
 
-        print(f"Detected {workflow_type.upper()} workflow: {workflow_command}")
+        log.info("Detected %s workflow: %s", workflow_type.upper(), workflow_command)
 
         # Check if this workflow recently failed for this issue
         if check_recent_failure(str(issue_number), workflow_command):
@@ -749,15 +1142,46 @@ async def github_webhook(request: Request):
                 "reason": f"Recently failed - cooldown period active"
             }
 
+        # GitHub only needs a 2xx; extraction and routing continue after
+        # the response is sent
+        task = asyncio.create_task(
+            _route_webhook(content_to_check, event_type, workflow_type, workflow_command, issue_number)
+        )
+        _BACKGROUND_TASKS.add(task)
+        task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+        return JSONResponse(
+            {"status": "accepted", "type": workflow_type, "workflow": workflow_command},
+            status_code=202,
+        )
+
+    except Exception as e:
+        log.exception("Error processing webhook: %s", e)
+        return {"status": "error", "message": str(e)}
+
+
+async def _route_webhook(
+    content: str,
+    event_type: str,
+    workflow_type: WorkflowType,
+    workflow_command: str,
+    issue_number,
+) -> None:
+    """Extract workflow details and route an accepted webhook.
+
+    Runs as a background task, so failures are logged rather than returned.
+    """
+    try:
         # Extract workflow details
         temp_id = make_adw_id() if workflow_type == "adw" else make_ipe_id()
-        workflow_info = extract_workflow_info(
-            content_to_check, workflow_type, temp_id
+        # May fall back to a classifier agent call, so keep it off the loop
+        workflow_info = await asyncio.to_thread(
+            extract_workflow_info, content, workflow_type, temp_id
         )
 
-        if not workflow_info["has_workflow"]:
-            print("Workflow extraction failed")
-            return {"status": "ignored", "reason": "Workflow extraction failed"}
+        if not workflow_info.has_workflow:
+            log.info("Workflow extraction failed")
+            return
 
         # Route to appropriate handler
         trigger_reason = (
@@ -766,32 +1190,37 @@ async def github_webhook(request: Request):
 
         result = await route_workflow(
             workflow_type,
-            workflow_info["workflow_command"],
+            workflow_info.workflow_command,
             str(issue_number),
-            workflow_info["workflow_id"],
-            workflow_info["model_set"],
+            workflow_info.workflow_id,
+            workflow_info.model_set,
             trigger_reason,
             # Pass destroy-specific params
-            environment=workflow_info.get("environment"),
-            delete_ami=workflow_info.get("delete_ami", False),
-            destroy_confirmed=workflow_info.get("destroy_confirmed", False),
+            environment=workflow_info.environment,
+            delete_ami=workflow_info.delete_ami,
+            destroy_confirmed=workflow_info.destroy_confirmed,
             # Pass deploy-specific params
-            deploy_mode=workflow_info.get("deploy_mode"),
-            ami_id=workflow_info.get("ami_id"),
-            build_new_ami=workflow_info.get("build_new_ami"),
+            deploy_mode=workflow_info.deploy_mode,
+            ami_id=workflow_info.ami_id,
+            build_new_ami=workflow_info.build_new_ami,
         )
 
-        return result or {"status": "error", "reason": "Routing failed"}
+        if result:
+            log.info("Routed %s workflow %s as %s", workflow_type.upper(), result["workflow"], result["id"])
+        else:
+            log.info("Routing %s for issue #%s stopped at validation", workflow_command, issue_number)
 
     except Exception as e:
-        print(f"Error processing webhook: {e}")
-        import traceback
-        traceback.print_exc()
-        return {"status": "error", "message": str(e)}
+        log.exception("Error routing webhook for issue #%s: %s", issue_number, e)
+
 
+@functools.lru_cache(maxsize=None)
+def check_adw_health():
+    """Check ADW subsystem health.
 
-async def check_adw_health():
-    """Check ADW subsystem health."""
+    Importability can't change while the router runs, so the first result
+    is cached for later health checks.
+    """
     try:
         # Check if ADW modules are importable
         from adw_modules.utils import make_adw_id
@@ -808,8 +1237,9 @@ async def check_adw_health():
         }
 
 
-async def check_ipe_health():
-    """Check IPE subsystem health."""
+@functools.lru_cache(maxsize=None)
+def check_ipe_health():
+    """Check IPE subsystem health (cached, like check_adw_health)."""
     try:
         # Check if IPE modules are importable
         from ipe_modules.ipe_utils import make_ipe_id
@@ -831,10 +1261,10 @@ async def health():
     """Unified health check for router and both subsystems."""
     try:
         # Check ADW health
-        adw_health = await check_adw_health()
+        adw_health = check_adw_health()
 
         # Check IPE health
-        ipe_health = await check_ipe_health()
+        ipe_health = check_ipe_health()
 
         # Router is healthy if both subsystems are operational
         overall_healthy = (
@@ -864,12 +1294,16 @@ async def health():
 
 
 if __name__ == "__main__":
-    print(f"Starting server on http://0.0.0.0:{PORT}")
-    print(f"Webhook endpoint: POST /gh-webhook")
-    print(f"Health check: GET /health")
-    print(f"")
-    print(f"Supported workflows:")
-    print(f"  ADW: {', '.join(AVAILABLE_ADW_WORKFLOWS_LOCAL)}")
-    print(f"  IPE: {', '.join(AVAILABLE_IPE_WORKFLOWS)}")
-
-    uvicorn.run(app, host="0.0.0.0", port=PORT)
+    _bootstrap()
+    log.info("Starting server on http://0.0.0.0:%d", PORT)
+    log.info("Webhook endpoint: POST /gh-webhook")
+    log.info("Health check: GET /health")
+    log.info("")
+    log.info("Supported workflows:")
+    log.info("  ADW: %s", ", ".join(AVAILABLE_ADW_WORKFLOWS_LOCAL))
+    log.info("  IPE: %s", ", ".join(AVAILABLE_IPE_WORKFLOWS))
+
+    # loop/http "auto" pick uvloop and httptools when installed (both are
+    # script dependencies) and fall back to asyncio/h11 otherwise. Requests
+    # are already logged by the router, so the access log is off.
+    uvicorn.run(app, host="0.0.0.0", port=PORT, loop="auto", http="auto", access_log=False)